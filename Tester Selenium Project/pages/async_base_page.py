@@ -0,0 +1,305 @@
+import asyncio
+import json
+import re
+from .base_page import BATCH_QUERY_SCRIPT, DEFAULT_TIMEOUT, PRESENCE_CHECK_TIMEOUT, locator_to_query
+from .cdp_connection import CDPError
+from .performance_metrics import PERFORMANCE_SCRIPT, add_devtools_metrics, round_metrics
+
+# Locator'ın gösterdiği elementleri bulan ortak JS fonksiyonu ({by: 'xpath' | 'css', value})
+FIND_ELEMENTS_FUNCTION = """
+function findAll(query) {
+    if (query.by === 'xpath') {
+        var snapshot = document.evaluate(query.value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var found = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) found.push(snapshot.snapshotItem(i));
+        return found;
+    }
+    return Array.prototype.slice.call(document.querySelectorAll(query.value));
+}
+function isVisible(element) {
+    var rect = element.getBoundingClientRect(), style = getComputedStyle(element);
+    return rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+}
+"""
+
+# present / visible / clickable / absent durumunu kontrol ediyor; sağlanmıyorsa null
+ELEMENT_STATE_SCRIPT = FIND_ELEMENTS_FUNCTION + """
+var query = arguments[0], state = arguments[1];
+var elements = findAll(query);
+if (state === 'absent') return elements.length ? null : {count: 0};
+if (state !== 'present') {
+    elements = elements.filter(function (element) {
+        return isVisible(element) && !(state === 'clickable' && element.disabled);
+    });
+}
+return elements.length ? {count: elements.length} : null;
+"""
+
+# İlk görünür elementi ortalayıp tıklama noktasını döndürüyorum. Nokta başka bir elementle (navbar gibi)
+# kapanıyorsa ya da js istenmişse JS click yapıp null dönüyorum.
+CLICK_POINT_SCRIPT = FIND_ELEMENTS_FUNCTION + """
+var element = findAll(arguments[0]).filter(isVisible)[0];
+if (!element) throw new Error('Element ' + arguments[0].value + ' not clickable');
+element.scrollIntoView({block: 'center', inline: 'center'});
+var rect = element.getBoundingClientRect();
+var x = rect.left + rect.width / 2, y = rect.top + rect.height / 2;
+var hit = document.elementFromPoint(x, y);
+if (arguments[1] || !hit || (hit !== element && !element.contains(hit))) {
+    element.click();
+    return null;
+}
+return {x: x, y: y};
+"""
+
+TITLE_CONTAINS_SCRIPT = "return document.title.indexOf(arguments[0]) !== -1 ? document.title : null;"
+
+ALL_PRESENT_SCRIPT = """
+var results = (function () {""" + BATCH_QUERY_SCRIPT + """}).apply(null, arguments);
+return Object.keys(results).every(function (name) { return results[name].present; }) ? results : null;
+"""
+
+# Verilen script (WebDriver execute_script formatında) doğru dönene kadar bekleyen promise.
+# Koşul sadece DOM değiştiğinde (MutationObserver) tekrar hesaplanıyor, Python tarafında polling yok.
+MUTATION_WAIT_SCRIPT = """
+var args = arguments[0], timeout = arguments[1];
+function condition() { return (function () {
+__CONDITION__
+}).apply(null, args); }
+return new Promise(function (resolve) {
+    function check() { try { return condition(); } catch (e) { return null; } }
+    var result = check();
+    if (result || timeout <= 0) return resolve(result || null);
+    var observer = new MutationObserver(function () { var value = check(); if (value) finish(value); });
+    var timer = setTimeout(function () { finish(check() || null); }, timeout);
+    function finish(value) { observer.disconnect(); clearTimeout(timer); resolve(value); }
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+});
+"""
+
+# quiet_ms boyunca hiç DOM değişikliği olmayınca true, süre dolarsa false
+DOM_QUIET_WAIT_SCRIPT = """
+var quiet = arguments[0], timeout = arguments[1];
+return new Promise(function (resolve) {
+    var quietTimer;
+    var observer = new MutationObserver(restart);
+    var limit = setTimeout(function () { finish(false); }, timeout);
+    function restart() { clearTimeout(quietTimer); quietTimer = setTimeout(function () { finish(true); }, quiet); }
+    function finish(value) { observer.disconnect(); clearTimeout(quietTimer); clearTimeout(limit); resolve(value); }
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    restart();
+});
+"""
+
+# Eleman sayısı en az minCount olup quiet_ms boyunca değişmeyince sayıyı, süre dolarsa null döndürüyor
+COUNT_STABLE_WAIT_SCRIPT = FIND_ELEMENTS_FUNCTION + """
+var query = arguments[0], quiet = arguments[1], minCount = arguments[2], timeout = arguments[3];
+return new Promise(function (resolve) {
+    var count = -1, quietTimer;
+    var observer = new MutationObserver(check);
+    var limit = setTimeout(function () { finish(null); }, timeout);
+    function check() {
+        var current = findAll(query).length;
+        if (current === count) return;
+        count = current;
+        clearTimeout(quietTimer);
+        if (count >= minCount) quietTimer = setTimeout(function () { finish(count); }, quiet);
+    }
+    function finish(value) { observer.disconnect(); clearTimeout(quietTimer); clearTimeout(limit); resolve(value); }
+    observer.observe(document, {childList: true, subtree: true});
+    check();
+});
+"""
+
+
+class AsyncBasePage:
+    # BasePage'in asyncio karşılığı. WebDriver HTTP çağrıları yerine tek DevTools WebSocket'i (CDPSession)
+    # kullanıyor; bağımsız beklemeler asyncio.gather ile aynı anda yürütülebiliyor. Metot adları BasePage ile aynı.
+
+    def __init__(self, session):
+        self.session = session
+        self._performance_domain_enabled = False
+
+    async def execute_script(self, script, *args, timeout=DEFAULT_TIMEOUT):
+        # WebDriver script'leriyle aynı format (arguments[...] ve return); promise dönerse sonucu bekleniyor
+        expression = f"(function () {{\n{script}\n}}).apply(null, {json.dumps(list(args))})"
+        response = await self.session.send("Runtime.evaluate", {
+            "expression": expression,
+            "returnByValue": True,
+            "awaitPromise": True,
+        }, timeout)
+        if "exceptionDetails" in response:
+            details = response["exceptionDetails"]
+            raise CDPError("Runtime.evaluate",
+                           {"message": details.get("exception", {}).get("description") or details.get("text", "")})
+        return response["result"].get("value")
+
+    async def _evaluate_until_settled(self, script, *args, timeout=DEFAULT_TIMEOUT):
+        # Bekleyen script'in dokümanı navigasyonla giderse yeni dokümanda kalan süreyle tekrar başlatıyorum
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            remaining = deadline - loop.time()
+            try:
+                return await self.execute_script(script, *args, int(remaining * 1000), timeout=remaining + 5)
+            except CDPError as e:
+                if not e.navigated or deadline - loop.time() <= 0:
+                    raise
+                await asyncio.sleep(0.05)
+
+    async def wait_for_script(self, script, *args, timeout=None, message=""):
+        # Script doğru bir değer döndürene kadar (DOM değişikliklerinde tekrar hesaplanarak) bekliyorum
+        timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+        result = await self._evaluate_until_settled(MUTATION_WAIT_SCRIPT.replace("__CONDITION__", script),
+                                                    list(args), timeout=timeout)
+        if not result:
+            raise asyncio.TimeoutError(message or "Condition was not met")
+        return result
+
+    def _query(self, locator):
+        return dict(zip(("by", "value"), locator_to_query(locator)))
+
+    async def wait_for_element_state(self, locator, state="present", timeout=None):
+        return await self.wait_for_script(ELEMENT_STATE_SCRIPT, self._query(locator), state, timeout=timeout,
+                                          message=f"Element {locator} not {state}")
+
+    async def find_element(self, locator, timeout=None):
+        # WebElement yok; elementin DOM'da olduğunu bekleyip eşleşme sayısını döndürüyorum
+        return (await self.wait_for_element_state(locator, "present", timeout))["count"]
+
+    async def click_element(self, locator, js_click=False, timeout=None):
+        await self.wait_for_element_state(locator, "clickable", timeout)
+        point = await self.execute_script(CLICK_POINT_SCRIPT, self._query(locator), js_click)
+        if point is None:
+            return
+        # Gerçek fare tıklaması (WebDriver click gibi)
+        for event_type in ("mouseMoved", "mousePressed", "mouseReleased"):
+            params = {"type": event_type, "x": point["x"], "y": point["y"]}
+            if event_type != "mouseMoved":
+                params.update(button="left", clickCount=1)
+            await self.session.send("Input.dispatchMouseEvent", params)
+
+    async def is_element_present(self, locator, timeout=DEFAULT_TIMEOUT):
+        # Pozitif kontrol olduğu için tam süre bekliyorum (senkron BasePage ile aynı)
+        try:
+            await self.wait_for_element_state(locator, "present", timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def is_element_absent(self, locator, timeout=PRESENCE_CHECK_TIMEOUT):
+        try:
+            await self.wait_for_element_state(locator, "absent", timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    async def current_url(self):
+        return await self.execute_script("return location.href;")
+
+    async def collect_performance_metrics(self):
+        metrics = await self.execute_script(PERFORMANCE_SCRIPT)
+        try:
+            if not self._performance_domain_enabled:
+                await self.session.send("Performance.enable")
+                self._performance_domain_enabled = True
+            add_devtools_metrics(metrics, (await self.session.send("Performance.getMetrics"))["metrics"])
+        except Exception as e:
+            print(f"Error reading DevTools performance metrics: {e}")
+        return round_metrics(metrics)
+
+    async def wait_for_page_title(self, title):
+        return await self.wait_for_script(TITLE_CONTAINS_SCRIPT, title, message=f"Title did not contain '{title}'")
+
+    async def wait_for_dom_stable(self, quiet_ms=500, timeout=None):
+        timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+        if not await self._evaluate_until_settled(DOM_QUIET_WAIT_SCRIPT, quiet_ms, timeout=timeout):
+            raise asyncio.TimeoutError(f"DOM did not settle for {quiet_ms}ms")
+        return True
+
+    async def wait_for_network_idle(self, quiet_ms=500, timeout=None):
+        # Network.* event'lerinden takip ediliyor (CDPSession)
+        return await self.session.wait_for_network_idle(quiet_ms, DEFAULT_TIMEOUT if timeout is None else timeout)
+
+    async def opened_windows(self):
+        # Bu tab'ın açtığı tab'ların target id'leri
+        targets = (await self.session.connection.send("Target.getTargets"))["targetInfos"]
+        return [target["targetId"] for target in targets
+                if target.get("type") == "page" and target.get("openerId") == self.session.target_id]
+
+    async def wait_for_opened_window(self, known_handles=(), timeout=None):
+        # Target.targetCreated event'ini bekliyorum; abonelik mevcut listeyi okumadan önce kuruluyor
+        def opened(params):
+            info = params["targetInfo"]
+            return info.get("openerId") == self.session.target_id and info["targetId"] not in known_handles
+        created = self.session.connection.expect_event("Target.targetCreated", predicate=opened)
+        try:
+            existing = [target_id for target_id in await self.opened_windows() if target_id not in known_handles]
+            if existing:
+                return existing[0]
+            return (await asyncio.wait_for(created, DEFAULT_TIMEOUT if timeout is None else timeout))[
+                "targetInfo"]["targetId"]
+        finally:
+            created.cancel()
+
+    async def wait_for_target_url_matches(self, target_id, pattern, timeout=None):
+        # Başka bir tab'ın URL'sini ona bağlanmadan, Target.targetInfoChanged event'lerinden izliyorum
+        def matches(params):
+            info = params["targetInfo"]
+            return info["targetId"] == target_id and re.search(pattern, info.get("url", ""))
+        changed = self.session.connection.expect_event("Target.targetInfoChanged", predicate=matches)
+        try:
+            info = (await self.session.connection.send("Target.getTargetInfo", {"targetId": target_id}))["targetInfo"]
+            if re.search(pattern, info.get("url", "")):
+                return info["url"]
+            return (await asyncio.wait_for(changed, DEFAULT_TIMEOUT if timeout is None else timeout))[
+                "targetInfo"]["url"]
+        finally:
+            changed.cancel()
+
+    async def wait_for_url_matches(self, pattern, timeout=None):
+        # Her navigasyon event'inde (tam sayfa ya da history API) URL'yi tekrar kontrol ediyorum
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (DEFAULT_TIMEOUT if timeout is None else timeout)
+        while True:
+            navigated = self.session.expect_event("Page.frameNavigated", "Page.navigatedWithinDocument")
+            try:
+                try:
+                    url = await self.current_url()
+                except CDPError as e:
+                    if not e.navigated:
+                        raise
+                    url = ""
+                if re.search(pattern, url):
+                    return True
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    raise asyncio.TimeoutError(f"URL did not match '{pattern}'")
+                try:
+                    await asyncio.wait_for(navigated, remaining)
+                except asyncio.TimeoutError:
+                    raise asyncio.TimeoutError(f"URL did not match '{pattern}'") from None
+            finally:
+                navigated.cancel()
+
+    async def wait_for_element_count_stable(self, locator, quiet_ms=500, min_count=1, timeout=None):
+        timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+        count = await self._evaluate_until_settled(COUNT_STABLE_WAIT_SCRIPT, self._query(locator), quiet_ms,
+                                                   min_count, timeout=timeout)
+        if count is None:
+            raise asyncio.TimeoutError(f"Element count for {locator} did not stabilize")
+        return count
+
+    def _batch_queries(self, locators, texts=False, attributes=()):
+        return [dict(self._query(locator), name=name, texts=texts, attributes=list(attributes), elements=False)
+                for name, locator in locators.items()]
+
+    async def query_elements(self, locators, texts=False, attributes=()):
+        return await self.execute_script(BATCH_QUERY_SCRIPT, self._batch_queries(locators, texts, attributes))
+
+    async def wait_for_elements_present(self, locators, timeout=None, **query_options):
+        # Hepsi bulunana kadar bekliyorum, süre dolarsa son durumu döndürüyorum
+        queries = self._batch_queries(locators, **query_options)
+        try:
+            return await self.wait_for_script(ALL_PRESENT_SCRIPT, queries, timeout=timeout)
+        except asyncio.TimeoutError:
+            return await self.execute_script(BATCH_QUERY_SCRIPT, queries)
@@ -0,0 +1,265 @@
+import asyncio
+from urllib.parse import urljoin
+from .async_base_page import AsyncBasePage
+from .careers_page import JOB_CARDS_SCRIPT, LOAD_MORE_JOBS_SCRIPT, CareersPageLocators
+from .dropdown import AsyncDropdown
+from .job_table import JobRecord, JobTable
+
+# Ekleme/scroll'da kart sayısı artınca, sayfalamada ilk kart değişince doğru dönüyor
+# (wait_for_script içinde DOM değiştikçe tekrar hesaplanıyor)
+MORE_JOBS_LOADED_SCRIPT = """
+var cards = document.querySelectorAll(arguments[0]), mode = arguments[1], offset = arguments[2], first = arguments[3];
+if (mode === 'page') {
+    return cards.length > 0 && cards[0].textContent.replace(/\\s+/g, ' ').trim() !== first;
+}
+return cards.length > offset;
+"""
+
+# Her XPath için eşleşme sayısı ve görünür eşleşme olup olmadığı
+XPATH_VISIBILITY_SCRIPT = """
+return arguments[0].map(function (xpath) {
+    var snapshot = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var visible = false;
+    for (var i = 0; i < snapshot.snapshotLength; i++) {
+        if (snapshot.snapshotItem(i).offsetParent !== null) visible = true;
+    }
+    return {count: snapshot.snapshotLength, visible: visible};
+});
+"""
+
+class AsyncCareersPage(CareersPageLocators, AsyncBasePage):
+
+    def __init__(self, session):
+
+        # Locator'lar senkron CareersPage ile ortak (CareersPageLocators)
+        super().__init__(session)
+
+        self.location_dropdown = AsyncDropdown(self, self.location_filter)
+        self.department_dropdown = AsyncDropdown(self, self.department_filter)
+
+    async def click_see_all_qa_jobs(self):
+        try:
+            await self.click_element(self.see_all_qa_jobs_button)
+            return True
+        except Exception as e:
+            print(f"Error clicking See all QA jobs: {e}")
+            return False
+
+    async def verify_careers_page_blocks(self):
+        try:
+            blocks = await self.wait_for_elements_present({
+                "locations": self.locations_block,
+                "teams": self.teams_block,
+                "life_at_insider": self.life_at_insider_block,
+            })
+            missing = [name for name, result in blocks.items() if not result["present"]]
+            for name in missing:
+                print(f"{name} block not found")
+            return not missing
+        except Exception as e:
+            print(f"Error verifying careers page blocks: {e}")
+            return False
+
+    async def wait_for_jobs_to_load(self, timeout=15):
+        try:
+            await self.wait_for_element_state(self.job_position_elements, "present", timeout)
+            # Ağın boşalmasını ve kart sayısının oturmasını aynı anda bekliyorum
+            await asyncio.gather(
+                self.wait_for_network_idle(quiet_ms=300, timeout=timeout),
+                self.wait_for_element_count_stable(self.job_position_elements, quiet_ms=300, timeout=timeout),
+            )
+            print("Jobs data loaded successfully")
+            return True
+        except Exception as e:
+            print(f"Error waiting for jobs to load: {e}")
+            return False
+
+    async def wait_for_job_list_update(self, timeout=15):
+        try:
+            await asyncio.gather(
+                self.wait_for_network_idle(quiet_ms=300, timeout=timeout),
+                self.wait_for_dom_stable(quiet_ms=300, timeout=timeout),
+            )
+            return True
+        except Exception as e:
+            print(f"Error waiting for job list update: {e}")
+            return False
+
+    async def _apply_filter(self, dropdown, value, name):
+        if not await self.wait_for_jobs_to_load():
+            print(f"Jobs did not load, cannot filter by {name}")
+            return False
+
+        if not await dropdown.exists():
+            print(f"{name.capitalize()} filter dropdown not found")
+            return False
+
+        selected = await dropdown.select(value)
+        available_options = await dropdown.options()
+        print(f"Available {name} options ({'Select2' if dropdown.is_select2 else 'native select'}): {available_options}")
+
+        if selected is None:
+            print(f"{name.capitalize()} '{value}' not available in dropdown")
+            return available_options
+
+        print(f"Successfully selected {name}: {selected}")
+        await self.wait_for_job_list_update()
+        return available_options
+
+    async def filter_by_location(self, location="Istanbul, Turkiye"):
+        try:
+            return await self._apply_filter(self.location_dropdown, location, "location")
+        except Exception as e:
+            print(f"Error filtering by location: {e}")
+            return False
+
+    async def filter_by_department(self, department="Quality Assurance"):
+        try:
+            return await self._apply_filter(self.department_dropdown, department, "department")
+        except Exception as e:
+            print(f"Error filtering by department: {e}")
+            return False
+
+    async def verify_job_list_present(self):
+        try:
+            # İlan elementleri ve "sonuç yok" mesajı tek çağrıda
+            jobs, no_results = await self.execute_script(XPATH_VISIBILITY_SCRIPT, [
+                self.job_list_elements[1], self.no_results_elements[1]])
+            if jobs["count"] > 0:
+                print("Job list is present on the page")
+                return True
+            elif no_results["visible"]:
+                print("No job positions available (but page is working)")
+                return True
+            else:
+                print("Job list not found")
+                return False
+        except Exception as e:
+            print(f"Error verifying job list: {e}")
+            return False
+
+    async def _read_job_batch(self, offset, limit):
+        return await self.execute_script(JOB_CARDS_SCRIPT, self.job_card_selector,
+                                         list(self.job_card_fields), offset, limit)
+
+    async def iter_jobs(self, batch_size=500, max_loads=100, load_timeout=5, scroll_timeout=1, paginate=True,
+                        scroll=False):
+        # CareersPage.iter_jobs'un async generator hali
+        offset = 0
+        loads = 0
+        while True:
+            batch = await self._read_job_batch(offset, batch_size)
+            for row in batch["rows"]:
+                yield JobRecord(*row)
+            offset += len(batch["rows"])
+            if offset < batch["total"]:
+                continue
+            if loads >= max_loads:
+                return
+            mode = await self.execute_script(LOAD_MORE_JOBS_SCRIPT, self.load_more_jobs_selector,
+                                             self.next_jobs_page_selector if paginate else None, scroll)
+            if mode is None:
+                return
+            loads += 1
+            timeout = scroll_timeout if mode == "scroll" else load_timeout
+            try:
+                await self.wait_for_script(MORE_JOBS_LOADED_SCRIPT, self.job_card_selector, mode, offset,
+                                           batch["first"], timeout=timeout)
+            except asyncio.TimeoutError:
+                return
+            if mode == "page":
+                offset = 0
+
+    async def extract_jobs(self, batch_size=500, max_loads=100, paginate=True):
+        return JobTable.from_records([job async for job in self.iter_jobs(batch_size, max_loads, paginate=paginate)])
+
+    async def verify_job_cards(self, location="Istanbul, Turkiye", department="Quality Assurance"):
+        try:
+            jobs = await self.extract_jobs(paginate=False)
+            print(f"Extracted {len(jobs)} job cards")
+            if not len(jobs):
+                print("No job cards found")
+                return False
+
+            locations_ok = jobs.all_locations_contain(location)
+            departments_ok = jobs.all_departments_equal(department)
+            if not locations_ok:
+                for index in jobs.mismatches("location", lambda value: location.lower() in value.lower()):
+                    print(f"Unexpected location: {jobs.row(index)}")
+            if not departments_ok:
+                for index in jobs.mismatches("department",
+                                             lambda value: value.strip().lower() == department.strip().lower()):
+                    print(f"Unexpected department: {jobs.row(index)}")
+            return locations_ok and departments_ok
+        except Exception as e:
+            print(f"Error verifying job cards: {e}")
+            return False
+
+    async def verify_filtered_jobs_contain_expected_values(self, location_options, department_options):
+        try:
+            expected_location = "Istanbul, Turkiye"
+            location_found = expected_location in location_options
+            print(f"Location '{expected_location}' found in options: {location_found}")
+
+            expected_department = "Quality Assurance"
+            department_found = expected_department in department_options
+            print(f"Department '{expected_department}' found in options: {department_found}")
+
+            await self.wait_for_job_list_update()
+            cards_match = await self.verify_job_cards(expected_location, expected_department)
+            print(f"All job cards match '{expected_location}' / '{expected_department}': {cards_match}")
+
+            if location_found and department_found and cards_match:
+                print("All expected filter values are present")
+                return True
+            else:
+                print("Some expected filter values are missing")
+                return False
+
+        except Exception as e:
+            print(f"Error verifying filtered jobs: {e}")
+            return False
+
+    async def get_view_role_links(self):
+        buttons = (await self.query_elements({"buttons": self.view_role_buttons}, attributes=("href",)))["buttons"]
+        base_url = await self.current_url()
+        return [urljoin(base_url, values["href"]) for values in buttons.get("attributes", []) if values["href"]]
+
+    async def click_view_role_button(self):
+        try:
+            # Yeni tab'ı ayırt edebilmek için tıklamadan önce bu tab'ın açtığı target'ları saklıyorum
+            self.windows_before_click = await self.opened_windows()
+            # Navbar overlap nedeniyle JavaScript click
+            await self.click_element(self.view_role_buttons, js_click=True)
+            print("Successfully clicked View Role button")
+            return True
+
+        except Exception as e:
+            print(f"Error clicking View Role button: {e}")
+            return False
+
+    async def verify_redirect_to_lever(self):
+        try:
+            # Yeni tab (Target.targetCreated) ya da mevcut sayfanın lever'a gitmesi, hangisi önce olursa
+            known_windows = getattr(self, "windows_before_click", [])
+            opened = asyncio.ensure_future(self.wait_for_opened_window(known_windows, timeout=15))
+            redirected = asyncio.ensure_future(self.wait_for_url_matches("(?i)lever", timeout=15))
+            pending = {opened, redirected}
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                if any(task.exception() is None for task in done):
+                    break
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+            if opened in done and opened.exception() is None:
+                # Yeni tab'a bağlanmadan URL'sini target event'lerinden takip ediyorum
+                url = await self.wait_for_target_url_matches(opened.result(), "(?i)lever", timeout=15)
+            else:
+                url = await self.current_url()
+            return "lever" in url.lower()
+
+        except Exception as e:
+            print(f"Error verifying Lever redirect: {e}")
+            return False
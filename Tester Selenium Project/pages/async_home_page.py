@@ -0,0 +1,31 @@
+from .async_base_page import AsyncBasePage
+from .home_page import HomePageLocators
+
+class AsyncHomePage(HomePageLocators, AsyncBasePage):
+    # Locator'lar senkron HomePage ile ortak (HomePageLocators)
+
+    async def click_company_menu(self):
+        try:
+            await self.click_element(self.company_menu)
+            return True
+        except Exception as e:
+            print(f"Error clicking Company menu: {e}")
+            return False
+
+    async def click_careers_link(self):
+        try:
+            await self.click_element(self.careers_link)
+            return True
+        except Exception as e:
+            print(f"Error clicking Careers link: {e}")
+            return False
+
+    async def is_homepage_loaded(self):
+        try:
+            return await self.is_element_present(self.company_menu)
+        except Exception as e:
+            print(f"Error checking homepage load: {e}")
+            return False
+
+    async def get_page_title(self):
+        return await self.execute_script("return document.title;")
@@ -2,31 +2,365 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import TimeoutException
+from .timeout_budget import BUDGET_WRAPPER_CODE, TimeoutBudgetExceeded, current_budget, propagate_budget_overrun
+from .element_cache import READ_ONLY_SCRIPTS, get_element_cache
+from .performance_metrics import collect_performance_metrics
+import sys
+import time
+
+# Varsayılan bekleme süresi ve sorgulama aralığı
+DEFAULT_TIMEOUT = 10
+POLL_FREQUENCY = 0.1
+
+# Yokluk kontrolleri için ayrı, kısa süre ve aralık (beklenen negatif sonuç tam timeout'u yemesin)
+PRESENCE_CHECK_TIMEOUT = 3
+PRESENCE_POLL_FREQUENCY = 0.05
+
+# Sayfaya MutationObserver kuruyorum, son DOM değişikliğinden beri geçen süreyi (ms) döndürüyor
+DOM_QUIET_SCRIPT = """
+var state = window.__pomMutations;
+if (!state) {
+    state = window.__pomMutations = {last: Date.now()};
+    new MutationObserver(function () { state.last = Date.now(); })
+        .observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+}
+return Date.now() - state.last;
+"""
+
+# fetch ve XMLHttpRequest'i sarıp devam eden istek sayısını tutuyorum
+NETWORK_STATE_SCRIPT = """
+var state = window.__pomNetwork;
+if (!state) {
+    state = window.__pomNetwork = {pending: 0, last: Date.now(), resources: 0};
+    var done = function () { state.pending = Math.max(0, state.pending - 1); state.last = Date.now(); };
+    if (window.fetch) {
+        var originalFetch = window.fetch;
+        window.fetch = function () {
+            state.pending++;
+            state.last = Date.now();
+            return originalFetch.apply(this, arguments).finally(done);
+        };
+    }
+    var originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        state.pending++;
+        state.last = Date.now();
+        this.addEventListener('loadend', done);
+        return originalSend.apply(this, arguments);
+    };
+}
+var resources = performance.getEntriesByType('resource').length;
+if (resources !== state.resources) {
+    state.resources = resources;
+    state.last = Date.now();
+}
+return {pending: state.pending, idle: Date.now() - state.last};
+"""
+
+# Verilen locator'ların hepsini tek execute_script çağrısında çözüyorum
+BATCH_QUERY_SCRIPT = """
+var queries = arguments[0];
+var results = {};
+queries.forEach(function (query) {
+    var elements = [];
+    if (query.by === 'xpath') {
+        var snapshot = document.evaluate(query.value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        for (var i = 0; i < snapshot.snapshotLength; i++) {
+            elements.push(snapshot.snapshotItem(i));
+        }
+    } else {
+        elements = Array.prototype.slice.call(document.querySelectorAll(query.value));
+    }
+    var result = {present: elements.length > 0, count: elements.length};
+    if (query.texts) {
+        result.texts = elements.map(function (el) { return (el.innerText || el.textContent || '').trim(); });
+    }
+    if (query.attributes.length) {
+        result.attributes = elements.map(function (el) {
+            var values = {};
+            query.attributes.forEach(function (name) { values[name] = el.getAttribute(name); });
+            return values;
+        });
+    }
+    if (query.elements) {
+        result.elements = elements;
+    }
+    results[query.name] = result;
+});
+return results;
+"""
+
+
+def _css_string(value):
+    # CSS attribute seçicisi için tırnaklı string
+    return '"' + value.replace("\\", "\\\\").replace('"', '\\"') + '"'
+
+
+def _xpath_string(value):
+    # XPath'te kaçış karakteri yok; iki tırnak tipi de varsa concat() ile birleştiriyorum
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+def locator_to_query(locator):
+    # Selenium'un tüm By tiplerini tarayıcı tarafında çözebileceğim xpath veya css'e çeviriyorum
+    by, value = locator
+    if by == By.XPATH:
+        return "xpath", value
+    if by == By.CSS_SELECTOR:
+        return "css", value
+    if by == By.ID:
+        return "css", f"[id={_css_string(value)}]"
+    if by == By.NAME:
+        return "css", f"[name={_css_string(value)}]"
+    if by == By.CLASS_NAME:
+        return "css", f"[class~={_css_string(value)}]"
+    if by == By.TAG_NAME:
+        return "css", value
+    # Link text'leri WebDriver gibi görünen metne göre (boşluklar sadeleştirilmiş) eşliyorum
+    if by == By.LINK_TEXT:
+        return "xpath", f"//a[normalize-space(.)={_xpath_string(' '.join(value.split()))}]"
+    if by == By.PARTIAL_LINK_TEXT:
+        return "xpath", f"//a[contains(normalize-space(.), {_xpath_string(' '.join(value.split()))})]"
+    raise ValueError(f"Locator type '{by}' is not supported in batched queries")
+
+
+# Beklemeleri izleyenler (tests/tracing.py): listener(page, message, started, duration, caller_frame)
+_wait_listeners = []
+
+
+def add_wait_listener(listener):
+    if listener not in _wait_listeners:
+        _wait_listeners.append(listener)
+
+
+def remove_wait_listener(listener):
+    if listener in _wait_listeners:
+        _wait_listeners.remove(listener)
+
+
+# Bu script'ler sadece okuyor, element cache'ini kirletmiyor
+READ_ONLY_SCRIPTS.update({DOM_QUIET_SCRIPT, NETWORK_STATE_SCRIPT, BATCH_QUERY_SCRIPT})
+
 
 class BasePage:
 
+    # Cache'lenmeyecek locator attribute'larının adları (filtreyle sürekli değişen listeler gibi)
+    uncached_locators = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        # Sayfa metotlarındaki geniş except'ler bütçe aşımını yutmasın (pages/timeout_budget.py)
+        super().__init_subclass__(**kwargs)
+        for name, member in list(vars(cls).items()):
+            if not name.startswith("__"):
+                setattr(cls, name, propagate_budget_overrun(member))
+    
     def __init__(self, driver):
         self.driver = driver
         # Wait up to 10 seconds for elements to appear
-        self.wait = WebDriverWait(driver, 10)
+        # Koşul sağlanır sağlanmaz dönmesi için sık kontrol ediyorum
+        self.wait = WebDriverWait(driver, DEFAULT_TIMEOUT, poll_frequency=POLL_FREQUENCY)
+        # Driver başına element cache'i (navigasyonda ve stale referansta kendini temizliyor)
+        self.element_cache = get_element_cache(driver)
     
     def find_element(self, locator):
-        return self.wait.until(EC.presence_of_element_located(locator))
+        cacheable = self._is_cacheable(locator)
+        if cacheable:
+            element = self.element_cache.get(locator)
+            if element is not None:
+                return element
+        element = self._find_uncached(locator)
+        return self.element_cache.put(locator, element, self._find_uncached) if cacheable else element
+    
+    def find_elements(self, locator):
+        # Beklemeden bulunan tüm elementler; boş liste cache'lenmiyor
+        cacheable = self._is_cacheable(locator)
+        if cacheable:
+            elements = self.element_cache.get(("all", locator))
+            if elements is not None:
+                return elements
+        elements = self.driver.find_elements(*locator)
+        if cacheable and elements:
+            return self.element_cache.put_all(locator, elements, lambda loc: self.driver.find_elements(*loc))
+        return elements
     
     def find_clickable_element(self, locator):
-        return self.wait.until(EC.element_to_be_clickable(locator))
+        # Element cache'ten geliyorsa sadece tıklanabilirliği bekliyorum, DOM'da tekrar arama yapılmıyor
+        element = self.find_element(locator)
+        return self._wait_until(EC.element_to_be_clickable(element), message=f"Element {locator} not clickable")
+    
+    def _find_uncached(self, locator):
+        return self._wait_until(EC.presence_of_element_located(locator), message=f"Element {locator} not found")
+    
+    def _is_cacheable(self, locator):
+        return not any(getattr(self, name, None) == locator for name in self.uncached_locators)
     
     def click_element(self, locator):
         element = self.find_clickable_element(locator)
         element.click()
     
-    def is_element_present(self, locator):
+    def is_element_present(self, locator, timeout=DEFAULT_TIMEOUT):
+        # Pozitif kontrol olduğu için tam süre bekliyorum (yavaş gelen sayfa False sayılmasın).
+        # JS ile sorguluyorum ki implicit wait hiç devreye girmesin
+        try:
+            self._wait_until(lambda driver: self.query_elements({"element": locator})["element"]["present"],
+                             timeout, f"Element {locator} not present", poll_frequency=PRESENCE_POLL_FREQUENCY)
+            return True
+        except TimeoutBudgetExceeded:
+            raise
+        except TimeoutException:
+            return False
+    
+    def is_element_absent(self, locator, timeout=PRESENCE_CHECK_TIMEOUT):
         try:
-            self.find_element(locator)
+            self._wait_until(lambda driver: not self.query_elements({"element": locator})["element"]["present"],
+                             timeout, f"Element {locator} still present", poll_frequency=PRESENCE_POLL_FREQUENCY)
             return True
+        except TimeoutBudgetExceeded:
+            raise
         except TimeoutException:
             return False
     
+    def collect_performance_metrics(self):
+        # Sayfa yüklendikten sonra çağrılıyor: Navigation Timing, paint, LCP/CLS, transfer boyutları, istek sayısı
+        # ve DevTools metrikleri (bütçe kontrolü tests/performance_budget.py'de)
+        return collect_performance_metrics(self.driver)
+    
     def wait_for_page_title(self, title):
-        self.wait.until(EC.title_contains(title))
-    
\ No newline at end of file
+        self._wait_until(EC.title_contains(title), message=f"Title did not contain '{title}'")
+    
+    # Sabit time.sleep yerine kullandığım bekleme koşulları.
+    # Hepsi koşul sağlandığı anda dönüyor, sağlanmazsa TimeoutException atıyor.
+    
+    def _wait_until(self, condition, timeout=None, message="", poll_frequency=POLL_FREQUENCY):
+        # Tüm beklemeler buradan geçiyor; aktif bir test bütçesi varsa süreyi ondan düşüyorum
+        started = time.perf_counter()
+        try:
+            requested = DEFAULT_TIMEOUT if timeout is None else timeout
+            budget = current_budget()
+            if budget is None:
+                return WebDriverWait(self.driver, requested, poll_frequency=poll_frequency).until(condition, message)
+
+            label = self._wait_label()
+            allowed = budget.timeout_for(requested, label)
+            try:
+                result = WebDriverWait(self.driver, allowed, poll_frequency=poll_frequency).until(condition, message)
+            except TimeoutException:
+                budget.record(label, time.perf_counter() - started)
+                # Bütçe yüzünden kısaltılmış bir bekleme dolduysa hangi beklemenin süreyi yediğini raporluyorum
+                if allowed < requested:
+                    raise TimeoutBudgetExceeded(budget, label)
+                raise
+            budget.record(label, time.perf_counter() - started)
+            return result
+        finally:
+            for listener in list(_wait_listeners):
+                listener(self, message, started, time.perf_counter() - started, sys._getframe(1))
+    
+    def _wait_label(self):
+        # "CareersPage.filter_by_location > find_element" gibi, beklemeyi çağıran page object metodunu buluyorum
+        frame = sys._getframe(2)
+        wait_name = frame.f_code.co_name
+        outer_name = wait_name
+        while frame is not None and frame.f_locals.get("self") is self:
+            if frame.f_code is not BUDGET_WRAPPER_CODE:
+                outer_name = frame.f_code.co_name
+            frame = frame.f_back
+        if outer_name == wait_name:
+            return f"{type(self).__name__}.{wait_name}"
+        return f"{type(self).__name__}.{outer_name} > {wait_name}"
+    
+    def wait_for_dom_stable(self, quiet_ms=500, timeout=None):
+        # quiet_ms boyunca hiç DOM değişikliği olmayınca dönüyor
+        return self._wait_until(
+            lambda driver: driver.execute_script(DOM_QUIET_SCRIPT) >= quiet_ms,
+            timeout, f"DOM did not settle for {quiet_ms}ms")
+    
+    def wait_for_network_idle(self, quiet_ms=500, timeout=None):
+        # Bekleyen fetch/XHR kalmayınca ve quiet_ms boyunca yeni istek başlamayınca dönüyor
+        def network_idle(driver):
+            state = driver.execute_script(NETWORK_STATE_SCRIPT)
+            return state["pending"] == 0 and state["idle"] >= quiet_ms
+        return self._wait_until(network_idle, timeout, f"Network did not go idle for {quiet_ms}ms")
+    
+    def wait_for_new_window(self, known_handles, timeout=None):
+        # Yeni açılan window'un handle'ını döndürüyor
+        def new_window(driver):
+            new_handles = [handle for handle in driver.window_handles if handle not in known_handles]
+            return new_handles[0] if new_handles else False
+        return self._wait_until(new_window, timeout, "No new window was opened")
+    
+    def opened_windows(self):
+        # Mevcut pencerenin açtığı pencereler. Opener bilgisini CDP'den alıyorum; aynı Chrome'daki
+        # başka tab'ların (TabPool) açtığı pencereler karışmıyor. CDP yoksa mevcut pencere dışındakiler dönüyor.
+        handles = self.driver.window_handles
+        current = self.driver.current_window_handle
+        try:
+            targets = self.driver.execute_cdp_cmd("Target.getTargets", {})["targetInfos"]
+        except Exception:
+            return [handle for handle in handles if handle != current]
+        opener_ids = {target["targetId"].upper() for target in targets
+                      if target.get("type") == "page" and current.upper().endswith(target.get("openerId", "#").upper())}
+        return [handle for handle in handles
+                if any(handle.upper().endswith(target_id) for target_id in opener_ids)]
+    
+    def wait_for_opened_window(self, known_handles=(), timeout=None):
+        # Mevcut pencerenin açtığı, known_handles'ta olmayan ilk pencerenin handle'ını döndürüyor
+        def opened_window(driver):
+            new_handles = [handle for handle in self.opened_windows() if handle not in known_handles]
+            return new_handles[0] if new_handles else False
+        return self._wait_until(opened_window, timeout, "No window was opened from the current window")
+    
+    def wait_for_url_matches(self, pattern, timeout=None):
+        return self._wait_until(EC.url_matches(pattern), timeout, f"URL did not match '{pattern}'")
+    
+    def wait_for_element_count_stable(self, locator, quiet_ms=500, min_count=1, timeout=None):
+        # Eleman sayısı en az min_count olup quiet_ms boyunca değişmeyince sayıyı döndürüyor
+        state = {"count": None, "since": time.monotonic()}
+
+        def count_stable(driver):
+            count = len(driver.find_elements(*locator))
+            now = time.monotonic()
+            if count != state["count"]:
+                state["count"] = count
+                state["since"] = now
+                return False
+            if count >= min_count and (now - state["since"]) * 1000 >= quiet_ms:
+                return count
+            return False
+        return self._wait_until(count_stable, timeout, f"Element count for {locator} did not stabilize")
+    
+    # Tek round trip'te toplu DOM sorgusu.
+    # locators: {"isim": (By.X, "değer")}, her isim için present/count (+ texts/attributes/elements) döner.
+    
+    def query_elements(self, locators, texts=False, attributes=(), elements=False):
+        queries = []
+        for name, locator in locators.items():
+            by, value = locator_to_query(locator)
+            queries.append({
+                "name": name,
+                "by": by,
+                "value": value,
+                "texts": texts,
+                "attributes": list(attributes),
+                "elements": elements,
+            })
+        return self.driver.execute_script(BATCH_QUERY_SCRIPT, queries)
+    
+    def wait_for_elements_present(self, locators, timeout=None, **query_options):
+        # Hepsi bulunana kadar toplu sorguyu tekrarlıyorum, süre dolarsa son sonucu döndürüyorum
+        last_result = {}
+
+        def all_present(driver):
+            last_result.update(self.query_elements(locators, **query_options))
+            return all(result["present"] for result in last_result.values())
+        try:
+            self._wait_until(all_present, timeout)
+        except TimeoutBudgetExceeded:
+            raise
+        except TimeoutException:
+            pass
+        return last_result
@@ -1,15 +1,58 @@
+from urllib.parse import urljoin
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import Select
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.support import expected_conditions as EC
 from .base_page import BasePage
-import time
+from .dropdown import Dropdown
+from .element_cache import READ_ONLY_SCRIPTS
+from .job_table import JobRecord, JobTable
 
-class CareersPage(BasePage):
+# İlan kartlarını tek script çağrısında okuyorum; binlerce ilanda kart başına round trip olmasın.
+# textContent kullanıyorum, innerText her kartta layout hesaplatıyor.
+JOB_CARDS_SCRIPT = """
+var cardSelector = arguments[0], fields = arguments[1], offset = arguments[2], limit = arguments[3];
+var cards = document.querySelectorAll(cardSelector);
+var end = Math.min(cards.length, offset + limit), rows = [];
+// Son alan başvuru linki; sadece onun href'i okunuyor, diğerleri (link olsalar da) metin
+function read(card, field, isLink) {
+    var node = card.querySelector(field);
+    if (!node) return null;
+    if (isLink) return node.href || null;
+    return node.textContent.replace(/\\s+/g, ' ').trim();
+}
+for (var i = offset; i < end; i++) {
+    rows.push(fields.map(function (field, index) { return read(cards[i], field, index === fields.length - 1); }));
+}
+var first = cards.length ? cards[0].textContent.replace(/\\s+/g, ' ').trim() : null;
+return {total: cards.length, rows: rows, first: first};
+"""
 
-    def __init__(self, driver):
+# Liste bittiğinde sıradaki ilanları yüklüyorum: "load more" butonu, sayfalama ya da (istenirse) lazy-load için scroll.
+# Hiçbiri yoksa null dönüyor, liste bitmiş sayılıyor (boşuna bekleme yok).
+LOAD_MORE_JOBS_SCRIPT = """
+function usable(node) {
+    return node && node.offsetParent !== null && !node.disabled && !node.classList.contains('disabled');
+}
+var more = document.querySelector(arguments[0]);
+if (usable(more)) { more.click(); return 'append'; }
+var next = arguments[1] && document.querySelector(arguments[1]);
+if (usable(next)) { next.click(); return 'page'; }
+var root = document.documentElement;
+if (arguments[2] && window.scrollY + window.innerHeight < root.scrollHeight) {
+    window.scrollTo(0, root.scrollHeight);
+    return 'scroll';
+}
+return null;
+"""
 
-        super().__init__(driver)
+READ_ONLY_SCRIPTS.add(JOB_CARDS_SCRIPT)
+
+class CareersPageLocators:
+    # CareersPage ve AsyncCareersPage'in ortak locator'ları (mixin, sayfa sınıfından önce yazılıyor)
+
+    def __init__(self, *args, **kwargs):
+
+        super().__init__(*args, **kwargs)
         
         # Sayfa elementlerini tanımladım (locator'lar)
         self.see_all_qa_jobs_button = (By.XPATH, "//a[contains(text(),'See all QA jobs')]")
@@ -23,12 +66,29 @@ class CareersPage(BasePage):
         
         # İş ilanları ile ilgili locator'lar
         self.job_position_elements = (By.XPATH, "//div[contains(@class,'position')]")
-        self.select2_location_container = (By.XPATH, "//span[@id='select2-filter-by-location-container']")
-        self.select2_dropdown_options = (By.XPATH, "//li[contains(@class,'select2-results__option')]")
         self.job_list_elements = (By.XPATH, "//div[contains(@class,'position') or contains(@class,'job') or contains(@class,'role')]")
         self.no_results_elements = (By.XPATH, "//p[contains(text(),'No positions available') or contains(text(),'No results')]")
         self.view_role_buttons = (By.XPATH, "//a[contains(text(),'View Role')]")
         
+        # Toplu ilan okuma için kart ve alan seçicileri (sıra JobRecord.__slots__ ile aynı)
+        self.job_card_selector = ".position-list-item"
+        self.job_card_fields = (".position-title", ".position-department", ".position-location", "a[href]")
+        self.load_more_jobs_selector = ".load-more, button[class*='load-more']"
+        self.next_jobs_page_selector = ".pagination .next, a[rel='next']"
+
+class CareersPage(CareersPageLocators, BasePage):
+
+    # Filtreyle yeniden çizilen listeler cache'lenmiyor
+    uncached_locators = ("job_position_elements", "job_list_elements", "no_results_elements")
+    
+    def __init__(self, driver):
+
+        super().__init__(driver)
+        
+        # Filtre dropdown'ları (native select veya Select2)
+        self.location_dropdown = Dropdown(self, self.location_filter)
+        self.department_dropdown = Dropdown(self, self.department_filter)
+        
     def click_see_all_qa_jobs(self):
         try:
             self.click_element(self.see_all_qa_jobs_button)
@@ -39,16 +99,23 @@ class CareersPage(BasePage):
     
     def verify_careers_page_blocks(self):
         try:
+            # Üç bloğu da tek sorguda kontrol ediyorum
+            blocks = self.wait_for_elements_present({
+                "locations": self.locations_block,
+                "teams": self.teams_block,
+                "life_at_insider": self.life_at_insider_block,
+            })
+            
             # Locations bloğunun var olup olmadığını kontrol ediyorum
-            locations_present = self.is_element_present(self.locations_block)
+            locations_present = blocks["locations"]["present"]
             print(f"Locations block present: {locations_present}")
             
             # Teams bloğunun var olup olmadığını kontrol ediyorum
-            teams_present = self.is_element_present(self.teams_block)
+            teams_present = blocks["teams"]["present"]
             print(f"Teams block present: {teams_present}")
             
             # Life at Insider bloğunun var olup olmadığını kontrol ediyorum
-            life_present = self.is_element_present(self.life_at_insider_block)
+            life_present = blocks["life_at_insider"]["present"]
             print(f"Life at Insider block present: {life_present}")
             
             # Tüm blokların olması gerekiyor, olmayanı logluyorum
@@ -67,11 +134,13 @@ class CareersPage(BasePage):
     
     def wait_for_jobs_to_load(self, timeout=15):  
         try:
-            wait = WebDriverWait(self.driver, timeout)
-            # İş elementlerinin yüklenmesini bekliyorum (explicit wait)
-            wait.until(EC.presence_of_element_located(self.job_position_elements))
+            # İş elementlerinin yüklenmesini bekliyorum (explicit wait, test bütçesinden düşüyor)
+            self._wait_until(EC.presence_of_element_located(self.job_position_elements), timeout,
+                             "Job positions did not appear")
             
-            time.sleep(2)   #backend'in filteleri getirmesi için minik buffer
+            # Sabit 2 saniye yerine backend istekleri bitip liste oturana kadar bekliyorum
+            self.wait_for_network_idle(quiet_ms=300, timeout=timeout)
+            self.wait_for_element_count_stable(self.job_position_elements, quiet_ms=300, timeout=timeout)
             print("Jobs data loaded successfully")
             return True
             
@@ -79,102 +148,48 @@ class CareersPage(BasePage):
             print(f"Error waiting for jobs to load: {e}")
             return False
     
+    def wait_for_job_list_update(self, timeout=15):
+        # Filtre sonrası iş listesinin yenilenmesini bekliyorum (istekler bitti ve DOM oturdu)
+        try:
+            self.wait_for_network_idle(quiet_ms=300, timeout=timeout)
+            self.wait_for_dom_stable(quiet_ms=300, timeout=timeout)
+            return True
+        except Exception as e:
+            print(f"Error waiting for job list update: {e}")
+            return False
+    
+    def _apply_filter(self, dropdown, value, name):
+        # Dropdown bileşeni üzerinden seçip iş listesinin yenilenmesini bekliyorum; seçenek listesini döndürüyorum
+        if not self.wait_for_jobs_to_load():
+            print(f"Jobs did not load, cannot filter by {name}")
+            return False
+        
+        if not dropdown.exists():
+            print(f"{name.capitalize()} filter dropdown not found")
+            return False
+        
+        selected = dropdown.select(value)
+        available_options = dropdown.options()
+        print(f"Available {name} options ({'Select2' if dropdown.is_select2 else 'native select'}): {available_options}")
+        
+        if selected is None:
+            print(f"{name.capitalize()} '{value}' not available in dropdown")
+            return available_options
+        
+        print(f"Successfully selected {name}: {selected}")
+        self.wait_for_job_list_update()
+        return available_options
+    
     def filter_by_location(self, location="Istanbul, Turkiye"):
         try:
-            # Önce iş ilanlarının yüklenmesini bekliyorum
-            if not self.wait_for_jobs_to_load():
-                print("Jobs did not load, cannot filter by location")
-                return False
-            
-            # Lokasyon filtresi dropdown'ını buluyorum
-            location_element = self.find_element(self.location_filter)
-            
-            # dropdown olup olmadığını kontrol ediyorum
-            is_select2 = "select2-hidden-accessible" in location_element.get_attribute("class")
-            
-            if is_select2:
-                select2_container = self.driver.find_element(*self.select2_location_container)  # tuple'ı açıyorum
-                
-                # Select2 container'ına tıklayarak dropdown'ı açıyorum
-                select2_container.click()
-                time.sleep(0.5)
-                
-                # Location dropdown seçeneklerini buluyorum
-                dropdown_options = self.driver.find_elements(*self.select2_dropdown_options)  # tuple'ı açıyorum
-                print(f"Found {len(dropdown_options)} location dropdown options")
-                
-                # Mevcut seçenekleri list'e atıyorum
-                available_options = []
-                for option in dropdown_options:
-                    option_text = option.text.strip()
-                    if option_text:
-                        available_options.append(option_text)
-                
-                                 
-                # İstenen lokasyonu bulup tıklıyorum
-                location_found = False
-                for option in dropdown_options:
-                    option_text = option.text.strip()
-                    if location.lower() in option_text.lower():
-                        option.click()
-                        location_found = True
-                        break
-                
-                if not location_found:
-                    print(f"Location '{location}' not found in Select2 dropdown")
-                    return available_options
-                
-                return available_options
-            else:
-                # Standart select elementi
-                select = Select(location_element)
-                available_options = [option.text for option in select.options]
-                print(f"Available location options: {available_options}")
-                
-                if location in available_options:
-                    select.select_by_visible_text(location)
-                    print(f"Successfully selected location: {location}")
-                    return True
-                
-                print(f"Location '{location}' not available in dropdown")
-                return available_options
-            
+            return self._apply_filter(self.location_dropdown, location, "location")
         except Exception as e:
             print(f"Error filtering by location: {e}")
             return False
     
     def filter_by_department(self, department="Quality Assurance"):
         try:
-            # Önce iş ilanlarının yüklenmesini bekliyorum
-            if not self.wait_for_jobs_to_load():
-                print("Jobs did not load, cannot filter by department")
-                return False
-            
-            # Departman filtresi dropdown'ını buluyorum 
-            department_element = self.find_element(self.department_filter)
-            
-            # Select elementi mi yoksa custom dropdown mı kontrol ediyorum
-            tag_name = department_element.tag_name
-            print(f"Department filter element tag: {tag_name}")
-            
-            if tag_name == "select":
-                # Standart select elementi
-                select = Select(department_element)
-                available_options = [option.text for option in select.options]
-                
-                if department not in available_options: #aradığım seçenek listede yoksa
-                    print(f"Department '{department}' not available in dropdown")
-                    return available_options 
-                
-                select.select_by_visible_text(department)
-
-                return available_options  # List'i return ediyorum ki içini arayabileyim
-            else:
-                print(f"Custom dropdown detected (tag: {tag_name})")
-                print("Custom dropdowns may not have the expected options loaded")
-                print("This is normal for dynamic content that loads via JavaScript")
-                return False
-            
+            return self._apply_filter(self.department_dropdown, department, "department")
         except Exception as e:
             print(f"Error filtering by department: {e}")
             return False
@@ -198,6 +213,77 @@ class CareersPage(BasePage):
             print(f"Error verifying job list: {e}")
             return False
     
+    def _read_job_batch(self, offset, limit):
+        return self.driver.execute_script(JOB_CARDS_SCRIPT, self.job_card_selector,
+                                          list(self.job_card_fields), offset, limit)
+    
+    def _wait_for_more_jobs(self, mode, offset, first, timeout):
+        # Ekleme/scroll'da kart sayısı artmalı, sayfalamada ilk kart değişmeli
+        def more_jobs_loaded(driver):
+            batch = self._read_job_batch(0, 0)
+            if mode == "page":
+                return batch["total"] > 0 and batch["first"] != first
+            return batch["total"] > offset
+        try:
+            self._wait_until(more_jobs_loaded, timeout, "No more jobs loaded")
+            return True
+        except TimeoutException:
+            return False
+    
+    def iter_jobs(self, batch_size=500, max_loads=100, load_timeout=5, scroll_timeout=1, paginate=True, scroll=False):
+        # İlanları batch batch okuyan generator; liste bitince sıradakileri yükleyip devam ediyor.
+        # paginate=False ise sonraki sayfaya geçmiyorum (sayfa değişmesin), scroll=True lazy-load listeler için
+        offset = 0
+        loads = 0
+        while True:
+            batch = self._read_job_batch(offset, batch_size)
+            for row in batch["rows"]:
+                yield JobRecord(*row)
+            offset += len(batch["rows"])
+            if offset < batch["total"]:
+                continue
+            if loads >= max_loads:
+                return
+            mode = self.driver.execute_script(LOAD_MORE_JOBS_SCRIPT, self.load_more_jobs_selector,
+                                              self.next_jobs_page_selector if paginate else None, scroll)
+            if mode is None:
+                return
+            loads += 1
+            # Scroll ile bir şey gelmiyorsa liste bitmiş demektir, o yüzden kısa bekliyorum
+            timeout = scroll_timeout if mode == "scroll" else load_timeout
+            if not self._wait_for_more_jobs(mode, offset, batch["first"], timeout):
+                return
+            if mode == "page":
+                offset = 0
+    
+    def extract_jobs(self, batch_size=500, max_loads=100, paginate=True):
+        return JobTable.from_records(self.iter_jobs(batch_size, max_loads, paginate=paginate))
+    
+    def verify_job_cards(self, location="Istanbul, Turkiye", department="Quality Assurance"):
+        try:
+            # Doğrulama sonrası test aynı sayfada devam ediyor, o yüzden sonraki sayfalara geçmiyorum
+            jobs = self.extract_jobs(paginate=False)
+            print(f"Extracted {len(jobs)} job cards")
+            if not len(jobs):
+                print("No job cards found")
+                return False
+            
+            locations_ok = jobs.all_locations_contain(location)
+            departments_ok = jobs.all_departments_equal(department)
+            
+            # Uymayan kartları logluyorum
+            if not locations_ok:
+                for index in jobs.mismatches("location", lambda value: location.lower() in value.lower()):
+                    print(f"Unexpected location: {jobs.row(index)}")
+            if not departments_ok:
+                for index in jobs.mismatches("department",
+                                             lambda value: value.strip().lower() == department.strip().lower()):
+                    print(f"Unexpected department: {jobs.row(index)}")
+            return locations_ok and departments_ok
+        except Exception as e:
+            print(f"Error verifying job cards: {e}")
+            return False
+    
     def verify_filtered_jobs_contain_expected_values(self, location_options, department_options):
         try:
             # "Istanbul, Turkiye" lokasyon seçeneklerinde var mı kontrol ediyorum
@@ -210,8 +296,13 @@ class CareersPage(BasePage):
             department_found = expected_department in department_options
             print(f"Department '{expected_department}' found in options: {department_found}")
             
-            # Test geçmesi için ikisi de bulunmalı
-            if location_found and department_found:
+            # Filtre sonrası listedeki tüm kartların lokasyon/departmanını kontrol ediyorum
+            self.wait_for_job_list_update()
+            cards_match = self.verify_job_cards(expected_location, expected_department)
+            print(f"All job cards match '{expected_location}' / '{expected_department}': {cards_match}")
+            
+            # Test geçmesi için ikisi de bulunmalı ve kartlar uymalı
+            if location_found and department_found and cards_match:
                 print("All expected filter values are present")
                 return True
             else:
@@ -222,9 +313,15 @@ class CareersPage(BasePage):
             print(f"Error verifying filtered jobs: {e}")
             return False
     
+    def get_view_role_links(self):
+        # Tüm View Role linklerini tek sorguda alıp mutlak URL'ye çeviriyorum (HTTP ile kontrol için)
+        buttons = self.query_elements({"buttons": self.view_role_buttons}, attributes=("href",))["buttons"]
+        base_url = self.driver.current_url
+        return [urljoin(base_url, values["href"]) for values in buttons.get("attributes", []) if values["href"]]
+    
     def click_view_role_button(self):
         try:
-            view_role_buttons = self.driver.find_elements(*self.view_role_buttons)  # tuple'ı açıyorum
+            view_role_buttons = self.find_elements(self.view_role_buttons)
             
             if not view_role_buttons:
                 print("No View Role buttons found")
@@ -235,8 +332,10 @@ class CareersPage(BasePage):
             
             # Elementi görünür yapmak için önce scroll
             self.driver.execute_script("arguments[0].scrollIntoView(true);", first_button)
-            time.sleep(1)  # Scroll'ın tamamlanmasını bekliyorum
+            self._wait_until(EC.element_to_be_clickable(first_button))  # Scroll'ın tamamlanmasını bekliyorum
             
+            # Yeni tab açılırsa bulabilmek için bu pencereden daha önce açılmış window'ları saklıyorum
+            self.windows_before_click = self.opened_windows()
             # JavaScript click kullanıyorum (normal click navbar overlap nedeniyle başarısız oluyordu)
             self.driver.execute_script("arguments[0].click();", first_button)
             print("Successfully clicked View Role button")
@@ -248,26 +347,30 @@ class CareersPage(BasePage):
     
     def verify_redirect_to_lever(self):
         try:
-            # View Role butonu yeni tab/window açıyor
-            # Yeni window/tab açılıp açılmadığını kontrol ediyorum
-            original_window = self.driver.current_window_handle
-            all_windows = self.driver.window_handles
+            # View Role butonu yeni tab/window açıyor. Pencere takibini opener bilgisiyle yapıyorum,
+            # böylece aynı Chrome'da paralel koşan başka tab'ların pencereleri karışmıyor.
+            known_windows = getattr(self, "windows_before_click", [])
             
-            # Yeni window varsa, ona geçip URL'yi kontrol ediyorum
-            if len(all_windows) > 1:
-                # Yeni window'a geçiyorum
-                new_window = [window for window in all_windows if window != original_window][0]
-                self.driver.switch_to.window(new_window)
+            # Bu pencereden yeni bir window açılana ya da mevcut sayfa lever'a gidene kadar bekliyorum
+            def new_window_or_lever(driver):
+                new_windows = [handle for handle in self.opened_windows() if handle not in known_windows]
+                if new_windows:
+                    return new_windows[0]
+                return "lever" in driver.current_url.lower()
+            result = self._wait_until(new_window_or_lever, timeout=15,
+                                      message="View Role did not open a new window or redirect")
+            
+            # Yeni window açıldıysa ona geçip URL'yi kontrol ediyorum
+            if isinstance(result, str):
+                self.driver.switch_to.window(result)
                 
                 # URL'de "lever" var mı kontrol ediyorum
-                current_url = self.driver.current_url
-                is_lever = "lever" in current_url.lower()
-                return is_lever
-            else:
-                # Yeni window açılmadıysa, mevcut URL'yi kontrol ediyorum
-                current_url = self.driver.current_url
-                return "lever" in current_url.lower()
+                self.wait_for_url_matches("(?i)lever", timeout=15)
+            
+            # Yeni window açılmadıysa mevcut URL'yi kontrol ediyorum
+            current_url = self.driver.current_url
+            return "lever" in current_url.lower()
                 
         except Exception as e:
             print(f"Error verifying Lever redirect: {e}")
-            return False 
\ No newline at end of file
+            return False
@@ -0,0 +1,262 @@
+import asyncio
+import itertools
+import json
+from urllib.request import urlopen
+
+# websockets kurulu değilse sadece asyncio page object'leri kullanılamıyor, senkron testler etkilenmiyor
+try:
+    import websockets
+except ImportError:
+    websockets = None
+
+DEFAULT_COMMAND_TIMEOUT = 30
+
+# Navigasyon sırasında bekleyen Runtime.evaluate bu hatalarla dönüyor; yeni dokümanda tekrar deneniyor
+NAVIGATION_ERRORS = ("Execution context was destroyed", "Inspected target navigated or closed",
+                     "Cannot find default execution context", "Cannot find context with specified id")
+
+
+class CDPError(Exception):
+
+    def __init__(self, method, error):
+        self.method = method
+        self.code = error.get("code")
+        self.message = error.get("message", "")
+        super().__init__(f"{method} failed: {self.message} ({self.code})")
+
+    @property
+    def navigated(self):
+        return any(text in self.message for text in NAVIGATION_ERRORS)
+
+
+def _read_json(url):
+    with urlopen(url, timeout=10) as response:
+        return json.loads(response.read().decode("utf-8"))
+
+
+class CDPConnection:
+    # Chrome'a tek ve kalıcı bir DevTools WebSocket'i. Tüm tab'lar bu bağlantı üzerinden (flatten session) konuşuyor;
+    # cevaplar id ile, event'ler (session, method) ile eşleniyor. Aynı anda birden fazla komut bekleyebiliyor.
+
+    def __init__(self, websocket):
+        self.websocket = websocket
+        self._ids = itertools.count(1)
+        self._pending = {}
+        self._listeners = {}
+        self.commands = 0
+        self.events = 0
+        self._reader = asyncio.get_running_loop().create_task(self._read())
+
+    @classmethod
+    async def connect(cls, url):
+        if websockets is None:
+            raise RuntimeError("Async page objects need the 'websockets' package (pip install websockets)")
+        connection = cls(await websockets.connect(url, max_size=None, ping_interval=None))
+        # Yeni açılan tab'ları (View Role gibi) Target.targetCreated event'iyle yakalamak için
+        await connection.send("Target.setDiscoverTargets", {"discover": True})
+        return connection
+
+    @classmethod
+    async def from_debugger_address(cls, address):
+        # chromedriver'ın açtığı Chrome'un adresi: driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+        version = await asyncio.to_thread(_read_json, f"http://{address}/json/version")
+        return await cls.connect(version["webSocketDebuggerUrl"])
+
+    async def send(self, method, params=None, session_id=None, timeout=DEFAULT_COMMAND_TIMEOUT):
+        message_id = next(self._ids)
+        message = {"id": message_id, "method": method, "params": params or {}}
+        if session_id is not None:
+            message["sessionId"] = session_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[message_id] = future
+        try:
+            await self.websocket.send(json.dumps(message))
+            self.commands += 1
+            response = await asyncio.wait_for(future, timeout)
+        finally:
+            self._pending.pop(message_id, None)
+        if "error" in response:
+            raise CDPError(method, response["error"])
+        return response.get("result", {})
+
+    def on(self, method, callback, session_id=None):
+        # Event aboneliği; dönen fonksiyon aboneliği kaldırıyor
+        key = (session_id, method)
+        self._listeners.setdefault(key, []).append(callback)
+
+        def unsubscribe():
+            listeners = self._listeners.get(key, [])
+            if callback in listeners:
+                listeners.remove(callback)
+        return unsubscribe
+
+    def expect_event(self, *methods, predicate=None, session_id=None):
+        # Event'i beklemeye komutu göndermeden önce başlamak için: abonelik hemen kuruluyor, future dönüyor
+        future = asyncio.get_running_loop().create_future()
+
+        def listener(params):
+            if not future.done() and (predicate is None or predicate(params)):
+                future.set_result(params)
+
+        unsubscribes = [self.on(method, listener, session_id) for method in methods]
+        future.add_done_callback(lambda _: [unsubscribe() for unsubscribe in unsubscribes])
+        return future
+
+    async def wait_for_event(self, *methods, predicate=None, session_id=None, timeout=10):
+        future = self.expect_event(*methods, predicate=predicate, session_id=session_id)
+        try:
+            return await asyncio.wait_for(future, timeout)
+        finally:
+            future.cancel()
+
+    async def _read(self):
+        try:
+            async for raw in self.websocket:
+                message = json.loads(raw)
+                if "id" in message:
+                    future = self._pending.get(message["id"])
+                    if future is not None and not future.done():
+                        future.set_result(message)
+                    continue
+                self.events += 1
+                for callback in list(self._listeners.get((message.get("sessionId"), message.get("method")), [])):
+                    try:
+                        callback(message.get("params", {}))
+                    except Exception as e:
+                        print(f"Error in CDP event handler for {message.get('method')}: {e}")
+        except Exception as e:
+            if websockets is None or not isinstance(e, websockets.exceptions.ConnectionClosed):
+                print(f"Error reading DevTools connection: {e}")
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("DevTools connection closed"))
+
+    @property
+    def closed(self):
+        # Okuyucu bittiyse (Chrome kapandı, WebSocket koptu) bağlantı artık kullanılamaz
+        return self._reader.done()
+
+    async def close(self):
+        await self.websocket.close()
+        try:
+            await self._reader
+        except asyncio.CancelledError:
+            pass
+
+
+class CDPSession:
+    # Tek bir tab'a bağlı oturum. Network ve console event'lerini kendisi takip ediyor,
+    # böylece ağ boşta mı sorusu tarayıcıya gidip gelmeden cevaplanıyor.
+
+    def __init__(self, connection, session_id, target_id, browser_context_id=None):
+        self.connection = connection
+        self.session_id = session_id
+        self.target_id = target_id
+        self.browser_context_id = browser_context_id
+        self.console_messages = []
+        self.inflight_requests = set()
+        loop = asyncio.get_running_loop()
+        self.last_network_activity = loop.time()
+        self.network_activity = asyncio.Event()
+        self.on("Network.requestWillBeSent", self._request_started)
+        for method in ("Network.loadingFinished", "Network.loadingFailed"):
+            self.on(method, self._request_finished)
+        self.on("Runtime.consoleAPICalled", self._console_called)
+        self.on("Runtime.exceptionThrown", self._exception_thrown)
+
+    @classmethod
+    async def create(cls, connection, url="about:blank", isolated=True):
+        # isolated: ayrı browser context (cookie/storage paylaşılmıyor), test bitince tamamen atılıyor
+        context_id = None
+        params = {"url": url}
+        if isolated:
+            context_id = (await connection.send("Target.createBrowserContext",
+                                                {"disposeOnDetach": True}))["browserContextId"]
+            params["browserContextId"] = context_id
+        target_id = (await connection.send("Target.createTarget", params))["targetId"]
+        return await cls.attach(connection, target_id, context_id)
+
+    @classmethod
+    async def attach(cls, connection, target_id, browser_context_id=None):
+        session_id = (await connection.send("Target.attachToTarget",
+                                            {"targetId": target_id, "flatten": True}))["sessionId"]
+        session = cls(connection, session_id, target_id, browser_context_id)
+        await asyncio.gather(session.send("Page.enable"), session.send("Runtime.enable"),
+                             session.send("Network.enable"))
+        return session
+
+    def send(self, method, params=None, timeout=DEFAULT_COMMAND_TIMEOUT):
+        return self.connection.send(method, params, self.session_id, timeout)
+
+    def on(self, method, callback):
+        return self.connection.on(method, callback, self.session_id)
+
+    def expect_event(self, *methods, predicate=None):
+        return self.connection.expect_event(*methods, predicate=predicate, session_id=self.session_id)
+
+    def wait_for_event(self, *methods, predicate=None, timeout=10):
+        return self.connection.wait_for_event(*methods, predicate=predicate, session_id=self.session_id,
+                                              timeout=timeout)
+
+    async def navigate(self, url, timeout=30):
+        # Load event'ine abone olup sonra navigasyonu başlatıyorum (event kaçmasın)
+        loaded = self.expect_event("Page.loadEventFired")
+        try:
+            result = await self.send("Page.navigate", {"url": url}, timeout)
+            if result.get("errorText"):
+                raise CDPError("Page.navigate", {"message": result["errorText"]})
+            await asyncio.wait_for(loaded, timeout)
+        finally:
+            loaded.cancel()
+
+    def _touch_network(self):
+        self.last_network_activity = asyncio.get_running_loop().time()
+        self.network_activity.set()
+
+    def _request_started(self, params):
+        self.inflight_requests.add(params["requestId"])
+        self._touch_network()
+
+    def _request_finished(self, params):
+        self.inflight_requests.discard(params["requestId"])
+        self._touch_network()
+
+    def _console_called(self, params):
+        text = " ".join(str(arg.get("value", arg.get("description", ""))) for arg in params.get("args", []))
+        self.console_messages.append({"level": params.get("type"), "text": text})
+
+    def _exception_thrown(self, params):
+        details = params.get("exceptionDetails", {})
+        text = details.get("exception", {}).get("description") or details.get("text", "")
+        self.console_messages.append({"level": "exception", "text": text})
+
+    async def wait_for_network_idle(self, quiet_ms=500, timeout=10):
+        # Devam eden istek kalmayınca ve quiet_ms boyunca yeni istek başlamayınca dönüyor. Polling yok:
+        # her network event'i bekleyeni uyandırıyor, istek yoksa sadece kalan sessizlik süresi kadar uyuyor.
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        quiet = quiet_ms / 1000.0
+        while True:
+            idle_for = loop.time() - self.last_network_activity
+            if not self.inflight_requests and idle_for >= quiet:
+                return True
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise asyncio.TimeoutError(f"Network did not go idle for {quiet_ms}ms "
+                                           f"({len(self.inflight_requests)} requests pending)")
+            self.network_activity.clear()
+            wait = remaining if self.inflight_requests else min(remaining, quiet - idle_for)
+            try:
+                await asyncio.wait_for(self.network_activity.wait(), wait)
+            except asyncio.TimeoutError:
+                pass
+
+    async def close(self):
+        try:
+            await self.connection.send("Target.closeTarget", {"targetId": self.target_id})
+            if self.browser_context_id is not None:
+                await self.connection.send("Target.disposeBrowserContext",
+                                           {"browserContextId": self.browser_context_id})
+        except Exception as e:
+            print(f"Error closing DevTools target: {e}")
@@ -0,0 +1,137 @@
+import asyncio
+from selenium.common.exceptions import TimeoutException
+from .base_page import locator_to_query
+from .element_cache import READ_ONLY_SCRIPTS
+from .timeout_budget import TimeoutBudgetExceeded
+
+# Locator'ın gösterdiği <select>'i buluyorum. Select2 de gizli bir native <select>'in üstünde çalıştığı için
+# hem okuma hem seçim bu element üzerinden yapılıyor; select değilse içindeki ilk <select>'e bakıyorum.
+_RESOLVE_SELECT = """
+function resolveSelect(query) {
+    var node = query.by === 'xpath'
+        ? document.evaluate(query.value, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(query.value);
+    if (node && node.tagName !== 'SELECT') node = node.querySelector('select');
+    return node;
+}
+"""
+
+# Seçenekleri tek çağrıda okuyorum. Select'e bir MutationObserver kurup liste her değiştiğinde
+# versiyonu artırıyorum; Python tarafındaki versiyon güncelse seçenekleri tekrar göndermiyorum.
+DROPDOWN_OPTIONS_SCRIPT = _RESOLVE_SELECT + """
+var select = resolveSelect(arguments[0]), known = arguments[1];
+if (!select) return null;
+if (!window.__pomDocumentId) window.__pomDocumentId = Date.now() + '-' + Math.random();
+if (!select.__pomOptionsVersion) {
+    select.__pomOptionsVersion = 1;
+    new MutationObserver(function () { select.__pomOptionsVersion++; })
+        .observe(select, {childList: true, subtree: true, characterData: true});
+}
+var result = {
+    version: window.__pomDocumentId + ':' + select.__pomOptionsVersion,
+    select2: select.classList.contains('select2-hidden-accessible')
+        || !!(window.jQuery && window.jQuery(select).data('select2'))
+};
+if (known === result.version) return result;
+result.options = Array.prototype.map.call(select.options, function (option) {
+    return option.text.trim();
+});
+return result;
+"""
+
+# Önce birebir, yoksa içeren (büyük/küçük harf duyarsız) seçeneği seçip change event'i tetikliyorum.
+# Select2 ve sayfanın jQuery handler'ları native change event'ini de dinlediği için ayrıca trigger gerekmiyor.
+DROPDOWN_SELECT_SCRIPT = _RESOLVE_SELECT + """
+var select = resolveSelect(arguments[0]), text = arguments[1].toLowerCase();
+if (!select) return null;
+var options = Array.prototype.slice.call(select.options);
+var match = options.filter(function (option) { return option.text.trim().toLowerCase() === text; })[0]
+    || options.filter(function (option) { return option.text.toLowerCase().indexOf(text) !== -1; })[0];
+if (!match) return null;
+if (select.value !== match.value) {
+    select.value = match.value;
+    select.dispatchEvent(new Event('change', {bubbles: true}));
+}
+return match.text.trim();
+"""
+
+READ_ONLY_SCRIPTS.add(DROPDOWN_OPTIONS_SCRIPT)
+
+
+class Dropdown:
+    # Native <select> ve Select2 için ortak dropdown bileşeni; element aramadan, her işlem tek script çağrısı
+
+    def __init__(self, page, locator):
+        self.page = page
+        self.locator = locator
+        self.query = dict(zip(("by", "value"), locator_to_query(locator)))
+        self._version = None
+        self._options = []
+        self.is_select2 = None
+
+    def _refresh(self):
+        result = self.page.driver.execute_script(DROPDOWN_OPTIONS_SCRIPT, self.query, self._version)
+        if result is None:
+            self._version = None
+            self._options = []
+            return False
+        self.is_select2 = result["select2"]
+        if "options" in result:
+            self._options = result["options"]
+            self._version = result["version"]
+        return True
+
+    def exists(self):
+        return self._refresh()
+
+    def options(self):
+        # Liste değişmediyse cache'teki seçenekleri döndürüyorum
+        self._refresh()
+        return list(self._options)
+
+    def select_now(self, text):
+        return self.page.driver.execute_script(DROPDOWN_SELECT_SCRIPT, self.query, text)
+
+    def select(self, text, timeout=5):
+        # Seçenekler asenkron yükleniyor olabilir; seçenek geldiği poll'da seçim de yapılmış oluyor.
+        # Seçilen seçeneğin metnini, bulunamazsa None döndürüyorum.
+        try:
+            return self.page._wait_until(lambda driver: self.select_now(text), timeout,
+                                         f"Option '{text}' not found in {self.locator}")
+        except TimeoutBudgetExceeded:
+            raise
+        except TimeoutException:
+            return None
+
+
+class AsyncDropdown(Dropdown):
+    # AsyncBasePage için aynı bileşen; script'ler aynı, sadece DevTools bağlantısı üzerinden await ediliyor
+
+    async def _refresh(self):
+        result = await self.page.execute_script(DROPDOWN_OPTIONS_SCRIPT, self.query, self._version)
+        if result is None:
+            self._version = None
+            self._options = []
+            return False
+        self.is_select2 = result["select2"]
+        if "options" in result:
+            self._options = result["options"]
+            self._version = result["version"]
+        return True
+
+    async def exists(self):
+        return await self._refresh()
+
+    async def options(self):
+        await self._refresh()
+        return list(self._options)
+
+    async def select_now(self, text):
+        return await self.page.execute_script(DROPDOWN_SELECT_SCRIPT, self.query, text)
+
+    async def select(self, text, timeout=5):
+        # Seçenek gelene kadar her DOM değişikliğinde seçimi tekrar deniyorum
+        try:
+            return await self.page.wait_for_script(DROPDOWN_SELECT_SCRIPT, self.query, text, timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
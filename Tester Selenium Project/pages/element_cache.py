@@ -0,0 +1,144 @@
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
+
+# Bu komutlardan sonra sayfadaki tüm element referansları geçersiz sayılıyor
+NAVIGATION_COMMANDS = {
+    Command.GET, Command.GO_BACK, Command.GO_FORWARD, Command.REFRESH,
+    Command.SWITCH_TO_WINDOW, Command.CLOSE, Command.NEW_WINDOW,
+    Command.SWITCH_TO_FRAME, Command.SWITCH_TO_PARENT_FRAME,
+}
+
+# Bu komutlar sayfayı değiştirebilir (link tıklama, form submit); sonraki cache isabetinde URL kontrol ediliyor
+MAYBE_NAVIGATING_COMMANDS = {
+    Command.CLICK_ELEMENT, Command.SEND_KEYS_TO_ELEMENT, Command.CLEAR_ELEMENT,
+    Command.W3C_EXECUTE_SCRIPT, Command.W3C_EXECUTE_SCRIPT_ASYNC,
+}
+
+# Sadece okuyan script'ler (BasePage beklemeleri, toplu sorgular) cache'i kirletmiyor
+READ_ONLY_SCRIPTS = set()
+
+
+class CachedWebElement(WebElement):
+    # Stale olursa kendini yeniden bulup (refind) komutu bir kez daha deniyor
+    
+    def __init__(self, element, cache, key, refind):
+        super().__init__(element.parent, element.id)
+        self._cache = cache
+        self._key = key
+        self._refind = refind
+    
+    def _execute(self, command, params=None):
+        try:
+            return super()._execute(command, params)
+        except StaleElementReferenceException:
+            self._cache.stale_retries += 1
+            self._cache.invalidate(self._key)
+            self._id = self._refind().id
+            return super()._execute(command, params)
+
+
+class ElementCache:
+    # Locator -> element cache'i. Navigasyonda, URL/doküman değişiminde ve stale referansta temizleniyor.
+    
+    def __init__(self, driver):
+        self.driver = driver
+        self.entries = {}
+        self.url = None
+        self.dirty = False
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.stale_retries = 0
+    
+    def get(self, key):
+        if self.dirty and self.entries:
+            self._check_document()
+        element = self.entries.get(key)
+        if element is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return element
+    
+    def put(self, locator, element, finder):
+        # finder(locator) tek element döndürüyor
+        self._remember_url()
+        cached = CachedWebElement(element, self, locator, lambda: finder(locator))
+        self.entries[locator] = cached
+        return cached
+    
+    def put_all(self, locator, elements, finder):
+        # finder(locator) liste döndürüyor; stale olan eleman listedeki aynı sıradan yeniden alınıyor
+        self._remember_url()
+        key = ("all", locator)
+        cached = [CachedWebElement(element, self, key, lambda index=index: self._refind_nth(finder, locator, index))
+                  for index, element in enumerate(elements)]
+        self.entries[key] = cached
+        return cached
+    
+    def _refind_nth(self, finder, locator, index):
+        # Liste kısaldıysa IndexError yerine Selenium'un "element yok" hatasını veriyorum
+        elements = finder(locator)
+        if index >= len(elements):
+            raise NoSuchElementException(f"Element {index} of {locator} no longer exists ({len(elements)} found)")
+        return elements[index]
+    
+    def _remember_url(self):
+        if not self.entries:
+            # Navigasyondan sonraki ilk kayıtta, daha sonra karşılaştırmak için URL'yi saklıyorum
+            self.url = self.driver.current_url
+            self.dirty = False
+    
+    def invalidate(self, locator=None):
+        if locator is None:
+            if self.entries:
+                self.invalidations += 1
+            self.entries.clear()
+            self.url = None
+            self.dirty = False
+        elif self.entries.pop(locator, None) is not None:
+            self.invalidations += 1
+    
+    def _check_document(self):
+        # Tıklama vb. sonrası URL değiştiyse tüm cache'i bırakıyorum
+        self.dirty = False
+        if self.driver.current_url != self.url:
+            self.invalidate()
+    
+    def on_command(self, command, params):
+        if command in NAVIGATION_COMMANDS:
+            self.invalidate()
+        elif command in MAYBE_NAVIGATING_COMMANDS:
+            if params is None or params.get("script") not in READ_ONLY_SCRIPTS:
+                self.dirty = True
+    
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 3) if total else 0.0,
+            "invalidations": self.invalidations,
+            "stale_retries": self.stale_retries,
+        }
+
+
+def get_element_cache(driver):
+    # Driver başına tek cache; ilk çağrıda driver.execute'u sarıp navigasyonları izliyorum
+    cache = getattr(driver, "_element_cache", None)
+    if cache is None:
+        cache = driver._element_cache = ElementCache(driver)
+        original_execute = driver.execute
+
+        def execute(driver_command, params=None):
+            try:
+                response = original_execute(driver_command, params)
+            except StaleElementReferenceException:
+                cache.invalidate()
+                raise
+            cache.on_command(driver_command, params)
+            return response
+
+        driver.execute = execute
+    return cache
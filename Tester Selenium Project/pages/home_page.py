@@ -1,18 +1,20 @@
 from selenium.webdriver.common.by import By
 from .base_page import BasePage
 
-class HomePage(BasePage):
+class HomePageLocators:
+    # HomePage ve AsyncHomePage'in ortak locator'ları (mixin, sayfa sınıfından önce yazılıyor)
     
-    def __init__(self, driver):
+    def __init__(self, *args, **kwargs):
 
-        super().__init__(driver)
+        super().__init__(*args, **kwargs)
         
         # Sayfa elementlerini tanımlıyorum (locator'lar)
         self.company_menu = (By.XPATH, "//a[contains(text(),'Company')]") #xpath kullandım
         self.careers_link = (By.XPATH, "//a[contains(text(),'Careers')]")
         self.page_title = "#1 Leader in Individualized, Cross-Channel CX — Insider"
-    
 
+class HomePage(HomePageLocators, BasePage):
+    
     def click_company_menu(self):
         try:
             self.click_element(self.company_menu)
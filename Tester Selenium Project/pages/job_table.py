@@ -0,0 +1,71 @@
+class JobRecord:
+    # Tek iş ilanı; binlerce kayıt için bellekte küçük kalsın diye __slots__ kullanıyorum
+    __slots__ = ("title", "department", "location", "url")
+
+    def __init__(self, title, department, location, url):
+        self.title = title
+        self.department = department
+        self.location = location
+        self.url = url
+
+    def __repr__(self):
+        return f"JobRecord({self.title!r}, {self.department!r}, {self.location!r})"
+
+
+class JobTable:
+    # İlanları sütun sütun tutuyorum; kontroller tüm sütun üzerinde tek geçişte çalışıyor
+
+    COLUMNS = JobRecord.__slots__
+
+    def __init__(self):
+        self.columns = {name: [] for name in self.COLUMNS}
+
+    @classmethod
+    def from_records(cls, records):
+        table = cls()
+        for record in records:
+            table.append(record)
+        return table
+
+    def append(self, record):
+        for name in self.COLUMNS:
+            self.columns[name].append(getattr(record, name))
+
+    def __len__(self):
+        return len(self.columns["title"])
+
+    def __iter__(self):
+        return (JobRecord(*row) for row in zip(*(self.columns[name] for name in self.COLUMNS)))
+
+    def column(self, name):
+        return self.columns[name]
+
+    def mismatches(self, name, predicate):
+        # predicate'i sağlamayan satırların indeksleri
+        return [index for index, value in enumerate(self.columns[name]) if not predicate(value or "")]
+
+    def all_match(self, name, predicate):
+        return len(self) > 0 and not self.mismatches(name, predicate)
+
+    def all_locations_contain(self, text):
+        text = text.lower()
+        return self.all_match("location", lambda value: text in value.lower())
+
+    def all_departments_equal(self, department):
+        department = department.strip().lower()
+        return self.all_match("department", lambda value: value.strip().lower() == department)
+
+    def all_titles_contain(self, text):
+        text = text.lower()
+        return self.all_match("title", lambda value: text in value.lower())
+
+    def where(self, name, predicate):
+        table = JobTable()
+        for index, value in enumerate(self.columns[name]):
+            if predicate(value or ""):
+                for column in self.COLUMNS:
+                    table.columns[column].append(self.columns[column][index])
+        return table
+
+    def row(self, index):
+        return JobRecord(*(self.columns[name][index] for name in self.COLUMNS))
@@ -0,0 +1,103 @@
+from .element_cache import READ_ONLY_SCRIPTS
+
+# Navigation Timing, paint, LCP/CLS ve kaynak boyutlarını tek script çağrısında okuyorum.
+# LCP ve layout-shift girdileri buffered observer'dan takeRecords ile senkron alınıyor.
+PERFORMANCE_SCRIPT = """
+var result = {url: location.href};
+var nav = performance.getEntriesByType('navigation')[0];
+if (nav) {
+    result.ttfb = nav.responseStart;
+    result.dom_interactive = nav.domInteractive;
+    result.dom_content_loaded = nav.domContentLoadedEventEnd;
+    result.load = nav.loadEventEnd || null;
+    result.document_transfer_bytes = nav.transferSize;
+}
+performance.getEntriesByType('paint').forEach(function (entry) {
+    result[entry.name === 'first-paint' ? 'first_paint' : 'first_contentful_paint'] = entry.startTime;
+});
+
+var resources = performance.getEntriesByType('resource');
+result.request_count = resources.length + (nav ? 1 : 0);
+result.transfer_bytes = (nav ? nav.transferSize : 0);
+result.decoded_bytes = (nav ? nav.decodedBodySize : 0);
+resources.forEach(function (entry) {
+    result.transfer_bytes += entry.transferSize || 0;
+    result.decoded_bytes += entry.decodedBodySize || 0;
+});
+
+function buffered(type) {
+    try {
+        var observer = new PerformanceObserver(function () {});
+        observer.observe({type: type, buffered: true});
+        var entries = observer.takeRecords();
+        observer.disconnect();
+        return entries;
+    } catch (e) {
+        return null;
+    }
+}
+
+var lcp = buffered('largest-contentful-paint');
+if (lcp && lcp.length) {
+    var last = lcp[lcp.length - 1];
+    result.lcp = last.renderTime || last.loadTime || last.startTime;
+}
+
+// CLS: en büyük oturum penceresi (1 sn boşluk, en fazla 5 sn)
+var shifts = buffered('layout-shift');
+if (shifts) {
+    var cls = 0, current = 0, windowStart = 0, previous = 0;
+    shifts.forEach(function (entry) {
+        if (entry.hadRecentInput) return;
+        if (current && (entry.startTime - previous > 1000 || entry.startTime - windowStart > 5000)) current = 0;
+        if (!current) windowStart = entry.startTime;
+        current += entry.value;
+        previous = entry.startTime;
+        cls = Math.max(cls, current);
+    });
+    result.cls = cls;
+}
+return result;
+"""
+
+READ_ONLY_SCRIPTS.add(PERFORMANCE_SCRIPT)
+
+# DevTools Performance.getMetrics'ten aldığım değerler: (CDP adı, rapordaki ad, çarpan)
+DEVTOOLS_METRICS = (
+    ("JSHeapUsedSize", "js_heap_used_bytes", 1),
+    ("Nodes", "dom_nodes", 1),
+    ("LayoutCount", "layout_count", 1),
+    ("RecalcStyleCount", "style_recalc_count", 1),
+    ("LayoutDuration", "layout_ms", 1000),
+    ("ScriptDuration", "script_ms", 1000),
+    ("TaskDuration", "task_ms", 1000),
+)
+
+
+def add_devtools_metrics(metrics, devtools_metrics):
+    # Performance.getMetrics cevabındaki değerleri rapordaki adlarıyla ekliyorum
+    values = {item["name"]: item["value"] for item in devtools_metrics}
+    for cdp_name, name, factor in DEVTOOLS_METRICS:
+        if cdp_name in values:
+            metrics[name] = round(values[cdp_name] * factor, 3)
+    return metrics
+
+
+def round_metrics(metrics):
+    for name, value in metrics.items():
+        if isinstance(value, float):
+            metrics[name] = round(value, 4 if name == "cls" else 1)
+    return metrics
+
+
+def collect_performance_metrics(driver):
+    metrics = driver.execute_script(PERFORMANCE_SCRIPT)
+    try:
+        # Performance domain'ini driver başına bir kez açıyorum
+        if not getattr(driver, "_performance_domain_enabled", False):
+            driver.execute_cdp_cmd("Performance.enable", {})
+            driver._performance_domain_enabled = True
+        add_devtools_metrics(metrics, driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"])
+    except Exception as e:
+        print(f"Error reading DevTools performance metrics: {e}")
+    return round_metrics(metrics)
@@ -0,0 +1,98 @@
+import functools
+import inspect
+import threading
+import time
+from selenium.common.exceptions import TimeoutException
+
+# Aktif bütçeyi thread bazında tutuyorum, böylece page object'lerin constructor'ı değişmiyor
+_active = threading.local()
+
+
+class TimeoutBudgetExceeded(TimeoutException):
+
+    def __init__(self, budget, label):
+        self.budget = budget
+        self.label = label
+        # Page object'teki geniş bir except yutsa da propagate_budget_overrun tekrar yükseltebilsin diye
+        budget.overrun = self
+        super().__init__(f"Timeout budget of {budget.total}s exhausted during '{label}'\n{budget.report()}")
+
+
+class TimeoutBudget:
+    # Bir testin toplam bekleme bütçesi. Page object'lerdeki her bekleme buradan harcıyor.
+    
+    def __init__(self, total, name=""):
+        self.total = total
+        self.name = name
+        self.started = time.monotonic()
+        self.spent = []  # (label, saniye) listesi
+        self.overrun = None  # son TimeoutBudgetExceeded
+    
+    def elapsed(self):
+        return time.monotonic() - self.started
+    
+    def remaining(self):
+        return max(0.0, self.total - self.elapsed())
+    
+    def timeout_for(self, requested, label):
+        # İstenen süreyi kalan bütçeyle sınırlıyorum, bütçe bittiyse hiç beklemeden hata veriyorum
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise TimeoutBudgetExceeded(self, label)
+        return min(requested, remaining)
+    
+    def record(self, label, seconds):
+        self.spent.append((label, seconds))
+    
+    def report(self, limit=5):
+        # En çok süre harcayan beklemeleri listeliyorum
+        totals = {}
+        for label, seconds in self.spent:
+            totals[label] = totals.get(label, 0.0) + seconds
+        lines = [f"Budget '{self.name}': {self.elapsed():.2f}s elapsed of {self.total}s, "
+                 f"{sum(totals.values()):.2f}s spent in {len(self.spent)} waits"]
+        for label, seconds in sorted(totals.items(), key=lambda item: item[1], reverse=True)[:limit]:
+            lines.append(f"  {seconds:7.2f}s  {label}")
+        return "\n".join(lines)
+
+
+def activate_budget(budget):
+    _active.budget = budget
+
+
+def deactivate_budget():
+    _active.budget = None
+
+
+def current_budget():
+    return getattr(_active, "budget", None)
+
+
+def time_budget(seconds):
+    # Test metoduna bütçe tanımlamak için decorator: @time_budget(30)
+    def decorator(test_method):
+        test_method.time_budget_seconds = seconds
+        return test_method
+    return decorator
+
+
+def propagate_budget_overrun(method):
+    # Page object metotları hataları print edip False döndürüyor (except Exception). Metot çalışırken bütçe
+    # aşıldıysa bu yutulmuş olabilir; metot dönünce aşımı tekrar yükseltiyorum. BasePage alt sınıflarının
+    # metotlarına otomatik uygulanıyor (BasePage.__init_subclass__).
+    if not inspect.isfunction(method) or inspect.isgeneratorfunction(method):
+        return method
+
+    @functools.wraps(method)
+    def page_method(self, *args, **kwargs):
+        budget = current_budget()
+        previous = budget.overrun if budget is not None else None
+        result = method(self, *args, **kwargs)
+        if budget is not None and budget.overrun is not previous:
+            raise budget.overrun
+        return result
+    return page_method
+
+
+# Çağıran page object metodunu frame'lerden bulan yerler (BasePage._wait_label, tracing) bu sarmalayıcıyı atlıyor
+BUDGET_WRAPPER_CODE = propagate_budget_overrun(lambda self: None).__code__
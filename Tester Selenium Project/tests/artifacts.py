@@ -0,0 +1,197 @@
+import base64
+import gzip
+import io
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Pillow varsa screenshot'ları WebP'ye çevirip küçültüyorum, yoksa PNG olarak kalıyor
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+SCREENSHOT_QUALITY = 60
+
+
+def _safe_name(name):
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name)
+
+
+class ArtifactPipeline:
+    # Hata anında ham veriyi (screenshot, DOM, console, network) test thread'inde alıp
+    # encode, sıkıştırma ve diske yazmayı arka plandaki thread havuzuna bırakıyorum.
+
+    def __init__(self, root="screenshots", workers=2, max_pending=8, ring_size=0):
+        self.root = root
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="artifacts")
+        # Kuyruk dolarsa test thread'i yer açılana kadar bekliyor (bellek sınırsız büyümesin)
+        self._slots = threading.BoundedSemaphore(max_pending)
+        # Adım ring'i thread başına (tab modunda her thread kendi testini koşuyor)
+        self.ring_size = ring_size
+        self._local = threading.local()
+        self.errors = []
+
+    @classmethod
+    def from_env(cls):
+        root = os.environ.get("ARTIFACT_DIR") or os.environ.get("SCREENSHOT_DIR", "screenshots")
+        return cls(root=root,
+                   workers=int(os.environ.get("ARTIFACT_WORKERS", "2")),
+                   max_pending=int(os.environ.get("ARTIFACT_QUEUE", "8")),
+                   ring_size=int(os.environ.get("ARTIFACT_RING_SIZE", "0")))
+
+    @property
+    def ring(self):
+        if not self.ring_size:
+            return None
+        if getattr(self._local, "ring", None) is None:
+            self._local.ring = deque(maxlen=self.ring_size)
+        return self._local.ring
+
+    def start_test(self):
+        # Önceki testin (başarılı bittiği için temizlenmemiş) adımları yeni testin hatasına karışmasın
+        if self.ring is not None:
+            self.ring.clear()
+
+    def remember_step(self, driver, step_name):
+        # Son N adımın screenshot'ını bellekte tutuyorum, hata olursa öncesi de kaydediliyor
+        ring = self.ring
+        if ring is None:
+            return
+        try:
+            ring.append((step_name, time.time(), driver.get_screenshot_as_base64()))
+        except Exception as e:
+            print(f"Error capturing step screenshot: {e}")
+
+    def capture_failure(self, driver, test_id, name, network_log=None):
+        # Test thread'inde sadece ham veriyi alıyorum; dönüş değeri screenshot'ın yazılacağı yol
+        directory = os.path.join(self.root, _safe_name(test_id))
+        screenshot_path = os.path.join(directory, f"{_safe_name(name)}.{'webp' if Image else 'png'}")
+
+        payload = {"directory": directory, "screenshot_path": screenshot_path, "url": None}
+        try:
+            payload["screenshot"] = driver.get_screenshot_as_base64()
+        except Exception as e:
+            print(f"Error taking screenshot: {e}")
+        try:
+            payload["url"] = driver.current_url
+            payload["dom"] = driver.page_source
+        except Exception as e:
+            print(f"Error capturing DOM snapshot: {e}")
+        try:
+            payload["console"] = driver.get_log("browser")
+        except Exception:
+            payload["console"] = []
+        if network_log is not None:
+            network_log.drain()
+            payload["requests"] = list(network_log.requests().values())
+        ring = self.ring
+        if ring:
+            payload["steps"] = list(ring)
+            ring.clear()
+
+        self.submit(self._write_failure, payload)
+        return screenshot_path
+
+    def submit(self, function, *args):
+        self._slots.acquire()
+        future = self.executor.submit(function, *args)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, future):
+        self._slots.release()
+        if future.exception() is not None:
+            self.errors.append(future.exception())
+            print(f"Error writing artifacts: {future.exception()}")
+
+    def close(self):
+        # Bekleyen tüm yazmalar bitene kadar bekliyorum (process çıkışında çağrılıyor)
+        self.executor.shutdown(wait=True)
+
+    def _write_failure(self, payload):
+        directory = payload["directory"]
+        os.makedirs(directory, exist_ok=True)
+
+        if "screenshot" in payload:
+            _write_bytes(payload["screenshot_path"], _encode_screenshot(payload["screenshot"]))
+        if "dom" in payload:
+            _write_gzip(os.path.join(directory, "dom.html.gz"), payload["dom"].encode("utf-8"))
+        if payload.get("console"):
+            _write_gzip(os.path.join(directory, "console.json.gz"),
+                        json.dumps(payload["console"], indent=1).encode("utf-8"))
+        if payload.get("requests"):
+            _write_gzip(os.path.join(directory, "network.har.gz"),
+                        json.dumps(build_har(payload["requests"], payload["url"])).encode("utf-8"))
+        for index, (step_name, taken_at, screenshot) in enumerate(payload.get("steps", [])):
+            extension = "webp" if Image else "png"
+            path = os.path.join(directory, "steps", f"{index:02d}-{_safe_name(step_name)}.{extension}")
+            _write_bytes(path, _encode_screenshot(screenshot))
+        print(f"Failure artifacts saved: {directory}")
+
+
+def _encode_screenshot(screenshot_base64):
+    png = base64.b64decode(screenshot_base64)
+    if Image is None:
+        return png
+    output = io.BytesIO()
+    Image.open(io.BytesIO(png)).save(output, format="WEBP", quality=SCREENSHOT_QUALITY)
+    return output.getvalue()
+
+
+def _write_bytes(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+def _write_gzip(path, data):
+    with gzip.open(path, "wb", compresslevel=6) as f:
+        f.write(data)
+
+
+def build_har(requests, page_url=None):
+    # NetworkLog isteklerinden HAR 1.2 formatında (sade) bir network log'u oluşturuyorum
+    entries = []
+    for request in requests:
+        if "url" not in request:
+            continue
+        started = request.get("started") or 0
+        finished = request.get("finished") or started
+        wall_time = request.get("wall_time") or 0
+        entries.append({
+            "startedDateTime": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(wall_time))
+                               + f".{int(wall_time % 1 * 1000):03d}Z",
+            "time": max(0.0, (finished - started) * 1000),
+            "request": {"method": request.get("method", "GET"), "url": request["url"], "httpVersion": "",
+                        "headers": [], "queryString": [], "cookies": [], "headersSize": -1, "bodySize": -1},
+            "response": {"status": request.get("status", 0), "statusText": request.get("failed") or "",
+                         "httpVersion": "", "headers": [{"name": name, "value": str(value)}
+                                                        for name, value in request.get("headers", {}).items()],
+                         "cookies": [], "content": {"size": request.get("encoded_size", 0),
+                                                    "mimeType": request.get("mime_type") or ""},
+                         "redirectURL": "", "headersSize": -1, "bodySize": request.get("encoded_size", -1)},
+            "cache": {},
+            "timings": {"send": 0, "wait": max(0.0, (finished - started) * 1000), "receive": 0},
+            "_resourceType": request.get("type"),
+            "_blockedReason": request.get("blocked_reason"),
+        })
+    return {"log": {"version": "1.2", "creator": {"name": "Tester Selenium Project", "version": "1.0"},
+                    "pages": [{"id": "page_1", "title": page_url or "", "startedDateTime": "",
+                               "pageTimings": {}}] if page_url else [],
+                    "entries": entries}}
+
+
+_pipeline = None
+
+
+def get_artifact_pipeline():
+    # Process başına tek pipeline
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = ArtifactPipeline.from_env()
+    return _pipeline
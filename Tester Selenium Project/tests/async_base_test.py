@@ -0,0 +1,181 @@
+import asyncio
+import base64
+import functools
+import inspect
+import os
+import sys
+import time
+import unittest
+from urllib.parse import urljoin, urlparse
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from pages.cdp_connection import CDPConnection, CDPSession, websockets
+from tests.base_test import DEFAULT_TIME_BUDGET, create_driver, resolve_base_url
+from tests.driver_manager import DriverManager
+from tests.impact import get_impact_recorder
+
+
+def debugger_address(driver):
+    # chromedriver'ın açtığı Chrome'un DevTools adresi (host:port)
+    return driver.capabilities["goog:chromeOptions"]["debuggerAddress"]
+
+
+# Python 3.11+'ta IsolatedAsyncioTestCase event loop'u asyncio.Runner'dan alıyor; sınıfın testlerine tek Runner
+# verince DevTools WebSocket'i sınıf başına bir kez açılabiliyor. Eski sürümlerde bağlantı test başına.
+SHARED_EVENT_LOOP = hasattr(unittest.IsolatedAsyncioTestCase, "_setupAsyncioRunner")
+
+
+def with_time_budget(test_method):
+    # @time_budget ile verilen (yoksa sınıfın) süre testin tamamı için üst sınır; asyncio.wait_for ile uyguluyorum.
+    # functools.wraps @start_url / @time_budget attribute'larını wrapper'a taşıyor.
+    @functools.wraps(test_method)
+    async def wrapper(self):
+        seconds = getattr(test_method, "time_budget_seconds", self.time_budget_seconds)
+        started = time.monotonic()
+        try:
+            return await asyncio.wait_for(test_method(self), seconds)
+        except asyncio.TimeoutError:
+            # Testin içinden gelen (ör. bir beklemenin) TimeoutError'ı bütçe aşımı saymıyorum
+            if time.monotonic() - started < seconds:
+                raise
+            self.fail(f"{self._testMethodName} exceeded its {seconds}s time budget")
+    return wrapper
+
+
+class AsyncBaseTest(unittest.IsolatedAsyncioTestCase):
+    # Asyncio page object'leri için BaseTest karşılığı. Chrome yine chromedriver ile açılıyor, ama test
+    # komutları WebDriver HTTP yerine sınıfın tek DevTools WebSocket'i üzerinden gidiyor. Her test kendi browser
+    # context'inde açılan yeni bir tab'da koşuyor; test bitince context atıldığı için cookie/storage temizliği yok.
+
+    # Benchmark ve paralel koşuda dışarıdan verilen Chrome oturumu
+    shared_driver = None
+
+    time_budget_seconds = DEFAULT_TIME_BUDGET
+    start_path = ""
+
+    def __init_subclass__(cls, **kwargs):
+        # Alt sınıfların async test metotlarını bütçeyle sarıyorum
+        super().__init_subclass__(**kwargs)
+        for name, method in list(vars(cls).items()):
+            if name.startswith("test") and inspect.iscoroutinefunction(method):
+                setattr(cls, name, with_time_budget(method))
+
+    @classmethod
+    def setUpClass(cls):
+        if websockets is None:
+            raise unittest.SkipTest("Async page objects need the 'websockets' package")
+        if cls.shared_driver is not None:
+            cls.driver_manager = None
+            cls.driver = cls.shared_driver
+        else:
+            cls.driver_manager = DriverManager.from_env(create_driver)
+            cls.driver = cls.driver_manager.driver
+        cls.debugger_address = debugger_address(cls.driver)
+        cls.base_url = resolve_base_url()
+        cls.base_host = urlparse(cls.base_url).netloc.lower()
+        cls._class_runner = None
+        cls._class_connection = None
+
+    @classmethod
+    def tearDownClass(cls):
+        # Sınıfın WebSocket'i ve event loop'u son testten sonra kapanıyor
+        runner = getattr(cls, "_class_runner", None)
+        if runner is not None:
+            try:
+                if cls._class_connection is not None:
+                    runner.run(cls._class_connection.close())
+            except Exception as e:
+                print(f"Error closing DevTools connection: {e}")
+            finally:
+                runner.close()
+                cls._class_runner = cls._class_connection = None
+        if getattr(cls, "driver_manager", None) is not None:
+            cls.driver_manager.quit()
+
+    def _setupAsyncioRunner(self):
+        # Testler sınıfın Runner'ını (aynı event loop'u) paylaşıyor; bağlantının okuyucu task'ı loop'a bağlı
+        cls = type(self)
+        if getattr(cls, "_class_runner", None) is None:
+            cls._class_runner = asyncio.Runner(debug=True)
+        self._asyncioRunner = cls._class_runner
+
+    def _tearDownAsyncioRunner(self):
+        # Runner tearDownClass'ta kapanıyor
+        self._asyncioRunner = None
+
+    @classmethod
+    async def open_connection(cls):
+        return await CDPConnection.from_debugger_address(cls.debugger_address)
+
+    async def _connection(self):
+        cls = type(self)
+        if not SHARED_EVENT_LOOP:
+            connection = await cls.open_connection()
+            self.addAsyncCleanup(connection.close)
+            return connection
+        if cls._class_connection is None or cls._class_connection.closed:
+            cls._class_connection = await cls.open_connection()
+        return cls._class_connection
+
+    async def asyncSetUp(self):
+        # Test etki analizi kaydı senkron testlerdeki gibi (event loop aynı thread'de koşuyor)
+        impact_recorder = get_impact_recorder()
+        if impact_recorder is not None:
+            impact_recorder.start()
+            self.addCleanup(impact_recorder.stop, self.id())
+
+        # Kurulumun devamı hata verse de (tab açılamadı, ilk sayfa yüklenmedi) tab kapansın diye cleanup.
+        # WebSocket sınıfın ilk testinde açılıyor, testler sadece kendi session'ını (tab + context) açıyor.
+        self.connection = await self._connection()
+        self._traffic_at_start = (self.connection.commands, self.connection.events)
+        self.session = await CDPSession.create(self.connection)
+        self.addAsyncCleanup(self.session.close)
+
+        self.step_timings = {}
+        self._current_step = None
+
+        # @start_url ile verilen başlangıç sayfası (None ise navigasyon yok)
+        test_method = getattr(self, self._testMethodName)
+        path = getattr(test_method, "start_path", self.start_path)
+        if path is not None:
+            self.mark_step("start page load")
+            await self.open(path)
+            self.end_step()
+
+    def mark_step(self, name):
+        self.end_step()
+        self._current_step = (name, time.perf_counter())
+
+    def end_step(self):
+        if self._current_step is not None:
+            name, started = self._current_step
+            self.step_timings[name] = self.step_timings.get(name, 0.0) + time.perf_counter() - started
+            self._current_step = None
+
+    async def open(self, path=""):
+        await self.session.navigate(urljoin(self.base_url, path))
+
+    async def take_screenshot(self, name):
+        # Hata anının ekran görüntüsü ve console mesajları
+        try:
+            os.makedirs("screenshots", exist_ok=True)
+            screenshot_path = os.path.join("screenshots", f"{name}_{time.strftime('%Y%m%d_%H%M%S')}.png")
+            data = (await self.session.send("Page.captureScreenshot", {"format": "png"}))["data"]
+            with open(screenshot_path, "wb") as f:
+                f.write(base64.b64decode(data))
+            self.screenshots = getattr(self, "screenshots", []) + [screenshot_path]
+            print(f"Screenshot saved: {screenshot_path}")
+            for message in self.session.console_messages:
+                print(f"Console [{message['level']}]: {message['text']}")
+        except Exception as e:
+            print(f"Error taking screenshot: {e}")
+
+    async def asyncTearDown(self):
+        # Session asyncSetUp'ta eklenen cleanup'la kapanıyor; trafik sayaçları bağlantıyla birlikte sınıf boyunca birikiyor
+        self.end_step()
+        commands, events = self._traffic_at_start
+        print(f"DevTools traffic: {self.connection.commands - commands} commands, "
+              f"{self.connection.events - events} events")
@@ -1,6 +1,8 @@
 import unittest
 import sys
 import os
+import time
+from urllib.parse import urljoin, urlparse
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from webdriver_manager.chrome import ChromeDriverManager
@@ -10,62 +12,303 @@ from selenium.webdriver.chrome.options import Options
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
+from pages.timeout_budget import TimeoutBudget, activate_budget, deactivate_budget
+from tests.browser_profile import FastBrowsingProfile, summarize_blocked
+from tests.network_log import NetworkLog, logging_prefs
+from tests.tracing import CommandTracer, tracing_enabled
+from tests.artifacts import get_artifact_pipeline
+from tests.driver_manager import DriverManager
+from tests.impact import get_impact_recorder
+from tests.performance_budget import format_breach, get_performance_recorder
+from tests.start_state import close_extra_windows, install_session_reset, reset_state, visited_origins
+from pages.element_cache import get_element_cache
+from tests.fixture_server import (LIVE_BASE_URL, FixtureArchive, FixtureRecorder, apply_replay_options,
+                                  archive_path, fixture_mode, get_fixture_server)
+
+# Test kendi bütçesini tanımlamazsa kullanılan toplam bekleme bütçesi (saniye)
+DEFAULT_TIME_BUDGET = float(os.environ.get("TEST_TIME_BUDGET", "60"))
+
+# Record modunda process başına tek kayıtçı
+_recorder = None
+
+
+def resolve_base_url():
+    # Replay modunda yerel fixture sunucusu, yoksa BASE_URL ya da canlı site
+    if fixture_mode() == "replay":
+        return get_fixture_server().url
+    return os.environ.get("BASE_URL", LIVE_BASE_URL)
+
+
+def get_fixture_recorder():
+    global _recorder
+    if _recorder is None and fixture_mode() == "record":
+        _recorder = FixtureRecorder(FixtureArchive(archive_path()), resolve_base_url())
+    return _recorder
+
+
+def build_chrome_options(profile=None, headless=False, collect_logs=True):
+    # Chrome seçeneklerini yapılandırıyorum
+    chrome_options = Options()
+    if headless:
+        # Yük modunda çok sayıda oturum pencere açmadan çalışıyor
+        chrome_options.add_argument("--headless=new")
+        chrome_options.add_argument("--window-size=1920,1080")
+    chrome_options.add_argument("--no-sandbox")
+    chrome_options.add_argument("--disable-dev-shm-usage")
+    chrome_options.add_argument("--disable-gpu")
+    chrome_options.add_argument("--disable-extensions")
+    chrome_options.add_argument("--disable-popup-blocking")
+    
+    # Console uyarılarını bastırıyorum çünkü console'um çığlık atıyordu
+    chrome_options.add_argument("--log-level=3")  
+    chrome_options.add_argument("--silent")
+    chrome_options.add_argument("--disable-logging")
+    chrome_options.add_argument("--disable-default-apps")
+    chrome_options.add_argument("--disable-background-timer-throttling")
+    chrome_options.add_argument("--disable-backgrounding-occluded-windows")
+    chrome_options.add_argument("--disable-renderer-backgrounding")
+    chrome_options.add_argument("--disable-features=TranslateUI")
+    chrome_options.add_argument("--disable-ipc-flooding-protection")
+    chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
+    chrome_options.add_experimental_option('useAutomationExtension', False)
+    
+    # Hızlı profil (eager page load)
+    profile = profile or FastBrowsingProfile.from_env()
+    profile.apply_options(chrome_options)
+    
+    # Log'lar sadece okuyan bir özellik varsa açılıyor (tests/network_log.py); collect_logs=False hiç log tutmuyor
+    chrome_options.set_capability("goog:loggingPrefs", logging_prefs(profile) if collect_logs else {})
+    
+    # Replay modunda canlı ağa çıkılmıyor
+    if fixture_mode() == "replay":
+        apply_replay_options(chrome_options)
+    return chrome_options
+
+
+def create_driver(profile=None):
+    # WebDriver'ı başlatıyorum
+    driver = webdriver.Chrome(options=build_chrome_options(profile))
+    # Implicit wait'i kapatıyorum; BasePage'in explicit wait'leriyle üst üste binip timeout'ları katlıyordu
+    driver.implicitly_wait(0)
+    driver.maximize_window()
+    return driver
+
+
 class BaseTest(unittest.TestCase):
     
+    # Paralel koşuda her worker process kendi Chrome oturumunu buraya koyuyor (tests/parallel_runner.py).
+    # Tab modunda her thread'in tab'ı bound_to ile oluşturulan alt sınıfa konuyor.
+    shared_driver = None
+    
+    # True ise sınıfın testleri shard'lara bölünürken birlikte kalıyor (tests/scheduler.py);
+    # testler setUpClass'ta kurulan ortak state'e bağımlıysa açılmalı
+    keep_together = False
+    
+    # Sınıf genelinde bekleme bütçesi; metot bazında @time_budget(saniye) ile değiştirilebiliyor
+    time_budget_seconds = DEFAULT_TIME_BUDGET
+    
+    # Hızlı tarama profili (FAST_PROFILE=1); engellemeden muaf tutulacaklar @allow_resources ile veriliyor
+    browser_profile = FastBrowsingProfile.from_env()
+    allowed_resources = ()
+    
+    # Testin başlangıç sayfası (base URL'e göre, None ise navigasyon yok) ve durumu (StartState).
+    # Metot bazında @start_url(...) / @start_state(...) ile değiştirilebiliyor (tests/start_state.py).
+    start_path = ""
+    start_state = None
+    
     @classmethod
     def setUpClass(cls):
-        # Chrome seçeneklerini yapılandırıyorum
-        chrome_options = Options()
-        chrome_options.add_argument("--no-sandbox")
-        chrome_options.add_argument("--disable-dev-shm-usage")
-        chrome_options.add_argument("--disable-gpu")
-        chrome_options.add_argument("--disable-extensions")
-        chrome_options.add_argument("--disable-popup-blocking")
-        
-        # Console uyarılarını bastırıyorum çünkü console'um çığlık atıyordu
-        chrome_options.add_argument("--log-level=3")  
-        chrome_options.add_argument("--silent")
-        chrome_options.add_argument("--disable-logging")
-        chrome_options.add_argument("--disable-default-apps")
-        chrome_options.add_argument("--disable-background-timer-throttling")
-        chrome_options.add_argument("--disable-backgrounding-occluded-windows")
-        chrome_options.add_argument("--disable-renderer-backgrounding")
-        chrome_options.add_argument("--disable-features=TranslateUI")
-        chrome_options.add_argument("--disable-ipc-flooding-protection")
-        chrome_options.add_experimental_option("excludeSwitches", ["enable-logging"])
-        chrome_options.add_experimental_option('useAutomationExtension', False)
-        
-        # WebDriver'ı başlatıyorum
-        try:
-            cls.driver = webdriver.Chrome(options=chrome_options)
-        except Exception as e:
-            print(f"Error initializing Chrome driver: {e}")
+        # Worker'ın havuzdaki oturumu (ya da tab'ı) varsa yeni Chrome açmıyorum
+        if cls.shared_driver is not None:
+            cls.driver_manager = None
+            cls._bind_driver(cls.shared_driver)
+        else:
+            # Chrome açılamazsa retry sonrası hata setUpClass'tan yükseliyor (yarım driver ile devam etmiyorum)
+            cls.driver_manager = DriverManager.from_env(lambda: create_driver(cls.browser_profile))
+            cls._bind_driver(cls.driver_manager.driver)
+        if cls.tracer is not None:
+            cls.tracer.acquire()
+        
+        # Testler base URL'e göre gidiyor; replay modunda bu yerel fixture sunucusu oluyor
+        cls.base_url = resolve_base_url()
+        cls.base_host = urlparse(cls.base_url).netloc.lower()
+    
+    @classmethod
+    def _bind_driver(cls, driver):
+        # Driver'a bağlı yardımcıları kuruyorum; oturum yenilenince (recycle) tekrar çağrılıyor
+        cls.driver = driver
+        cls.network_log = NetworkLog(cls.driver)
+        
+        # WEBDRIVER_TRACE=1 ise tüm WebDriver komutlarını kaydediyorum
+        cls.tracer = CommandTracer.instance() if tracing_enabled() else None
+        if cls.tracer is not None:
+            cls.tracer.install(cls.driver)
         
-        cls.driver.implicitly_wait(10)
-        cls.driver.maximize_window()
+        cls.recorder = get_fixture_recorder()
+        if cls.recorder is not None:
+            cls.recorder.start(cls.driver, cls.network_log)
+    
+    @classmethod
+    def bound_to(cls, driver):
+        # Aynı test sınıfı farklı thread'lerde aynı anda koşabilsin diye (setUpClass sınıf attribute'ları yazıyor)
+        # her tab için aynı isimli bir alt sınıf oluşturuyorum
+        return type(cls.__name__, (cls,), {
+            "shared_driver": driver,
+            "__module__": cls.__module__,
+            "__qualname__": cls.__qualname__,
+        })
     
     @classmethod
     def tearDownClass(cls):
         #Tüm testlerden sonra bir kez çalışır. Browser'ı kapatır
+        # Havuzdaki oturumu worker kendisi kapatıyor
+        if getattr(cls, 'recorder', None) is not None:
+            cls.recorder.finish()
         if hasattr(cls, 'driver'):
-            cls.driver.quit()
+            print(f"Element cache: {get_element_cache(cls.driver).stats()}")
+        if getattr(cls, 'tracer', None) is not None:
+            cls.tracer.release()
+            trace_path = cls.tracer.write_chrome_trace(os.path.join("reports", f"trace-{os.getpid()}.json"))
+            print(f"WebDriver trace saved: {trace_path}")
+        if getattr(cls, 'driver_manager', None) is not None:
+            print(f"Driver lifecycle: {cls.driver_manager.metrics()}")
+            cls.driver_manager.quit()
     
     def setUp(self):
-        #Testten önce ana sayfaya gidiyorum.
-        self.driver.get("https://useinsider.com/")
+        # IMPACT_RECORD=1 ise testin çalıştırdığı page object metotlarını kaydediyorum (tests/impact.py)
+        impact_recorder = get_impact_recorder()
+        if impact_recorder is not None:
+            impact_recorder.start()
+            self.addCleanup(impact_recorder.stop, self.id())
+        
+        # Page object beklemelerinin harcayacağı test bütçesini başlatıyorum
+        test_method = getattr(self, self._testMethodName)
+        seconds = getattr(test_method, "time_budget_seconds", self.time_budget_seconds)
+        self.time_budget = TimeoutBudget(seconds, name=self._testMethodName)
+        activate_budget(self.time_budget)
+        
+        # Testin allow-list'ine göre engellenecek kaynakları ayarlıyorum
+        allowed = getattr(test_method, "allowed_resources", self.allowed_resources)
+        self.browser_profile.apply(self.driver, allow=allowed)
+        self.network_log.clear()
+        
+        if self.tracer is not None:
+            self.tracer.start_test(self.id())
+        get_artifact_pipeline().start_test()
+        
+        # tearDown hata verse de (ör. Chrome çöktüyse) oturum sağlığı kontrol edilsin diye cleanup olarak ekliyorum
+        self.addCleanup(self._check_driver_health)
+        
+        # Sayfa hız bütçesi aşımları; fonksiyonel hatalardan ayrı raporlanıyor
+        self.performance_breaches = []
+        
+        # Adım süreleri (benchmark için): mark_step bir adımı başlatıp öncekini kapatıyor
+        self.step_timings = {}
+        self._current_step = None
+        
+        # Testin penceresi; tearDown'da test sırasında açılan pencereler kapatılıp buraya dönülüyor
+        self.original_handle = self.driver.current_window_handle
+        
+        # Cookie ve storage durumunu sayfa yüklenmeden CDP ile kuruyorum
+        install_session_reset(self.driver)
+        state = getattr(test_method, "start_state", None)
+        if self.start_state is not None:
+            state = self.start_state.merged(state)
+        self.seed_script_id = state.apply(self.driver, self.base_url) if state is not None else None
+        if self.seed_script_id is not None or (state is not None and state.cookies):
+            self.driver._reload_required = True
+        
+        # Testten önce sadece testin başlangıç sayfasına gidiyorum (varsayılan ana sayfa)
+        path = getattr(test_method, "start_path", self.start_path)
+        if path is not None:
+            self.mark_step("start page load")
+            self.open(path)
+            self.end_step()
+    
+    def mark_step(self, name):
+        self.end_step()
+        # ARTIFACT_RING_SIZE > 0 ise adımın başındaki ekranı bellekte tutuyorum
+        get_artifact_pipeline().remember_step(self.driver, name)
+        self._current_step = (name, time.perf_counter())
+    
+    def end_step(self):
+        if self._current_step is not None:
+            name, started = self._current_step
+            self.step_timings[name] = self.step_timings.get(name, 0.0) + time.perf_counter() - started
+            self._current_step = None
+    
+    def open(self, path="", force=False):
+        # base URL'e göre navigasyon; zaten o sayfadaysam tekrar yüklemiyorum.
+        # Açık sayfanın altında storage temizlendiyse ya da yeni başlangıç durumu kurulduysa yine yüklüyorum.
+        url = urljoin(self.base_url, path)
+        if not force and not getattr(self.driver, "_reload_required", False) and self.driver.current_url == url:
+            return
+        # record modunda önceki sayfanın yanıtlarını kayıtçının execute sarmalayıcısı topluyor
+        self.driver.get(url)
+        self.driver._reload_required = False
     
     def tearDown(self):
-        #Her test metodundan sonra Cookie'leri ve local storage'ı temizliyorum.
-        self.driver.delete_all_cookies()
-        self.driver.execute_script("window.localStorage.clear();")
-        self.driver.execute_script("window.sessionStorage.clear();")
+        self.end_step()
+        
+        # Bütçe aşıldıysa hangi beklemenin süreyi yediğini yazdırıyorum
+        deactivate_budget()
+        if self.time_budget.remaining() <= 0:
+            print(self.time_budget.report())
+        if self.tracer is not None:
+            self.tracer.stop_test()
+            print(self.tracer.summary(self.id()))
+        
+        if self.recorder is not None:
+            self.recorder.capture(self.driver, self.network_log)
+        
+        # Temizlik (CDP çağrıları) testin penceresinde yapılsın diye ek pencereleri kapatıyorum
+        try:
+            close_extra_windows(self.driver, self.original_handle)
+        except Exception as e:
+            print(f"Error restoring test window: {e}")
+        
+        for breach in self.performance_breaches:
+            print(f"Performance budget exceeded: {format_breach(breach)}")
+        
+        # Hızlı profilde hangi isteklerin engellendiğini logluyorum
+        if self.browser_profile.enabled:
+            self.network_log.drain()
+            print(summarize_blocked(self.network_log.blocked_requests()))
+        
+        #Her test metodundan sonra Cookie'leri ve storage'ı temizliyorum.
+        # Test boyunca gidilen her origin için tek DevTools çağrısı (sessionStorage bir sonraki sayfada siliniyor)
+        self.network_log.drain()
+        try:
+            current_url = self.driver.current_url
+        except Exception:
+            current_url = None
+        reset_state(self.driver, visited_origins(self.network_log, self.base_url, current_url), self.seed_script_id)
+        # Açık doküman temizlenen storage'ı ve eski sessionStorage'ı hâlâ tutuyor; sonraki open yeniden yüklemeli
+        self.driver._reload_required = True
+    
+    def record_performance(self, page, page_name):
+        # Sayfanın hız metriklerini kaydedip bütçeyle karşılaştırıyorum; aşım testi düşürmüyor
+        try:
+            metrics = page.collect_performance_metrics()
+        except Exception as e:
+            print(f"Error collecting performance metrics: {e}")
+            return {}
+        self.performance_breaches.extend(get_performance_recorder().record(self.id(), page_name, metrics))
+        return metrics
+    
+    def _check_driver_health(self):
+        # Bellek/gecikme ölçüp gerekirse (N test, eşik aşımı, cevap yok) Chrome oturumunu yeniliyorum
+        if self.driver_manager is not None and self.driver_manager.after_test() is not None:
+            type(self)._bind_driver(self.driver_manager.driver)
     
     def take_screenshot(self, name):
-        # Test başarısız olursa screenshot alıyorum.
+        # Test başarısız olursa screenshot, DOM, console ve network log'unu alıyorum.
+        # Encode ve diske yazma arka planda yapılıyor, test thread'i beklemiyor.
         try:
-            screenshot_path = f"screenshots/{name}.png"
-            os.makedirs("screenshots", exist_ok=True)
-            self.driver.save_screenshot(screenshot_path)
-            print(f"Screenshot saved: {screenshot_path}")
+            # Paralel koşuda her worker kendi klasörüne yazıyor, sonra rapor birleştiriyor
+            screenshot_path = get_artifact_pipeline().capture_failure(
+                self.driver, self.id(), name, self.network_log)
+            self.screenshots = getattr(self, "screenshots", []) + [screenshot_path]
+            print(f"Screenshot queued: {screenshot_path}")
         except Exception as e:
             print(f"Error taking screenshot: {e}") 
\ No newline at end of file
@@ -0,0 +1,247 @@
+import argparse
+import json
+import math
+import os
+import sys
+import time
+import unittest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+DEFAULT_BASELINE = os.path.join(project_root, "benchmarks", "baseline.json")
+
+# Regresyon sayılması için hem istatistiksel anlamlılık hem de pratik bir fark istiyorum
+DEFAULT_ALPHA = 0.05
+DEFAULT_MIN_DELTA = 0.25   # saniye
+DEFAULT_MIN_RATIO = 0.10   # medyanda %10
+
+# --pair ile senkron (WebDriver) ve asyncio (DevTools WebSocket) testleri adım adım karşılaştırılıyor
+PAIR_TESTS = ["tests.tests.TestInsiderWebsite", "tests.async_tests.TestInsiderWebsiteAsync"]
+
+
+def percentile(samples, fraction):
+    # Doğrusal interpolasyonlu yüzdelik
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    position = (len(ordered) - 1) * fraction
+    lower = math.floor(position)
+    upper = math.ceil(position)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def mann_whitney_greater(current, baseline):
+    # Tek yönlü Mann-Whitney U testi: current, baseline'dan büyük mü? (normal yaklaşım + tie düzeltmesi)
+    n1, n2 = len(current), len(baseline)
+    if not n1 or not n2:
+        return 1.0
+    combined = sorted([(value, 0) for value in current] + [(value, 1) for value in baseline])
+    ranks = [0.0] * len(combined)
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        rank = (i + j) / 2 + 1
+        for k in range(i, j + 1):
+            ranks[k] = rank
+        tied = j - i + 1
+        tie_term += tied ** 3 - tied
+        i = j + 1
+
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean = n1 * n2 / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+class _BenchmarkResult(unittest.TestResult):
+    # Test başarılıysa toplam süreyi ve adım sürelerini topluyorum
+
+    def __init__(self):
+        super().__init__()
+        self.samples = {}
+        self.failed = 0
+        self.asynchronous = False
+
+    def startTest(self, test):
+        super().startTest(test)
+        self._started = time.perf_counter()
+
+    def addSuccess(self, test):
+        super().addSuccess(test)
+        self.samples["total"] = time.perf_counter() - self._started
+        self.samples.update(getattr(test, "step_timings", {}))
+        self.asynchronous = isinstance(test, unittest.IsolatedAsyncioTestCase)
+
+    def addFailure(self, test, err):
+        super().addFailure(test, err)
+        self.failed += 1
+
+    def addError(self, test, err):
+        super().addError(test, err)
+        self.failed += 1
+
+
+def run_benchmark(test_ids, runs):
+    # Her testi runs kez çalıştırıp test ve adım bazında ölçümleri topluyorum
+    from tests.async_base_test import AsyncBaseTest
+    from tests.base_test import BaseTest, create_driver
+
+    # Chrome açılışını ölçüme katmamak için tüm koşularda tek oturum kullanıyorum;
+    # asyncio testleri de aynı Chrome'a DevTools üzerinden bağlanıyor
+    BaseTest.shared_driver = AsyncBaseTest.shared_driver = create_driver()
+    measurements = {}
+    failures = {}
+    async_tests = set()
+    try:
+        for test_id in test_ids:
+            for run in range(runs):
+                result = _BenchmarkResult()
+                unittest.TestLoader().loadTestsFromName(test_id).run(result)
+                if result.failed:
+                    failures[test_id] = failures.get(test_id, 0) + 1
+                    continue
+                if result.asynchronous:
+                    async_tests.add(test_id)
+                for step, seconds in result.samples.items():
+                    measurements.setdefault(f"{test_id}::{step}", []).append(round(seconds, 4))
+                print(f"{test_id} run {run + 1}/{runs}: {result.samples.get('total', 0):.2f}s")
+    finally:
+        BaseTest.shared_driver.quit()
+        BaseTest.shared_driver = AsyncBaseTest.shared_driver = None
+    return measurements, failures, async_tests
+
+
+def summarize(measurements):
+    return {
+        name: {
+            "median": round(percentile(samples, 0.5), 4),
+            "p95": round(percentile(samples, 0.95), 4),
+            "runs": len(samples),
+            "samples": samples,
+        }
+        for name, samples in measurements.items()
+    }
+
+
+def compare(summary, baseline, alpha=DEFAULT_ALPHA, min_delta=DEFAULT_MIN_DELTA, min_ratio=DEFAULT_MIN_RATIO):
+    # Baseline'a göre medyanı anlamlı ve belirgin şekilde artan ölçümleri regresyon olarak işaretliyorum
+    rows = []
+    for name, current in sorted(summary.items()):
+        previous = baseline.get(name)
+        if previous is None:
+            rows.append({"name": name, "current": current["median"], "baseline": None, "delta": None,
+                         "p_value": None, "regression": False})
+            continue
+        delta = current["median"] - previous["median"]
+        p_value = mann_whitney_greater(current["samples"], previous["samples"])
+        regression = (p_value < alpha and delta >= min_delta and delta >= previous["median"] * min_ratio)
+        rows.append({"name": name, "current": current["median"], "baseline": previous["median"],
+                     "delta": round(delta, 4), "p_value": round(p_value, 4), "regression": regression})
+    return rows
+
+
+def pair(summary, async_tests):
+    # Aynı isimli test metodunun aynı adımını senkron ve asyncio sürümleri arasında eşliyorum
+    pairs = {}
+    for name, current in summary.items():
+        test_id, step = name.split("::", 1)
+        key = f"{test_id.rsplit('.', 1)[-1]}::{step}"
+        pairs.setdefault(key, {})["async" if test_id in async_tests else "sync"] = current["median"]
+    return [{"name": key, "sync": medians["sync"], "async": medians["async"],
+             "speedup": round(medians["sync"] / medians["async"], 2) if medians["async"] else None}
+            for key, medians in sorted(pairs.items()) if "sync" in medians and "async" in medians]
+
+
+def print_pairs(rows):
+    print(f"{'measurement':<80} {'sync':>8} {'async':>8} {'speedup':>8}")
+    for row in rows:
+        speedup = "-" if row["speedup"] is None else f"{row['speedup']:.2f}x"
+        print(f"{row['name']:<80} {row['sync']:8.3f} {row['async']:8.3f} {speedup:>8}")
+
+
+def print_table(summary, rows):
+    print(f"{'measurement':<80} {'median':>8} {'p95':>8} {'baseline':>9} {'delta':>8} {'p':>7}")
+    for row in rows:
+        current = summary[row["name"]]
+        baseline = "-" if row["baseline"] is None else f"{row['baseline']:.3f}"
+        delta = "-" if row["delta"] is None else f"{row['delta']:+.3f}"
+        p_value = "-" if row["p_value"] is None else f"{row['p_value']:.3f}"
+        flag = "  REGRESSION" if row["regression"] else ""
+        print(f"{row['name']:<80} {current['median']:8.3f} {current['p95']:8.3f} {baseline:>9} "
+              f"{delta:>8} {p_value:>7}{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Testleri ve adımlarını K kez çalıştırıp baseline ile karşılaştırır")
+    parser.add_argument("tests", nargs="*", default=None,
+                        help="Test modülleri veya test id'leri (varsayılan: tests.tests)")
+    parser.add_argument("-k", "--runs", type=int, default=5, help="Her test için koşu sayısı")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline dosyası")
+    parser.add_argument("--save-baseline", action="store_true", help="Sonuçları yeni baseline olarak kaydet")
+    parser.add_argument("--replay", action="store_true",
+                        help="Kayıtlı arşivi yerel sunucudan kullan (FIXTURE_MODE=replay)")
+    parser.add_argument("--alpha", type=float, default=DEFAULT_ALPHA)
+    parser.add_argument("--min-delta", type=float, default=DEFAULT_MIN_DELTA,
+                        help="Regresyon için gereken en az medyan artışı (saniye)")
+    parser.add_argument("--min-ratio", type=float, default=DEFAULT_MIN_RATIO,
+                        help="Regresyon için gereken en az medyan artış oranı")
+    parser.add_argument("--pair", action="store_true",
+                        help="Senkron ve asyncio testlerinin adım medyanlarını yan yana yazdır")
+    args = parser.parse_args(argv)
+    if not args.tests:
+        args.tests = PAIR_TESTS if args.pair else ["tests.tests.TestInsiderWebsite"]
+
+    if args.replay:
+        os.environ["FIXTURE_MODE"] = "replay"
+
+    from tests.parallel_runner import collect_test_ids
+    test_ids = collect_test_ids(args.tests)
+    measurements, failures, async_tests = run_benchmark(test_ids, args.runs)
+    summary = summarize(measurements)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)["measurements"]
+
+    rows = compare(summary, baseline, args.alpha, args.min_delta, args.min_ratio)
+    print_table(summary, rows)
+    if args.pair:
+        print_pairs(pair(summary, async_tests))
+    for test_id, count in failures.items():
+        print(f"{test_id}: {count} failed runs were excluded")
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline) or ".", exist_ok=True)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump({"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "runs": args.runs,
+                       "fixture_mode": os.environ.get("FIXTURE_MODE", "live"),
+                       "measurements": summary}, f, indent=2)
+        print(f"Baseline saved: {args.baseline}")
+
+    # Çalıştırılan testlerin baseline'da olup artık ölçülemeyen adımları da başarısızlık sayılıyor
+    missing = sorted(name for name in baseline
+                     if name.split("::", 1)[0] in test_ids and name not in summary)
+    for name in missing:
+        print(f"{name}: no measurement in this run")
+
+    regressions = [row for row in rows if row["regression"]]
+    if regressions:
+        print(f"{len(regressions)} significant regressions found")
+    if regressions or failures or missing:
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,111 @@
+import os
+import threading
+
+# Process ağacının bellek kullanımını /proc'tan okuyorum (Linux). Başka platformlarda ölçüm None dönüyor.
+PROC = "/proc"
+
+
+def _children_map():
+    children = {}
+    for entry in os.listdir(PROC):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(os.path.join(PROC, entry, "stat"), encoding="utf-8") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # "pid (komut adı) durum ppid ..." — komut adında boşluk olabileceği için son ')' sonrasını ayırıyorum
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        children.setdefault(ppid, []).append(int(entry))
+    return children
+
+
+def process_tree(root_pid):
+    children = _children_map()
+    pids = [root_pid]
+    index = 0
+    while index < len(pids):
+        pids.extend(children.get(pids[index], []))
+        index += 1
+    return pids
+
+
+def process_memory_kb(pid):
+    # smaps_rollup varsa Rss ve Pss (paylaşılan sayfalar bölünmüş) birlikte geliyor, yoksa status'taki VmRSS
+    memory = {"rss": 0, "pss": 0}
+    try:
+        with open(os.path.join(PROC, str(pid), "smaps_rollup"), encoding="utf-8") as f:
+            for line in f:
+                name, _, value = line.partition(":")
+                if name in ("Rss", "Pss"):
+                    memory[name.lower()] = int(value.split()[0])
+        return memory
+    except OSError:
+        pass
+    try:
+        with open(os.path.join(PROC, str(pid), "status"), encoding="utf-8") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    memory["rss"] = memory["pss"] = int(line.split()[1])
+    except OSError:
+        pass
+    return memory
+
+
+def tree_memory_mb(root_pid=None):
+    if not os.path.isdir(PROC):
+        return None
+    total = {"rss": 0, "pss": 0}
+    for pid in process_tree(root_pid or os.getpid()):
+        memory = process_memory_kb(pid)
+        total["rss"] += memory["rss"]
+        total["pss"] += memory["pss"]
+    return {name: round(value / 1024, 1) for name, value in total.items()}
+
+
+class MemorySampler:
+    # Koşu boyunca arka planda process ağacını (runner + worker'lar + chromedriver + Chrome) örnekleyip tepe değeri tutuyorum
+
+    def __init__(self, root_pid=None, interval=0.5):
+        self.root_pid = root_pid or os.getpid()
+        self.interval = interval
+        self.peak = None
+        self.samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _sample(self):
+        memory = tree_memory_mb(self.root_pid)
+        if memory is None:
+            return
+        self.samples += 1
+        if self.peak is None:
+            self.peak = memory
+        else:
+            self.peak = {name: max(self.peak[name], memory[name]) for name in memory}
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                self._sample()
+            except Exception as e:
+                print(f"Error sampling browser memory: {e}")
+            self._stop.wait(self.interval)
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="memory-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+        return self.report()
+
+    def report(self):
+        if self.peak is None:
+            return {"peak_rss_mb": None, "peak_pss_mb": None, "samples": self.samples}
+        return {"peak_rss_mb": self.peak["rss"], "peak_pss_mb": self.peak["pss"], "samples": self.samples}
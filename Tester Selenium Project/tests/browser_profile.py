@@ -0,0 +1,101 @@
+import os
+from collections import Counter
+from urllib.parse import urlparse
+
+# Kaynak tipine göre engellediğim dosya uzantıları. Engelleme sadece URL uzantısına bakıyor: uzantısız CDN
+# resimleri (ör. /image/upload/abc), data: URL fontları ve uzantısı query string'de olan asset'ler yükleniyor.
+# Gerçek kaynak tipi eşleşmesi Fetch.enable + RequestPattern.resourceType ister, ama duraklatılan her isteğin
+# Fetch.requestPaused event'iyle devam ettirilmesi gerekiyor; execute_cdp_cmd event dinleyemediği için kullanmıyorum.
+RESOURCE_TYPE_EXTENSIONS = {
+    "image": ("png", "jpg", "jpeg", "gif", "webp", "svg", "ico", "avif"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "media": ("mp4", "webm", "mp3", "ogg", "m3u8"),
+}
+
+
+def extension_patterns(extension):
+    # Network.setBlockedURLs kalıbı: URL uzantıyla bitiyor ya da uzantıdan hemen sonra query string başlıyor.
+    # "*.svg*" gibi bir kalıp ".svgz", "/icons.svg-sprite/app.js" ya da "?file=a.svg&x" gibi URL'leri de yakalıyordu.
+    return [f"*.{extension}", f"*.{extension}?*"]
+
+# Testlerin işlevselliğini etkilemeyen üçüncü parti analytics / reklam script'leri
+THIRD_PARTY_PATTERNS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*connect.facebook.net*",
+    "*hotjar.com*",
+    "*clarity.ms*",
+    "*snap.licdn.com*",
+    "*hs-scripts.com*",
+    "*hs-analytics.net*",
+    "*cdn.segment.com*",
+    "*youtube.com/embed*",
+    "*vimeo.com*",
+]
+
+
+class FastBrowsingProfile:
+    # Sayfa hazır olma süresini kısaltan profil: eager/none page load + gereksiz kaynakları engelleme
+
+    def __init__(self, enabled=True, page_load_strategy="eager",
+                 resource_types=("image", "font", "media"), url_patterns=THIRD_PARTY_PATTERNS):
+        self.enabled = enabled
+        self.page_load_strategy = page_load_strategy
+        self.resource_types = tuple(resource_types)
+        self.url_patterns = list(url_patterns)
+
+    @classmethod
+    def from_env(cls):
+        # FAST_PROFILE=1 ile açılıyor, diğer ayarlar isteğe bağlı
+        enabled = os.environ.get("FAST_PROFILE", "0") == "1"
+        strategy = os.environ.get("FAST_PROFILE_LOAD_STRATEGY", "eager")
+        types = os.environ.get("FAST_PROFILE_BLOCK_TYPES", "image,font,media")
+        return cls(enabled=enabled, page_load_strategy=strategy,
+                   resource_types=[t.strip() for t in types.split(",") if t.strip()])
+
+    def apply_options(self, chrome_options):
+        if self.enabled:
+            chrome_options.page_load_strategy = self.page_load_strategy
+        return chrome_options
+
+    def blocked_patterns(self, allow=()):
+        # allow listesi hem kaynak tipi ("image") hem de URL kalıbı ("*hotjar.com*") alabiliyor
+        allowed = set(allow)
+        patterns = []
+        for resource_type in self.resource_types:
+            if resource_type not in allowed:
+                for extension in RESOURCE_TYPE_EXTENSIONS.get(resource_type, ()):
+                    patterns.extend(extension_patterns(extension))
+        patterns.extend(pattern for pattern in self.url_patterns if pattern not in allowed)
+        return patterns
+
+    def apply(self, driver, allow=()):
+        # Her testten önce engelleme listesini testin allow-list'ine göre yeniliyorum
+        if not self.enabled:
+            return []
+        patterns = self.blocked_patterns(allow)
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+        except Exception as e:
+            print(f"Error applying fast browsing profile: {e}")
+            return []
+        return patterns
+
+
+def allow_resources(*items):
+    # Test metodu için engellemeden muaf tutulacaklar: @allow_resources("image", "*hotjar.com*")
+    def decorator(test_method):
+        test_method.allowed_resources = items
+        return test_method
+    return decorator
+
+
+def summarize_blocked(blocked_requests, limit=5):
+    # Engellenen istekleri host bazında özetliyorum
+    hosts = Counter(urlparse(request.get("url", "")).netloc for request in blocked_requests)
+    lines = [f"Blocked {len(blocked_requests)} requests"]
+    for host, count in hosts.most_common(limit):
+        lines.append(f"  {count:4d}  {host}")
+    return "\n".join(lines)
@@ -0,0 +1,199 @@
+import os
+import statistics
+import time
+
+from pages.element_cache import READ_ONLY_SCRIPTS
+from tests.browser_metrics import tree_memory_mb
+
+# Renderer'a kadar gidip dönen ucuz bir komut; komut gecikmesini bununla ölçüyorum
+PING_SCRIPT = "return document.readyState;"
+READ_ONLY_SCRIPTS.add(PING_SCRIPT)
+
+# Son ölçüm bir eşiğin bu oranını geçtiyse seyrek ölçmeyi bırakıp her testten sonra ölçüyorum
+NEAR_THRESHOLD_RATIO = 0.8
+
+
+def _env_number(name, default, cast=float):
+    value = os.environ.get(name)
+    return cast(value) if value not in (None, "") else default
+
+
+class DriverManager:
+    # Chrome oturumunun yaşam döngüsü: retry/backoff ile başlatma, testler arasında bellek ve gecikme ölçümü,
+    # N testten sonra ya da eşik aşılınca oturumu kapatıp yenisini açma (recycle). Eşik 0 ise kapalı.
+
+    def __init__(self, factory, max_tests=50, max_rss_mb=0, max_latency_ms=0, max_latency_ratio=0,
+                 start_retries=3, start_backoff=1.0, ping_samples=3, sample_every=5):
+        self.factory = factory
+        self.max_tests = max_tests
+        self.max_rss_mb = max_rss_mb
+        self.max_latency_ms = max_latency_ms
+        self.max_latency_ratio = max_latency_ratio
+        self.start_retries = start_retries
+        self.start_backoff = start_backoff
+        self.ping_samples = ping_samples
+        self.sample_every = max(1, sample_every)
+        self._driver = None
+        self.tests_on_driver = 0
+        # Yeni oturumun ilk testinden sonra gecikme baseline'ı için hemen ölçülsün diye sayaç dolu başlıyor
+        self.tests_since_sample = self.sample_every
+        self.baseline_latency_ms = None
+        self.starts = 0
+        self.start_failures = 0
+        self.samples = []
+        self.recycles = []
+
+    @classmethod
+    def from_env(cls, factory):
+        return cls(factory,
+                   max_tests=_env_number("DRIVER_MAX_TESTS", 50, int),
+                   max_rss_mb=_env_number("DRIVER_MAX_RSS_MB", 0),
+                   max_latency_ms=_env_number("DRIVER_MAX_LATENCY_MS", 0),
+                   max_latency_ratio=_env_number("DRIVER_MAX_LATENCY_RATIO", 0),
+                   start_retries=_env_number("DRIVER_START_RETRIES", 3, int),
+                   start_backoff=_env_number("DRIVER_START_BACKOFF", 1.0),
+                   sample_every=_env_number("DRIVER_SAMPLE_EVERY", 5, int))
+
+    @property
+    def driver(self):
+        if self._driver is None:
+            self.start()
+        return self._driver
+
+    def start(self):
+        # Chrome/chromedriver bazen ilk denemede açılmıyor; artan beklemeyle tekrar deniyorum
+        last_error = None
+        for attempt in range(1, self.start_retries + 1):
+            try:
+                self._driver = self.factory()
+                self.starts += 1
+                self.tests_on_driver = 0
+                self.tests_since_sample = self.sample_every
+                self.baseline_latency_ms = None
+                return self._driver
+            except Exception as e:
+                last_error = e
+                self.start_failures += 1
+                print(f"Error initializing Chrome driver (attempt {attempt}/{self.start_retries}): {e}")
+                if attempt < self.start_retries:
+                    time.sleep(self.start_backoff * 2 ** (attempt - 1))
+        raise RuntimeError(f"Chrome driver could not be started after {self.start_retries} attempts") from last_error
+
+    def browser_memory_mb(self):
+        # chromedriver process'i ve altındaki tüm Chrome process'leri
+        service = getattr(self._driver, "service", None)
+        process = getattr(service, "process", None)
+        if process is None:
+            return None
+        return tree_memory_mb(process.pid)
+
+    def command_latency_ms(self):
+        timings = []
+        for _ in range(self.ping_samples):
+            started = time.perf_counter()
+            self._driver.execute_script(PING_SCRIPT)
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings)
+
+    def sample(self):
+        sample = {"test": self.tests_on_driver, "rss_mb": None, "pss_mb": None, "latency_ms": None}
+        memory = self.browser_memory_mb()
+        if memory is not None:
+            sample["rss_mb"] = memory["rss"]
+            sample["pss_mb"] = memory["pss"]
+        try:
+            sample["latency_ms"] = round(self.command_latency_ms(), 2)
+        except Exception as e:
+            # Oturum cevap vermiyorsa ölçüm yerine hata kaydediyorum; bu da recycle sebebi
+            sample["error"] = f"{type(e).__name__}: {e}"
+        if self.baseline_latency_ms is None and sample["latency_ms"] is not None:
+            self.baseline_latency_ms = sample["latency_ms"]
+        self.samples.append(sample)
+        return sample
+
+    def recycle_reason(self, sample):
+        if "error" in sample:
+            return f"unresponsive ({sample['error']})"
+        if self.max_tests and self.tests_on_driver >= self.max_tests:
+            return f"tests>={self.max_tests}"
+        if self.max_rss_mb and sample["rss_mb"] is not None and sample["rss_mb"] > self.max_rss_mb:
+            return f"rss {sample['rss_mb']}MB>{self.max_rss_mb}MB"
+        if self.max_latency_ms and sample["latency_ms"] > self.max_latency_ms:
+            return f"latency {sample['latency_ms']}ms>{self.max_latency_ms}ms"
+        if (self.max_latency_ratio and self.baseline_latency_ms
+                and sample["latency_ms"] > self.baseline_latency_ms * self.max_latency_ratio):
+            return f"latency {sample['latency_ms']}ms>{self.max_latency_ratio}x baseline"
+        return None
+
+    def near_threshold(self):
+        # Son ölçüm bellek ya da gecikme eşiğine yaklaştı mı
+        if not self.samples:
+            return False
+        last = self.samples[-1]
+        if self.max_rss_mb and last["rss_mb"] is not None and last["rss_mb"] > self.max_rss_mb * NEAR_THRESHOLD_RATIO:
+            return True
+        if last["latency_ms"] is None:
+            return False
+        if self.max_latency_ms and last["latency_ms"] > self.max_latency_ms * NEAR_THRESHOLD_RATIO:
+            return True
+        return bool(self.max_latency_ratio and self.baseline_latency_ms and last["latency_ms"]
+                    > self.baseline_latency_ms * self.max_latency_ratio * NEAR_THRESHOLD_RATIO)
+
+    def sample_due(self):
+        return self.tests_since_sample >= self.sample_every or self.near_threshold()
+
+    def after_test(self, tests=1):
+        # Her test (ya da birlikte koşan test grubu) sonrası çağrılıyor; oturum yenilendiyse recycle kaydını döndürüyor.
+        # Ölçüm (ping'ler + process ağacı taraması) her testte değil, sample_due olduğunda yapılıyor.
+        if self._driver is None:
+            return None
+        self.tests_on_driver += tests
+        self.tests_since_sample += tests
+        if self.max_tests and self.tests_on_driver >= self.max_tests:
+            return self.recycle(f"tests>={self.max_tests}")
+        if not self.sample_due():
+            return None
+        self.tests_since_sample = 0
+        sample = self.sample()
+        reason = self.recycle_reason(sample)
+        if reason is None:
+            return None
+        return self.recycle(reason, sample)
+
+    def recycle(self, reason, sample=None):
+        started = time.perf_counter()
+        tests = self.tests_on_driver
+        self.quit()
+        self.start()
+        event = {
+            "reason": reason,
+            "tests": tests,
+            "rss_mb": (sample or {}).get("rss_mb"),
+            "latency_ms": (sample or {}).get("latency_ms"),
+            "duration": round(time.perf_counter() - started, 3),
+        }
+        self.recycles.append(event)
+        print(f"Chrome session recycled after {tests} tests: {reason} ({event['duration']}s)")
+        return event
+
+    def quit(self):
+        if self._driver is not None:
+            try:
+                self._driver.quit()
+            except Exception as e:
+                print(f"Error quitting Chrome driver: {e}")
+            self._driver = None
+
+    def metrics(self):
+        latencies = [sample["latency_ms"] for sample in self.samples if sample["latency_ms"] is not None]
+        memory = [sample["rss_mb"] for sample in self.samples if sample["rss_mb"] is not None]
+        return {
+            "starts": self.starts,
+            "start_failures": self.start_failures,
+            "recycles": len(self.recycles),
+            "recycle_events": self.recycles,
+            "samples": len(self.samples),
+            "latency_ms_median": round(statistics.median(latencies), 2) if latencies else None,
+            "latency_ms_max": max(latencies) if latencies else None,
+            "rss_mb_max": max(memory) if memory else None,
+        }
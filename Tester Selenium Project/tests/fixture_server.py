@@ -0,0 +1,422 @@
+import argparse
+import base64
+import contextlib
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from pages.element_cache import MAYBE_NAVIGATING_COMMANDS, NAVIGATION_COMMANDS, READ_ONLY_SCRIPTS
+
+LIVE_BASE_URL = "https://useinsider.com/"
+DEFAULT_ARCHIVE = os.path.join(project_root, "fixtures", "insider")
+
+# Ana site dışındaki origin'leri yerel sunucuda bu önekin altında sunuyorum: /__origin__/https/jobs.lever.co/...
+ORIGIN_PREFIX = "/__origin__"
+
+# Yeniden yazılabilen (host değiştirilebilen) içerik tipleri
+TEXT_MIME_TYPES = ("text/", "application/javascript", "application/json", "application/x-javascript",
+                   "application/xml", "image/svg+xml")
+
+# Replay'de geri göndermediğim header'lar (gövde zaten açılmış, host'lar değişti)
+DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection",
+                   "content-security-policy", "content-security-policy-report-only",
+                   "strict-transport-security", "set-cookie", "alt-svc", "report-to", "nel"}
+
+
+def fixture_mode():
+    # live (varsayılan), record veya replay
+    return os.environ.get("FIXTURE_MODE", "live").lower()
+
+
+def archive_path():
+    return os.environ.get("FIXTURE_ARCHIVE", DEFAULT_ARCHIVE)
+
+
+class FixtureArchive:
+    # Diskteki arşiv: index.json + bodies/<sha1>.bin
+
+    def __init__(self, path):
+        self.path = path
+        self.primary_origin, self.entries = self._read_index()
+
+    def _read_index(self):
+        index_path = os.path.join(self.path, "index.json")
+        if not os.path.exists(index_path):
+            return None, {}
+        with open(index_path, encoding="utf-8") as f:
+            data = json.load(f)
+        return data.get("primary_origin"), {(entry["method"], entry["url"]): entry for entry in data["entries"]}
+
+    def add(self, method, url, status, headers, body=b"", mime_type=""):
+        digest = hashlib.sha1(body).hexdigest()
+        bodies_dir = os.path.join(self.path, "bodies")
+        os.makedirs(bodies_dir, exist_ok=True)
+        body_path = os.path.join(bodies_dir, f"{digest}.bin")
+        if not os.path.exists(body_path):
+            with open(body_path, "wb") as f:
+                f.write(body)
+        self.entries[(method, url)] = {
+            "method": method,
+            "url": url,
+            "status": status,
+            "headers": {name.lower(): value for name, value in headers.items()},
+            "mime_type": mime_type,
+            "body": digest,
+        }
+
+    def save(self):
+        # Paralel record'da her worker aynı index'e yazıyor: kilit altında diskteki index'i okuyup
+        # kendi kayıtlarımı üstüne ekliyorum, böylece diğer worker'ların kayıtları kaybolmuyor
+        os.makedirs(self.path, exist_ok=True)
+        index_path = os.path.join(self.path, "index.json")
+        with _file_lock(index_path + ".lock"):
+            primary_origin, entries = self._read_index()
+            entries.update(self.entries)
+            self.entries = entries
+            self.primary_origin = primary_origin or self.primary_origin
+            temporary_path = f"{index_path}.{os.getpid()}.tmp"
+            with open(temporary_path, "w", encoding="utf-8") as f:
+                json.dump({
+                    "primary_origin": self.primary_origin,
+                    "entries": sorted(self.entries.values(), key=lambda entry: (entry["url"], entry["method"])),
+                }, f, indent=1)
+            os.replace(temporary_path, index_path)
+
+    def body(self, entry):
+        with open(os.path.join(self.path, "bodies", f"{entry['body']}.bin"), "rb") as f:
+            return f.read()
+
+    def origins(self):
+        return sorted({_origin(url) for _, url in self.entries})
+
+    def lookup(self, method, url):
+        # Önce birebir eşleşme, sonra cache-busting parametreleri için query'siz eşleşme
+        entry = self.entries.get((method, url)) or self.entries.get(("GET", url))
+        if entry is not None:
+            return entry
+        without_query = url.split("?", 1)[0]
+        for (entry_method, entry_url), candidate in self.entries.items():
+            if entry_url.split("?", 1)[0] == without_query and entry_method in (method, "GET"):
+                return candidate
+        return None
+
+
+@contextlib.contextmanager
+def _file_lock(path, timeout=60):
+    # Process'ler arası basit kilit (Windows'ta da çalışıyor): dosyayı O_EXCL ile oluşturabilen kilidi alıyor.
+    # Çöken bir worker'ın bıraktığı kilit timeout sonunda kırılıyor.
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            descriptor = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            if time.monotonic() >= deadline:
+                print(f"Breaking stale lock {path}")
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(path)
+                deadline = time.monotonic() + timeout
+            time.sleep(0.05)
+    try:
+        yield
+    finally:
+        os.close(descriptor)
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(path)
+
+
+def _origin(url):
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _may_navigate(command, params):
+    # Element cache'in navigasyon sınıflandırmasını kullanıyorum
+    if command in NAVIGATION_COMMANDS:
+        return True
+    return command in MAYBE_NAVIGATING_COMMANDS and (params is None or params.get("script") not in READ_ONLY_SCRIPTS)
+
+
+class FixtureRecorder:
+    # Record modunda testlerin dokunduğu sayfa, asset ve job API yanıtlarını arşive yazıyorum
+
+    def __init__(self, archive, base_url=None):
+        self.archive = archive
+        # Kaydedilen sitenin origin'i replay'de yerel sunucunun köküne karşılık geliyor
+        self.base_url = base_url or os.environ.get("BASE_URL", LIVE_BASE_URL)
+        self.captured = set()
+        self.missed = 0
+        # Tab modunda tüm tab'lar aynı kayıtçıyı kullanıyor
+        self._lock = threading.Lock()
+        # capture'ın kendi pencere geçişleri tekrar capture tetiklemesin diye thread başına bayrak tutuyorum
+        self._local = threading.local()
+
+    def start(self, driver, network_log):
+        # Sayfa değişse de gövdeler DevTools buffer'ında kalsın diye buffer'ı büyütüyorum
+        driver.execute_cdp_cmd("Network.enable", {"maxTotalBufferSize": 200 * 1024 * 1024,
+                                                  "maxResourceBufferSize": 50 * 1024 * 1024})
+        if getattr(driver, "_fixture_recorder", None) is self:
+            return
+        driver._fixture_recorder = self
+        original_execute = driver.execute
+
+        # Tıklamayla tetiklenen navigasyonlarda da önceki sayfanın gövdeleri kaybolmasın diye
+        # sayfayı değiştirebilecek her komuttan önce biten yanıtları topluyorum
+        def execute(driver_command, params=None):
+            if _may_navigate(driver_command, params) and not getattr(self._local, "capturing", False):
+                self._local.capturing = True
+                try:
+                    self.capture(driver, network_log)
+                except Exception as e:
+                    print(f"Error capturing responses before navigation: {e}")
+                finally:
+                    self._local.capturing = False
+            return original_execute(driver_command, params)
+
+        driver.execute = execute
+
+    def capture(self, driver, network_log):
+        with self._lock:
+            self._capture(driver, network_log)
+
+    def _capture(self, driver, network_log):
+        network_log.drain()
+        if self.archive.primary_origin is None:
+            self.archive.primary_origin = _origin(self.base_url)
+
+        # Yönlendirmeler aynı requestId'yi paylaşıyor, onları ham olaylardan alıyorum
+        for event in network_log.events:
+            if event["method"] != "Network.requestWillBeSent" or "redirectResponse" not in event["params"]:
+                continue
+            response = event["params"]["redirectResponse"]
+            key = ("redirect", response["url"])
+            if key not in self.captured and response["url"].startswith("http"):
+                self.archive.add("GET", response["url"], response["status"], response.get("headers", {}),
+                                 mime_type=response.get("mimeType", ""))
+                self.captured.add(key)
+
+        # Gövdeyi isteğin yapıldığı pencereden (webview) almak gerekiyor; View Role'ün açtığı Lever tab'ı gibi
+        # yeni pencerelerin yanıtları için o pencereye geçip sonra testin penceresine dönüyorum
+        pending = {}
+        for request in network_log.requests().values():
+            url = request.get("url", "")
+            if request["request_id"] in self.captured or "status" not in request or not url.startswith("http"):
+                continue
+            if "finished" not in request or request.get("failed"):
+                continue
+            pending.setdefault(request.get("webview"), []).append(request)
+        if not pending:
+            return
+
+        current_handle = driver.current_window_handle
+        handles = driver.window_handles
+        try:
+            for webview, requests in pending.items():
+                handle = next((handle for handle in handles
+                               if webview and handle.upper().endswith(webview.upper())), current_handle)
+                if handle != driver.current_window_handle:
+                    driver.switch_to.window(handle)
+                for request in requests:
+                    self._capture_body(driver, request)
+        finally:
+            if driver.current_window_handle != current_handle:
+                driver.switch_to.window(current_handle)
+
+    def _capture_body(self, driver, request):
+        try:
+            result = driver.execute_cdp_cmd("Network.getResponseBody", {"requestId": request["request_id"]})
+        except Exception:
+            # Gövde buffer'dan düşmüş ya da pencere kapanmış olabilir
+            self.missed += 1
+            return
+        body = result["body"]
+        body = base64.b64decode(body) if result.get("base64Encoded") else body.encode("utf-8")
+        self.archive.add(request.get("method", "GET"), request["url"], request["status"], request.get("headers", {}),
+                         body, request.get("mime_type", ""))
+        self.captured.add(request["request_id"])
+
+    def finish(self):
+        self.archive.save()
+        print(f"Recorded {len(self.archive.entries)} responses into {self.archive.path} "
+              f"({self.missed} bodies were no longer available)")
+
+
+class FixtureServer:
+    # Replay modu: arşivi yerel HTTP sunucusundan, isteğe bağlı gecikme ve bant genişliği ile sunuyorum
+
+    def __init__(self, archive, host="127.0.0.1", port=0, latency_ms=0, bandwidth_kbps=0):
+        self.archive = archive
+        self.latency = latency_ms / 1000.0
+        self.bandwidth = bandwidth_kbps * 1024 / 8  # byte/saniye
+        self.misses = []
+        self.httpd = ThreadingHTTPServer((host, port), self._handler_class())
+        self.httpd.daemon_threads = True
+        self.url = f"http://{host}:{self.httpd.server_address[1]}/"
+        self._thread = None
+        self._rewrites = self._build_rewrites()
+
+    @classmethod
+    def from_env(cls):
+        return cls(FixtureArchive(archive_path()),
+                   port=int(os.environ.get("FIXTURE_PORT", "0")),
+                   latency_ms=float(os.environ.get("FIXTURE_LATENCY_MS", "0")),
+                   bandwidth_kbps=float(os.environ.get("FIXTURE_BANDWIDTH_KBPS", "0")))
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def local_url(self, url):
+        # Kayıttaki gerçek URL'nin yerel karşılığı
+        origin = _origin(url)
+        rest = url[len(origin):] or "/"
+        if origin == self.archive.primary_origin:
+            return self.url.rstrip("/") + rest
+        scheme, host = origin.split("://", 1)
+        return f"{self.url.rstrip('/')}{ORIGIN_PREFIX}/{scheme}/{host}{rest}"
+
+    def original_url(self, path):
+        if path.startswith(ORIGIN_PREFIX + "/"):
+            scheme, host, rest = (path[len(ORIGIN_PREFIX) + 1:].split("/", 2) + ["", ""])[:3]
+            return f"{scheme}://{host}/{rest}"
+        return (self.archive.primary_origin or LIVE_BASE_URL.rstrip("/")) + path
+
+    def _build_rewrites(self):
+        # Gövdelerdeki kayıtlı origin'leri yerel adrese çeviren tek bir regex hazırlıyorum
+        replacements = {}
+        for origin in self.archive.origins():
+            local = self.local_url(origin + "/").rstrip("/")
+            scheme, host = origin.split("://", 1)
+            replacements[origin] = local
+            replacements[origin.replace("/", "\\/")] = local.replace("/", "\\/")
+            replacements[f"//{host}"] = "//" + local.split("://", 1)[1]
+        if not replacements:
+            return None
+        pattern = re.compile("|".join(re.escape(key) for key in sorted(replacements, key=len, reverse=True)))
+        return pattern, replacements
+
+    def rewrite(self, body, mime_type):
+        if self._rewrites is None or not mime_type.startswith(TEXT_MIME_TYPES):
+            return body
+        pattern, replacements = self._rewrites
+        text = body.decode("utf-8", errors="surrogateescape")
+        text = pattern.sub(lambda match: replacements[match.group(0)], text)
+        return text.encode("utf-8", errors="surrogateescape")
+
+    def _handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _serve(self, method):
+                url = server.original_url(self.path)
+                entry = server.archive.lookup(method, url)
+                if entry is None:
+                    server.misses.append(url)
+                    self._send(404 if method == "GET" else 204, {}, b"")
+                    return
+
+                body = server.rewrite(server.archive.body(entry), entry.get("mime_type", ""))
+                headers = {name: value for name, value in entry["headers"].items() if name not in DROPPED_HEADERS}
+                if "location" in headers:
+                    headers["location"] = server.local_url(headers["location"]) \
+                        if headers["location"].startswith("http") else headers["location"]
+                headers["access-control-allow-origin"] = "*"
+                self._send(entry["status"], headers, body if method != "HEAD" else b"")
+
+            def _send(self, status, headers, body):
+                if server.latency:
+                    time.sleep(server.latency)
+                self.send_response(status)
+                for name, value in headers.items():
+                    for line in str(value).split("\n"):
+                        self.send_header(name, line)
+                self.send_header("content-length", str(len(body)))
+                self.end_headers()
+                self._write_throttled(body)
+
+            def _write_throttled(self, body):
+                if not server.bandwidth:
+                    self.wfile.write(body)
+                    return
+                # Bant genişliğini 100ms'lik parçalarla simüle ediyorum
+                chunk_size = max(1, int(server.bandwidth / 10))
+                for offset in range(0, len(body), chunk_size):
+                    self.wfile.write(body[offset:offset + chunk_size])
+                    time.sleep(0.1)
+
+            def do_GET(self):
+                self._serve("GET")
+
+            def do_HEAD(self):
+                self._serve("HEAD")
+
+            def do_POST(self):
+                length = int(self.headers.get("content-length", 0))
+                self.rfile.read(length)
+                self._serve("POST")
+
+            def do_OPTIONS(self):
+                self._send(204, {"access-control-allow-origin": "*",
+                                 "access-control-allow-methods": "GET, POST, OPTIONS",
+                                 "access-control-allow-headers": "*"}, b"")
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def apply_replay_options(chrome_options):
+    # Replay'de gerçek ağa hiç çıkılmasın diye yerel sunucu dışındaki tüm host'ları çözümsüz bırakıyorum
+    chrome_options.add_argument("--host-resolver-rules=MAP * ~NOTFOUND, EXCLUDE 127.0.0.1")
+    return chrome_options
+
+
+_server = None
+
+
+def get_fixture_server():
+    # Process başına tek replay sunucusu açıyorum (paralel koşuda her worker kendi sunucusunu açıyor)
+    global _server
+    if _server is None:
+        _server = FixtureServer.from_env().start()
+        print(f"Serving fixtures from {_server.archive.path} at {_server.url}")
+    return _server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kayıtlı arşivi yerel HTTP sunucusundan sunar")
+    parser.add_argument("--archive", default=archive_path(), help="Arşiv klasörü")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Her yanıt için eklenen gecikme")
+    parser.add_argument("--bandwidth-kbps", type=float, default=0, help="Bant genişliği sınırı (0 = sınırsız)")
+    args = parser.parse_args(argv)
+
+    server = FixtureServer(FixtureArchive(args.archive), port=args.port,
+                           latency_ms=args.latency_ms, bandwidth_kbps=args.bandwidth_kbps)
+    print(f"Serving {len(server.archive.entries)} recorded responses at {server.url}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
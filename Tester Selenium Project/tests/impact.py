@@ -0,0 +1,567 @@
+import argparse
+import ast
+import fnmatch
+import glob
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import threading
+import time
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+DEFAULT_INDEX = os.environ.get("IMPACT_INDEX", os.path.join(project_root, "reports", "impact_index.json"))
+DEFAULT_RECORDS = os.environ.get("IMPACT_RECORDS", os.path.join(project_root, "reports", "impact_records.jsonl"))
+
+PAGES_DIR = os.path.join(project_root, "pages") + os.sep
+
+# Değişmesi hiçbir testin sonucunu etkilemeyen dosyalar
+IGNORED_PATTERNS = ("*.md", "*.pyc", "reports/*", "screenshots/*", "benchmarks/*", ".gitignore")
+
+# Statik referanslarda içinden geçilen (çağrılmayan, sadece okunan) sembol tipleri
+VALUE_KINDS = ("attribute", "class_attribute", "constant")
+
+HUNK_HEADER = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+\d+(?:,\d+)? @@")
+BINARY_DIFF = re.compile(r"^Binary files (?:a/)?(.+?) and (?:b/)?(.+) differ$")
+
+
+def impact_recording_enabled():
+    return os.environ.get("IMPACT_RECORD", "0") == "1"
+
+
+def _code_ranges(filename):
+    # Dosyadaki fonksiyon/metot ve sınıfların satır aralıkları, en dar aralık önce (iç içe olanlar içteki sembole düşsün)
+    symbols = _ModuleAnalyzer(filename).analyze().symbols
+    return sorted(((symbol["start"], symbol["end"], name) for name, symbol in symbols.items()
+                   if symbol["kind"] in ("function", "class")), key=lambda item: item[1] - item[0])
+
+
+def _symbol_for(ranges, first_line):
+    # Kodun ilk satırını (co_firstlineno; decorator varsa decorator satırı) içeren en dar sembol.
+    # İç fonksiyon, lambda ve comprehension'lar tanımlandıkları metoda düşüyor; modül seviyesi kod None.
+    for start, end, name in ranges:
+        if start <= first_line <= end:
+            return name
+    return None
+
+
+def _module_name(path):
+    relative = os.path.relpath(os.path.abspath(path), project_root)
+    return os.path.splitext(relative)[0].replace(os.sep, ".")
+
+
+class ImpactRecorder:
+    # Test sırasında çalışan page object fonksiyonlarını (sadece pages/ altındaki kod) sys.setprofile ile topluyorum.
+    # Profil thread başına kuruluyor; tab modunda aynı process'te paralel koşan testler birbirine karışmıyor.
+
+    _instance = None
+
+    def __init__(self, records_path=DEFAULT_RECORDS):
+        self.records_path = records_path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # Dosya -> sembol satır aralıkları (co_qualname 3.11'e özgü; satır numarasından ast ile çözüyorum)
+        self._ranges = {}
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def start(self):
+        called = set()
+        self._local.called = called
+
+        def profile(frame, event, arg):
+            if event == "call" and frame.f_code.co_filename.startswith(PAGES_DIR):
+                called.add(frame.f_code)
+
+        sys.setprofile(profile)
+
+    def stop(self, test_id):
+        sys.setprofile(None)
+        codes = getattr(self._local, "called", set())
+        self._local.called = set()
+        with self._lock:
+            for filename in {code.co_filename for code in codes} - set(self._ranges):
+                self._ranges[filename] = _code_ranges(filename)
+        symbols = sorted({symbol for symbol in (_symbol_for(self._ranges[code.co_filename], code.co_firstlineno)
+                                                for code in codes) if symbol is not None})
+        with self._lock:
+            os.makedirs(os.path.dirname(self.records_path) or ".", exist_ok=True)
+            with open(self.records_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps({"test": test_id, "symbols": symbols}) + "\n")
+        return symbols
+
+
+def get_impact_recorder():
+    # IMPACT_RECORD=1 değilse kayıt yapılmıyor
+    return ImpactRecorder.instance() if impact_recording_enabled() else None
+
+
+class _ModuleAnalyzer:
+    # Bir modüldeki sembolleri (fonksiyon, metot, sınıf, __init__'te atanan locator/attribute, modül sabiti)
+    # satır aralıklarıyla ve her sembolün okuduğu diğer sembollerle (referanslar) çıkarıyorum
+
+    def __init__(self, path):
+        self.path = path
+        self.module = _module_name(path)
+        with open(path, encoding="utf-8") as f:
+            self.source = f.read()
+        self.tree = ast.parse(self.source, filename=path)
+        self.symbols = {}
+        self.refs = {}
+        self.bases = {}
+        self.names = {}
+
+    def analyze(self):
+        self._add(self.module, "module", 1, len(self.source.splitlines()) or 1)
+        for node in self.tree.body:
+            if isinstance(node, ast.ImportFrom):
+                target = self._import_target(node)
+                for alias in node.names:
+                    if target is not None:
+                        self.names[alias.asname or alias.name] = f"{target}.{alias.name}"
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                self.names[node.name] = f"{self.module}.{node.name}"
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                for target in _assign_targets(node):
+                    if isinstance(target, ast.Name):
+                        self.names[target.id] = f"{self.module}.{target.id}"
+
+        for node in self.tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self._function(f"{self.module}.{node.name}", node, None)
+            elif isinstance(node, ast.ClassDef):
+                self._class(node)
+            elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+                for target in _assign_targets(node):
+                    if isinstance(target, ast.Name):
+                        name = f"{self.module}.{target.id}"
+                        self._add(name, "constant", node.lineno, node.end_lineno)
+                        self.refs[name] = self._references(node.value, None)
+        return self
+
+    def _import_target(self, node):
+        # Sadece proje içi importları çözüyorum (from .x import y, from pages.x import y)
+        if node.level:
+            package = self.module.rsplit(".", node.level)[0]
+            return f"{package}.{node.module}" if node.module else package
+        if node.module and node.module.split(".")[0] in ("pages", "tests"):
+            return node.module
+        return None
+
+    def _add(self, name, kind, start, end):
+        self.symbols[name] = {"file": os.path.relpath(self.path, project_root).replace(os.sep, "/"),
+                              "kind": kind, "start": start, "end": end}
+
+    def _class(self, node):
+        class_name = f"{self.module}.{node.name}"
+        start = min([node.lineno] + [decorator.lineno for decorator in node.decorator_list])
+        self._add(class_name, "class", start, node.end_lineno)
+        self.bases[class_name] = [self.names.get(base.id, base.id) for base in node.bases if isinstance(base, ast.Name)]
+        self.refs[class_name] = set()
+        for item in node.body:
+            if isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                self._function(f"{class_name}.{item.name}", item, class_name)
+            elif isinstance(item, (ast.Assign, ast.AnnAssign)):
+                for target in _assign_targets(item):
+                    if isinstance(target, ast.Name):
+                        name = f"{class_name}.{target.id}"
+                        self._add(name, "class_attribute", item.lineno, item.end_lineno)
+                        self.refs[name] = self._references(item.value, class_name)
+
+    def _function(self, name, node, class_name):
+        start = min([node.lineno] + [decorator.lineno for decorator in node.decorator_list])
+        self._add(name, "function", start, node.end_lineno)
+        body = []
+        for statement in node.body:
+            # __init__'teki self.x = ... satırları kendi sembolü (locator); __init__'in referansı sayılmıyor
+            attribute = _self_attribute_target(statement) if node.name == "__init__" and class_name else None
+            if attribute is None:
+                body.append(statement)
+                continue
+            attribute_name = f"{class_name}.{attribute}"
+            self._add(attribute_name, "attribute", statement.lineno, statement.end_lineno)
+            self.refs[attribute_name] = self._references(statement.value, class_name)
+        self.refs[name] = set()
+        for statement in body + node.args.defaults + node.decorator_list:
+            self.refs[name] |= self._references(statement, class_name)
+
+    def _references(self, node, class_name):
+        refs = set()
+        if node is None:
+            return refs
+        for child in ast.walk(node):
+            if isinstance(child, ast.Name) and isinstance(child.ctx, ast.Load) and child.id in self.names:
+                refs.add(self.names[child.id])
+            elif (class_name and isinstance(child, ast.Attribute) and isinstance(child.ctx, ast.Load)
+                  and isinstance(child.value, ast.Name) and child.value.id == "self"):
+                # self.x sınıf hiyerarşisinde sonradan çözülüyor
+                refs.add(f"self:{class_name}:{child.attr}")
+        return refs
+
+
+def _assign_targets(node):
+    return node.targets if isinstance(node, ast.Assign) else [node.target]
+
+
+def _self_attribute_target(statement):
+    if isinstance(statement, (ast.Assign, ast.AnnAssign)) and statement.value is not None:
+        targets = _assign_targets(statement)
+        if (len(targets) == 1 and isinstance(targets[0], ast.Attribute)
+                and isinstance(targets[0].value, ast.Name) and targets[0].value.id == "self"):
+            return targets[0].attr
+    return None
+
+
+def analyze_files(paths):
+    symbols, refs, bases = {}, {}, {}
+    for path in paths:
+        analyzer = _ModuleAnalyzer(path).analyze()
+        symbols.update(analyzer.symbols)
+        refs.update(analyzer.refs)
+        bases.update(analyzer.bases)
+
+    def resolve(ref):
+        if not ref.startswith("self:"):
+            return ref if ref in symbols else None
+        _, class_name, attribute = ref.split(":")
+        pending = [class_name]
+        while pending:
+            current = pending.pop(0)
+            if f"{current}.{attribute}" in symbols:
+                return f"{current}.{attribute}"
+            pending.extend(bases.get(current, []))
+        return None
+
+    return symbols, {name: sorted({resolved for resolved in map(resolve, targets) if resolved})
+                     for name, targets in refs.items()}
+
+
+def _ancestors(name, symbols):
+    parts = name.split(".")
+    return [".".join(parts[:end]) for end in range(1, len(parts)) if ".".join(parts[:end]) in symbols]
+
+
+def _dependencies(roots, symbols, refs):
+    # Çağrılan fonksiyonlar + okudukları locator/sabitler (locator başka locator'dan kuruluyorsa onlar da)
+    # + içinde bulundukları sınıf ve modül. Sınıf seviyesindeki ayarlar (ör. uncached_locators) alt sınıfta
+    # ezilebildiği için statik çözülemiyor; kullanılan sınıfın tüm sınıf attribute'larını ekliyorum.
+    dependencies = set()
+    pending = [root for root in roots if root in symbols]
+    while pending:
+        name = pending.pop()
+        if name in dependencies:
+            continue
+        dependencies.add(name)
+        for ancestor in _ancestors(name, symbols):
+            if ancestor not in dependencies and symbols[ancestor]["kind"] == "class":
+                pending.extend(child for child, symbol in symbols.items()
+                               if symbol["kind"] == "class_attribute" and child.startswith(ancestor + "."))
+            dependencies.add(ancestor)
+        for ref in refs.get(name, []):
+            if symbols[ref]["kind"] in VALUE_KINDS:
+                pending.append(ref)
+    return dependencies
+
+
+def _file_digest(content):
+    return hashlib.sha1(content if isinstance(content, bytes) else content.encode("utf-8")).hexdigest()
+
+
+def _read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _git(*args):
+    return subprocess.run(["git", *args], cwd=project_root, capture_output=True, check=True).stdout
+
+
+def page_files():
+    return sorted(glob.glob(os.path.join(project_root, "pages", "*.py")))
+
+
+def build_index(records, test_ids, always_run=()):
+    # records: {test id: [kayıtta çağrılan semboller]}. Kaydı olmayan ve always_run'da olan testler her seçimde koşuyor.
+    test_files = sorted({os.path.join(project_root, *test_id.split(".")[:-2]) + ".py" for test_id in test_ids})
+    files = page_files() + [path for path in test_files if os.path.exists(path)]
+    symbols, refs = analyze_files(files)
+
+    tests = {}
+    for test_id in test_ids:
+        if test_id not in records and test_id in always_run:
+            tests[test_id] = None
+            continue
+        class_name = test_id.rsplit(".", 1)[0]
+        # Testin kendi metodu, sınıfındaki test olmayan üyeler (setUp, yardımcılar) ve okuduğu modül sabitleri
+        roots = {test_id} | set(refs.get(test_id, [])) | {
+            name for name in symbols
+            if name.startswith(class_name + ".") and not name[len(class_name) + 1:].startswith("test")}
+        roots |= set(records.get(test_id, []))
+        tests[test_id] = sorted(_dependencies(roots, symbols, refs))
+
+    try:
+        commit = _git("rev-parse", "HEAD").decode().strip()
+    except Exception:
+        commit = None
+    return {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "commit": commit,
+        "files": {os.path.relpath(path, project_root).replace(os.sep, "/"): _file_digest(_read_bytes(path))
+                  for path in files},
+        "symbols": symbols,
+        "tests": tests,
+    }
+
+
+def load_records(path=DEFAULT_RECORDS):
+    # Aynı test birden fazla koşulduysa (farklı dallar) sembolleri birleştiriyorum
+    records = {}
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    records.setdefault(entry["test"], set()).update(entry["symbols"])
+    return {test_id: sorted(symbols) for test_id, symbols in records.items()}
+
+
+def load_index(path=DEFAULT_INDEX):
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def parse_diff(diff_text):
+    # Unified diff -> {dosya: eski taraftaki değişen satırlar (None = tüm dosya)}
+    prefix = _git_prefix()
+    changes = {}
+    old_path = None
+    for line in diff_text.splitlines():
+        if line.startswith("--- "):
+            old_path = _diff_path(line[4:], prefix)
+        elif line.startswith("+++ "):
+            new_path = _diff_path(line[4:], prefix)
+            # Yeni dosyanın eski tarafı yok; silinen dosyanın yeni tarafı yok
+            if old_path is None:
+                changes.setdefault(new_path, None)
+            else:
+                changes.setdefault(old_path, set())
+                if new_path not in (None, old_path):
+                    changes.setdefault(new_path, None)
+        elif line.startswith("@@") and old_path is not None:
+            match = HUNK_HEADER.match(line)
+            if match and changes.get(old_path) is not None:
+                start, count = int(match.group(1)), int(match.group(2) if match.group(2) is not None else 1)
+                # Sadece ekleme yapan hunk: eklenen yerin önü ve arkası
+                changes[old_path].update(range(start, start + count) if count else (start, start + 1))
+        elif line.startswith("rename from "):
+            # İçeriği değişmeden taşınan dosya
+            changes[_diff_path(line[len("rename from "):], prefix)] = None
+        else:
+            binary = BINARY_DIFF.match(line)
+            if binary:
+                for path in binary.groups():
+                    path = _diff_path(path, prefix)
+                    if path is not None:
+                        changes[path] = None
+    return changes
+
+
+def _diff_path(value, prefix):
+    value = value.split("\t")[0].strip().strip('"')
+    if value == "/dev/null":
+        return None
+    if value[:2] in ("a/", "b/"):
+        value = value[2:]
+    # Depo kökünden alınmış diff'lerde proje klasörünü atıyorum
+    if prefix and value.startswith(prefix):
+        value = value[len(prefix):]
+    return value
+
+
+def _git_prefix():
+    try:
+        return _git("rev-parse", "--show-prefix").decode().strip()
+    except Exception:
+        return ""
+
+
+def git_changes(base):
+    # base ile çalışma dizini arasındaki farklar (commit edilmemiş değişiklikler dahil)
+    return parse_diff(_git("diff", "-U0", "--relative", base, "--", ".").decode("utf-8", "replace"))
+
+
+def stale_reason(index, base=None, changed_files=()):
+    # Index kaydedildiği kaynaklarla uyuşmuyorsa eşleme güvenilmez, tüm suite koşuyor
+    if index is None:
+        return "no dependency index (run the suite with IMPACT_RECORD=1 and 'python -m tests.impact build')"
+    if base is not None:
+        try:
+            listed = _git("ls-tree", "--name-only", base, "pages/").decode().split()
+        except Exception as e:
+            return f"cannot read {base}: {e}"
+        present = {path for path in listed if path.endswith(".py")}
+    else:
+        present = {os.path.relpath(path, project_root).replace(os.sep, "/") for path in page_files()}
+        present -= set(changed_files)
+    missing = present - set(index["files"])
+    if missing:
+        return f"{sorted(missing)[0]} is not in the index"
+    for path, digest in index["files"].items():
+        if base is None and path in changed_files:
+            continue
+        try:
+            if base is not None:
+                content = _git("show", f"{base}:./{path}")
+            else:
+                content = _read_bytes(os.path.join(project_root, path))
+        except Exception:
+            return f"{path} no longer exists"
+        if _file_digest(content) != digest:
+            return f"{path} changed since the index was built"
+    return None
+
+
+def changed_symbols(index, changes):
+    # Değişen satırı içeren en dar sembol (locator satırı -> locator, metot gövdesi -> metot, import -> modül)
+    symbols_by_file = {}
+    for name, symbol in index["symbols"].items():
+        symbols_by_file.setdefault(symbol["file"], []).append((symbol["end"] - symbol["start"], name, symbol))
+    changed = set()
+    for path, lines in changes.items():
+        candidates = sorted(symbols_by_file.get(path, []))
+        if lines is None:
+            changed.update(name for _, name, _ in candidates)
+            continue
+        for line in lines:
+            for _, name, symbol in candidates:
+                if symbol["start"] <= line <= symbol["end"]:
+                    changed.add(name)
+                    break
+    return changed
+
+
+def select_tests(index, suite_ids, changes=None, symbols=()):
+    # Dönüş: (seçilen test id'leri, tüm suite'e dönülme sebebi ya da None)
+    changes = changes or {}
+    for path in changes:
+        if path in index["files"] or any(fnmatch.fnmatch(path, pattern) for pattern in IGNORED_PATTERNS):
+            continue
+        # Yeni page object modülünü ancak değişen başka kod kullanabilir; o değişiklik zaten yakalanıyor
+        if path.startswith("pages/") and path.endswith(".py") and changes[path] is None:
+            continue
+        return list(suite_ids), f"{path} is not covered by the index"
+
+    changed = changed_symbols(index, changes)
+    for symbol in symbols:
+        matches = [name for name in index["symbols"] if name == symbol or name.endswith("." + symbol)]
+        if not matches:
+            return list(suite_ids), f"unknown symbol {symbol}"
+        changed.update(matches)
+
+    selected = []
+    for test_id in suite_ids:
+        dependencies = index["tests"].get(test_id, "new")
+        # Index'te olmayan (yeni) ve kaydı olmayan testler her zaman koşuyor
+        if dependencies in ("new", None) or changed.intersection(dependencies):
+            selected.append(test_id)
+    return selected, None
+
+
+def _always_run(test_ids, records):
+    # Tarayıcı kullanan (BaseTest) ama kaydı olmayan testlerin bağımlılığı bilinmiyor
+    import unittest
+    from tests.base_test import BaseTest
+
+    always_run = set()
+    for test_id in test_ids:
+        if test_id in records:
+            continue
+        test = next(iter(unittest.TestLoader().loadTestsFromName(test_id)))
+        if isinstance(test, BaseTest):
+            always_run.add(test_id)
+    return always_run
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Değişikliğin etkilediği testleri page object bağımlılıklarından seçer")
+    parser.add_argument("--index", default=DEFAULT_INDEX, help="Bağımlılık index dosyası")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="IMPACT_RECORD=1 koşusunun kayıtlarından index oluştur")
+    select_parser = commands.add_parser("select", help="Değişiklikten etkilenen testleri yazdır (veya koş)")
+    for sub in (build_parser, select_parser):
+        sub.add_argument("modules", nargs="*", default=["tests.tests"])
+    build_parser.add_argument("--records", default=DEFAULT_RECORDS, help="Test koşusunun kayıt dosyası")
+    source = select_parser.add_mutually_exclusive_group()
+    source.add_argument("--base", help="Bu revizyona göre git diff (ör. origin/main)")
+    source.add_argument("--diff", help="Unified diff dosyası ('-' = stdin)")
+    source.add_argument("--files", nargs="+", help="Değişen dosyalar (proje köküne göre)")
+    select_parser.add_argument("--symbols", nargs="+", default=[],
+                               help="Değişen metot/locator'lar, ör. HomePage.click_company_menu CareersPage.location_filter")
+    select_parser.add_argument("--run", action="store_true", help="Seçilen testleri paralel koşucuyla koş")
+    select_parser.add_argument("-w", "--workers", type=int, default=int(os.environ.get("TEST_WORKERS", "2")))
+    args = parser.parse_args(argv)
+
+    from tests.parallel_runner import collect_test_ids
+
+    suite_ids = collect_test_ids(args.modules)
+
+    if args.command == "build":
+        records = load_records(args.records)
+        index = build_index(records, suite_ids, _always_run(suite_ids, records))
+        os.makedirs(os.path.dirname(args.index) or ".", exist_ok=True)
+        with open(args.index, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        unrecorded = [test_id for test_id, dependencies in index["tests"].items() if dependencies is None]
+        print(f"Indexed {len(index['tests'])} tests and {len(index['symbols'])} symbols: {args.index}")
+        for test_id in unrecorded:
+            print(f"  no recording for {test_id}, it will always run")
+        return 0
+
+    if args.base:
+        changes = git_changes(args.base)
+    elif args.diff:
+        if args.diff == "-":
+            changes = parse_diff(sys.stdin.read())
+        else:
+            with open(args.diff, encoding="utf-8") as f:
+                changes = parse_diff(f.read())
+    else:
+        changes = {path: None for path in args.files or []}
+
+    index = load_index(args.index)
+    reason = stale_reason(index, args.base, changes if not args.base else ())
+    if reason is None:
+        selected, reason = select_tests(index, suite_ids, changes, args.symbols)
+    if reason is not None:
+        selected = suite_ids
+        print(f"Running full suite: {reason}", file=sys.stderr)
+    else:
+        print(f"Selected {len(selected)} of {len(suite_ids)} tests", file=sys.stderr)
+
+    if not args.run:
+        print("\n".join(selected))
+        return 0
+    if not selected:
+        print("No affected tests")
+        return 0
+
+    from tests.parallel_runner import print_report, run_parallel
+    report = run_parallel(selected, args.workers)
+    print_report(report)
+    return 0 if not (report["summary"]["fail"] or report["summary"]["error"]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,188 @@
+import argparse
+import http.client
+import json
+import os
+import queue
+import ssl
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlsplit
+
+DEFAULT_CONCURRENCY = int(os.environ.get("LINK_CHECK_CONCURRENCY", "8"))
+DEFAULT_PER_HOST = int(os.environ.get("LINK_CHECK_PER_HOST", "4"))
+DEFAULT_TIMEOUT = float(os.environ.get("LINK_CHECK_TIMEOUT", "10"))
+MAX_REDIRECTS = 10
+
+# Testlerdeki View Role kontrolü: "http" tüm linkleri HTTP ile çözüyor, "browser" ilk butona tıklıyor, "both" ikisi birden
+VIEW_ROLE_CHECK = os.environ.get("VIEW_ROLE_CHECK", "http")
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120 Safari/537.36"
+
+
+class ConnectionPool:
+    # Host başına keep-alive bağlantıları tekrar kullanıyorum; aynı host'a en fazla per_host istek aynı anda gidiyor
+
+    def __init__(self, per_host=DEFAULT_PER_HOST, timeout=DEFAULT_TIMEOUT):
+        self.per_host = per_host
+        self.timeout = timeout
+        self.ssl_context = ssl.create_default_context()
+        self._idle = {}
+        self._limits = {}
+        self._lock = threading.Lock()
+        self.opened = 0
+
+    def _host_state(self, key):
+        with self._lock:
+            if key not in self._limits:
+                self._limits[key] = threading.BoundedSemaphore(self.per_host)
+                self._idle[key] = queue.LifoQueue()
+            return self._limits[key], self._idle[key]
+
+    def _connect(self, scheme, netloc):
+        with self._lock:
+            self.opened += 1
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=self.timeout, context=self.ssl_context)
+        return http.client.HTTPConnection(netloc, timeout=self.timeout)
+
+    def request(self, method, url):
+        # (status, headers) döndürüyorum; gövdeyi okuyup atıyorum ki bağlantı tekrar kullanılabilsin
+        parts = urlsplit(url)
+        key = (parts.scheme, parts.netloc)
+        limit, idle = self._host_state(key)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        with limit:
+            try:
+                connection = idle.get_nowait()
+                reused = True
+            except queue.Empty:
+                connection = self._connect(*key)
+                reused = False
+            try:
+                connection.request(method, path, headers={"User-Agent": USER_AGENT, "Accept": "*/*"})
+                response = connection.getresponse()
+            except (http.client.HTTPException, ConnectionError, TimeoutError):
+                connection.close()
+                if not reused:
+                    raise
+                # Sunucu idle bağlantıyı kapatmış olabilir, yeni bağlantıyla bir kez daha deniyorum
+                connection = self._connect(*key)
+                connection.request(method, path, headers={"User-Agent": USER_AGENT, "Accept": "*/*"})
+                response = connection.getresponse()
+            response.read()
+            headers = {name.lower(): value for name, value in response.getheaders()}
+            if response.will_close:
+                connection.close()
+            else:
+                idle.put(connection)
+            return response.status, headers
+
+    def close(self):
+        with self._lock:
+            for idle in self._idle.values():
+                while not idle.empty():
+                    idle.get_nowait().close()
+
+
+class LinkChecker:
+    # Linkleri tarayıcı açmadan, sınırlı eşzamanlılıkla ve redirect'leri elle takip ederek çözüyorum
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, per_host=DEFAULT_PER_HOST, timeout=DEFAULT_TIMEOUT,
+                 max_redirects=MAX_REDIRECTS):
+        self.concurrency = concurrency
+        self.max_redirects = max_redirects
+        self.pool = ConnectionPool(per_host, timeout)
+
+    def resolve(self, url):
+        started = time.perf_counter()
+        result = {"url": url, "final_url": url, "final_host": urlsplit(url).hostname, "status": None,
+                  "redirects": [], "error": None}
+        current = url
+        method = "HEAD"
+        try:
+            while True:
+                status, headers = self.pool.request(method, current)
+                # HEAD desteklemeyen sunucular için GET'e düşüyorum
+                if status in (405, 501) and method == "HEAD":
+                    method = "GET"
+                    continue
+                if status in (301, 302, 303, 307, 308) and "location" in headers:
+                    if len(result["redirects"]) >= self.max_redirects:
+                        result["error"] = f"Too many redirects (>{self.max_redirects})"
+                        break
+                    current = urljoin(current, headers["location"])
+                    result["redirects"].append(current)
+                    continue
+                result["status"] = status
+                break
+        except Exception as e:
+            result["error"] = f"{type(e).__name__}: {e}"
+        result["final_url"] = current
+        result["final_host"] = urlsplit(current).hostname
+        result["elapsed"] = round(time.perf_counter() - started, 3)
+        return result
+
+    def check(self, urls):
+        # Aynı link birden fazla ilanda olabilir, her URL'yi bir kez çözüyorum; sonuç sırası giriş sırası
+        unique = list(dict.fromkeys(urls))
+        if not unique:
+            return []
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(unique)),
+                                thread_name_prefix="link-check") as executor:
+            resolved = dict(zip(unique, executor.map(self.resolve, unique)))
+        return [resolved[url] for url in urls]
+
+    def close(self):
+        self.pool.close()
+
+
+def failed_links(results, expected_host):
+    # Hata alan, 2xx/3xx dışında biten ya da beklenen host'a gitmeyen linkler
+    expected_host = expected_host.lower()
+    return [result for result in results
+            if result["error"] or not result["status"] or result["status"] >= 400
+            or expected_host not in (result["final_host"] or "").lower()]
+
+
+def print_results(results):
+    for result in results:
+        outcome = result["error"] or result["status"]
+        print(f"  {result['url']} -> {result['final_host']} [{outcome}] "
+              f"({len(result['redirects'])} redirects, {result['elapsed']}s)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Linkleri HTTP seviyesinde, eşzamanlı olarak çözüp son host'u raporlar")
+    parser.add_argument("urls", nargs="*", help="Kontrol edilecek URL'ler (verilmezse stdin'den satır satır)")
+    parser.add_argument("--expect-host", default="lever", help="Son URL'nin host'unda aranacak metin")
+    parser.add_argument("-c", "--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--per-host", type=int, default=DEFAULT_PER_HOST)
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT)
+    parser.add_argument("--report", help="JSON raporun yolu")
+    args = parser.parse_args(argv)
+
+    urls = args.urls or [line.strip() for line in sys.stdin if line.strip()]
+    checker = LinkChecker(args.concurrency, args.per_host, args.timeout)
+    started = time.perf_counter()
+    try:
+        results = checker.check(urls)
+    finally:
+        checker.close()
+    print_results(results)
+    failed = failed_links(results, args.expect_host)
+    print(f"Checked {len(results)} links in {time.perf_counter() - started:.2f}s "
+          f"({checker.pool.opened} connections), {len(failed)} failed")
+
+    if args.report:
+        os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
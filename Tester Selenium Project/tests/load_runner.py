@@ -0,0 +1,376 @@
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+import time
+from urllib.parse import urljoin
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from pages.careers_page import CareersPage
+from pages.home_page import HomePage
+from pages.timeout_budget import TimeoutBudget, activate_budget, deactivate_budget
+from selenium import webdriver
+from tests.benchmark import percentile
+from tests.browser_metrics import MemorySampler
+from tests.driver_manager import DriverManager
+from tests.start_state import close_extra_windows, origin_of, reset_state
+
+DEFAULT_USERS = int(os.environ.get("LOAD_USERS", "5"))
+DEFAULT_DURATION = float(os.environ.get("LOAD_DURATION", "60"))
+DEFAULT_RAMP_UP = float(os.environ.get("LOAD_RAMP_UP", "10"))
+
+# Raporlanan gecikme yüzdelikleri
+PERCENTILES = (0.5, 0.9, 0.95, 0.99)
+
+
+class VirtualUser:
+    # Kendi headless Chrome oturumu olan sanal kullanıcı; adımlar fonksiyonel testlerin page object'lerini kullanıyor
+
+    def __init__(self, index, driver_manager, base_url):
+        self.index = index
+        self.driver_manager = driver_manager
+        self.base_url = base_url
+        self._careers_page = None
+        self._session_driver = None
+        self.original_handle = None
+
+    @property
+    def driver(self):
+        return self.driver_manager.driver
+
+    def open(self, path=""):
+        self.driver.get(urljoin(self.base_url, path))
+
+    def home_page(self):
+        return HomePage(self.driver)
+
+    def careers_page(self):
+        # View Role adımı click_view_role_button'ın kaydettiği pencere listesine bakıyor, journey boyunca aynı nesne
+        if self._careers_page is None or self._careers_page.driver is not self.driver:
+            self._careers_page = CareersPage(self.driver)
+        return self._careers_page
+
+    def start_session(self):
+        # Oturumun ilk penceresini journey pencere açmadan önce kaydediyorum; oturum yenilenince (recycle) tekrar
+        driver = self.driver
+        if self._session_driver is not driver:
+            self._session_driver = driver
+            self.original_handle = driver.current_window_handle
+
+    def reset(self):
+        # Sonraki journey yeni bir ziyaretçi gibi başlasın: ek pencereler kapanıyor, cookie/storage siliniyor
+        driver = self.driver
+        close_extra_windows(driver, self.original_handle)
+        reset_state(driver, {origin_of(self.base_url)})
+        self._careers_page = None
+
+
+def _open_home(user):
+    user.open("")
+    return user.home_page().is_homepage_loaded()
+
+
+def _open_qa_page(user):
+    user.open("careers/quality-assurance/")
+    return "quality-assurance" in user.driver.current_url.lower()
+
+
+def _see_all_qa_jobs(user):
+    careers_page = user.careers_page()
+    return (careers_page.click_see_all_qa_jobs() and careers_page.wait_for_url_matches("open-positions")
+            and careers_page.wait_for_jobs_to_load())
+
+
+def _filter_jobs(user):
+    careers_page = user.careers_page()
+    return (careers_page.filter_by_location("Istanbul, Turkiye")
+            and careers_page.filter_by_department("Quality Assurance")
+            and careers_page.verify_job_list_present())
+
+
+def _view_role(user):
+    careers_page = user.careers_page()
+    careers_page.wait_for_job_list_update()
+    return careers_page.click_view_role_button() and careers_page.verify_redirect_to_lever()
+
+
+# Journey adı -> sıralı (adım adı, fonksiyon) listesi. Fonksiyon başarısızlıkta False döndürüyor ya da hata veriyor.
+JOURNEYS = {
+    "careers_navigation": [
+        ("home load", _open_home),
+        ("company menu click", lambda user: user.home_page().click_company_menu()),
+        ("careers navigation", lambda user: user.home_page().click_careers_link()),
+        ("careers blocks check", lambda user: user.careers_page().verify_careers_page_blocks()),
+    ],
+    "qa_jobs": [
+        ("qa page load", _open_qa_page),
+        ("see all qa jobs", _see_all_qa_jobs),
+        ("filter application", _filter_jobs),
+        ("view role redirect", _view_role),
+    ],
+}
+
+
+class LoadStats:
+    # Tüm sanal kullanıcıların adım ve journey ölçümleri (thread-safe)
+
+    def __init__(self, bucket_seconds=10):
+        self.bucket_seconds = bucket_seconds
+        self.lock = threading.Lock()
+        self.started = time.perf_counter()
+        self.steps = {}
+        self.journeys = {}
+        self.errors = {}
+        self.timeline = {}
+
+    def record_step(self, name, seconds, error=None):
+        with self.lock:
+            entry = self.steps.setdefault(name, {"samples": [], "errors": 0})
+            bucket = self.timeline.setdefault(int((time.perf_counter() - self.started) // self.bucket_seconds),
+                                              {"steps": 0, "errors": 0})
+            bucket["steps"] += 1
+            if error is None:
+                entry["samples"].append(seconds)
+                return
+            entry["errors"] += 1
+            bucket["errors"] += 1
+            key = f"{name}: {error}"
+            self.errors[key] = self.errors.get(key, 0) + 1
+
+    def record_journey(self, name, seconds, ok):
+        with self.lock:
+            entry = self.journeys.setdefault(name, {"samples": [], "errors": 0})
+            if ok:
+                entry["samples"].append(seconds)
+            else:
+                entry["errors"] += 1
+
+    def summary(self, elapsed):
+        def describe(entry):
+            samples = entry["samples"]
+            total = len(samples) + entry["errors"]
+            row = {
+                "count": total,
+                "errors": entry["errors"],
+                "error_rate": round(entry["errors"] / total, 4) if total else 0.0,
+                "throughput_per_min": round(len(samples) / elapsed * 60, 2) if elapsed else 0.0,
+                "max": round(max(samples), 3) if samples else None,
+            }
+            for fraction in PERCENTILES:
+                value = percentile(samples, fraction)
+                row[f"p{int(fraction * 100)}"] = round(value, 3) if value is not None else None
+            return row
+
+        with self.lock:
+            return {
+                "journeys": {name: describe(entry) for name, entry in self.journeys.items()},
+                "steps": {name: describe(entry) for name, entry in self.steps.items()},
+                "errors": dict(sorted(self.errors.items(), key=lambda item: item[1], reverse=True)),
+                "timeline": [dict(bucket, second=index * self.bucket_seconds)
+                             for index, bucket in sorted(self.timeline.items())],
+            }
+
+
+def _error_text(error):
+    # Aynı hatalar gruplanabilsin diye sadece tipi ve ilk satırı tutuyorum
+    message = str(error).strip().splitlines()
+    return f"{type(error).__name__}: {message[0]}" if message else type(error).__name__
+
+
+def run_journey(user, name, stats, think_time, stop, step_timeout):
+    steps = JOURNEYS[name]
+    started = time.perf_counter()
+    for position, (step, function) in enumerate(steps):
+        # Her adımın beklemeleri step_timeout ile sınırlı (yük altında takılan adım kullanıcıyı kilitlemesin)
+        activate_budget(TimeoutBudget(step_timeout, name=f"{name}::{step}"))
+        step_started = time.perf_counter()
+        try:
+            ok = function(user)
+            error = None if ok else "step returned False"
+        except Exception as e:
+            error = _error_text(e)
+        finally:
+            deactivate_budget()
+        stats.record_step(f"{name}::{step}", time.perf_counter() - step_started, error)
+        if error is not None:
+            stats.record_journey(name, time.perf_counter() - started, False)
+            return False
+        # Düşünme süresi gecikmeye katılmıyor
+        if position < len(steps) - 1 and think_time[1] > 0:
+            started += _think(think_time, stop)
+    stats.record_journey(name, time.perf_counter() - started, True)
+    return True
+
+
+def _think(think_time, stop):
+    seconds = random.uniform(*think_time)
+    thinking_started = time.perf_counter()
+    stop.wait(seconds)
+    return time.perf_counter() - thinking_started
+
+
+def _virtual_user(index, journeys, options, stats, stop, base_url, deadline, driver_metrics):
+    from tests.base_test import build_chrome_options
+
+    def factory():
+        # Log'ları kimse okumadığı için uzun koşuda chromedriver'da birikmesin
+        chrome_options = build_chrome_options(headless=True, collect_logs=False)
+        driver = webdriver.Chrome(options=chrome_options)
+        driver.implicitly_wait(0)
+        return driver
+
+    # Kullanıcılar ramp-up süresine eşit aralıklarla yayılarak başlıyor
+    if stop.wait(options["ramp_up"] * index / options["users"]):
+        return
+    manager = DriverManager.from_env(factory)
+    user = VirtualUser(index, manager, base_url)
+    try:
+        iteration = 0
+        while not stop.is_set() and time.perf_counter() < deadline:
+            # Journey karışımı kullanıcıya göre kaydırılıyor, böylece aynı anda farklı akışlar koşuyor
+            name = journeys[(index + iteration) % len(journeys)]
+            iteration += 1
+            try:
+                user.start_session()
+            except Exception as e:
+                stats.record_step("session start", 0.0, _error_text(e))
+                return
+            run_journey(user, name, stats, options["think_time"], stop, options["step_timeout"])
+            try:
+                user.reset()
+            except Exception as e:
+                print(f"[user-{index}] Error resetting session: {e}")
+            manager.after_test()
+            if options["think_time"][1] > 0:
+                _think(options["think_time"], stop)
+    finally:
+        driver_metrics.append(manager.metrics())
+        manager.quit()
+
+
+def run_load(users=DEFAULT_USERS, duration=DEFAULT_DURATION, ramp_up=DEFAULT_RAMP_UP, think_time=(1.0, 3.0),
+             journeys=tuple(JOURNEYS), step_timeout=30, base_url=None, bucket_seconds=10):
+    if base_url is None:
+        from tests.base_test import resolve_base_url
+        base_url = resolve_base_url()
+    options = {"users": max(1, users), "ramp_up": ramp_up, "think_time": think_time, "step_timeout": step_timeout}
+    stats = LoadStats(bucket_seconds)
+    stop = threading.Event()
+    driver_metrics = []
+    print(f"Load run: {options['users']} users, ramp-up {ramp_up}s, duration {duration}s, "
+          f"think time {think_time[0]}-{think_time[1]}s against {base_url}")
+
+    sampler = MemorySampler().start()
+    started = time.perf_counter()
+    # Süre ramp-up dahil; süre dolunca yeni journey başlamıyor, başlamış olanlar bitiyor
+    deadline = started + duration
+    threads = [
+        threading.Thread(target=_virtual_user, name=f"user-{index}",
+                         args=(index, list(journeys), options, stats, stop, base_url, deadline, driver_metrics))
+        for index in range(options["users"])
+    ]
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        print("Stopping virtual users...")
+        stop.set()
+        for thread in threads:
+            thread.join()
+    elapsed = time.perf_counter() - started
+
+    summary = stats.summary(elapsed)
+    journeys_total = sum(row["count"] for row in summary["journeys"].values())
+    journey_errors = sum(row["errors"] for row in summary["journeys"].values())
+    return dict({
+        "base_url": base_url,
+        "users": options["users"],
+        "ramp_up": ramp_up,
+        "duration": duration,
+        "think_time": list(think_time),
+        "wall_time": round(elapsed, 3),
+        "journeys_completed": journeys_total - journey_errors,
+        "error_rate": round(journey_errors / journeys_total, 4) if journeys_total else 0.0,
+        "throughput_per_min": round((journeys_total - journey_errors) / elapsed * 60, 2) if elapsed else 0.0,
+        "memory": sampler.stop(),
+        "driver": {
+            "starts": sum(metrics["starts"] for metrics in driver_metrics),
+            "start_failures": sum(metrics["start_failures"] for metrics in driver_metrics),
+            "recycles": sum(metrics["recycles"] for metrics in driver_metrics),
+        },
+    }, **summary)
+
+
+def print_load_report(report):
+    print("=" * 100)
+    print(f"{'step':<50} {'count':>6} {'err%':>6} {'/min':>7} {'p50':>7} {'p90':>7} {'p95':>7} {'p99':>7}")
+    for section in ("journeys", "steps"):
+        for name, row in sorted(report[section].items()):
+            values = " ".join("      -" if row[key] is None else f"{row[key]:7.2f}"
+                              for key in ("p50", "p90", "p95", "p99"))
+            print(f"{name:<50} {row['count']:>6} {row['error_rate'] * 100:>6.1f} "
+                  f"{row['throughput_per_min']:>7.1f} {values}")
+        print("-" * 100)
+    for message, count in list(report["errors"].items())[:10]:
+        print(f"{count:>5}x {message}")
+    memory = report["memory"]
+    print(f"{report['users']} users, {report['journeys_completed']} journeys in {report['wall_time']}s "
+          f"({report['throughput_per_min']} journeys/min, error rate {report['error_rate'] * 100:.1f}%)")
+    if memory["peak_rss_mb"] is not None:
+        print(f"Peak memory: RSS {memory['peak_rss_mb']}MB, PSS {memory['peak_pss_mb']}MB")
+    print(f"Chrome sessions: {report['driver']['starts']} started, {report['driver']['start_failures']} failed starts, "
+          f"{report['driver']['recycles']} recycled")
+
+
+def _think_range(value):
+    # "2" ya da "1-3" (saniye)
+    low, _, high = value.partition("-")
+    return (float(low), float(high or low))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Page object journey'lerini çok sayıda eşzamanlı headless oturumla koşan yük modu")
+    parser.add_argument("-u", "--users", type=int, default=DEFAULT_USERS, help="Eşzamanlı sanal kullanıcı sayısı")
+    parser.add_argument("-d", "--duration", type=float, default=DEFAULT_DURATION,
+                        help="Toplam süre, ramp-up dahil (saniye)")
+    parser.add_argument("-r", "--ramp-up", type=float, default=DEFAULT_RAMP_UP,
+                        help="Tüm kullanıcıların başlaması için geçen süre (saniye)")
+    parser.add_argument("-t", "--think-time", type=_think_range, default=(1.0, 3.0),
+                        help="Adımlar arası düşünme süresi, ör. 2 ya da 1-3 (saniye)")
+    parser.add_argument("-j", "--journey", action="append", choices=sorted(JOURNEYS),
+                        help="Koşulacak journey (tekrarlanabilir, varsayılan: hepsi)")
+    parser.add_argument("--step-timeout", type=float, default=30, help="Adım başına bekleme bütçesi (saniye)")
+    parser.add_argument("--base-url", help="Yerel sunucu yerine başka bir hedef (varsayılan: replay fixture sunucusu)")
+    parser.add_argument("--bucket", type=int, default=10, help="Zaman çizelgesi aralığı (saniye)")
+    parser.add_argument("--max-error-rate", type=float, default=0.05,
+                        help="Journey hata oranı bunu aşarsa exit code 1")
+    parser.add_argument("--report", default="reports/load_report.json")
+    args = parser.parse_args(argv)
+
+    # Yük canlı siteye değil, kayıtlı arşivi sunan yerel sunucuya gidiyor
+    if args.base_url is None:
+        os.environ["FIXTURE_MODE"] = "replay"
+
+    report = run_load(args.users, args.duration, args.ramp_up, args.think_time, args.journey or tuple(JOURNEYS),
+                      args.step_timeout, args.base_url, args.bucket)
+    os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print_load_report(report)
+    print(f"Report saved: {args.report}")
+    if not report["journeys_completed"]:
+        return 1
+    return 1 if report["error_rate"] > args.max_error_rate else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
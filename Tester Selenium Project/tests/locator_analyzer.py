@@ -0,0 +1,200 @@
+import argparse
+import json
+import os
+import sys
+from urllib.parse import urljoin
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from selenium.webdriver.common.by import By
+
+from pages.base_page import locator_to_query
+from pages.careers_page import CareersPage
+from pages.home_page import HomePage
+
+# Varsayılan olarak analiz ettiğim sayfalar: (base URL'e göre yol, page object sınıfları)
+DEFAULT_TARGETS = [
+    ("", [HomePage]),
+    ("careers/", [CareersPage]),
+    ("careers/open-positions/?department=qualityassurance", [CareersPage]),
+]
+
+DEFAULT_MAX_MS = 5.0
+DEFAULT_MAX_MATCHES = 50
+DEFAULT_ITERATIONS = 20
+
+# Her locator'ı tarayıcıda ölçüp, aynı node'ları bulan CSS/ID tabanlı alternatifler üretiyorum
+ANALYZE_SCRIPT = """
+var queries = arguments[0], iterations = arguments[1];
+
+function run(by, value) {
+    if (by === 'xpath') {
+        var snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var nodes = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) {
+            nodes.push(snapshot.snapshotItem(i));
+        }
+        return nodes;
+    }
+    return Array.prototype.slice.call(document.querySelectorAll(value));
+}
+
+function measure(by, value) {
+    var started = performance.now();
+    for (var i = 0; i < iterations; i++) {
+        run(by, value);
+    }
+    return (performance.now() - started) / iterations;
+}
+
+function sameNodes(a, b) {
+    if (a.length !== b.length) return false;
+    for (var i = 0; i < a.length; i++) {
+        if (a[i] !== b[i]) return false;
+    }
+    return true;
+}
+
+function candidates(nodes) {
+    var out = [];
+    if (!nodes.length || !nodes.every(function (n) { return n.nodeType === 1; })) return out;
+    var tag = nodes.every(function (n) { return n.tagName === nodes[0].tagName; }) ? nodes[0].tagName.toLowerCase() : '';
+    var common = Array.prototype.filter.call(nodes[0].classList, function (cls) {
+        return nodes.every(function (n) { return n.classList.contains(cls); });
+    });
+    var structural = tag + common.map(function (cls) { return '.' + CSS.escape(cls); }).join('');
+
+    if (nodes.length === 1 && nodes[0].id) out.push('#' + CSS.escape(nodes[0].id));
+    if (structural) out.push(structural);
+
+    // Tüm node'ları içeren, id'si olan en yakın ata ile daraltıyorum
+    var ancestor = nodes[0].parentElement;
+    while (ancestor && !(ancestor.id && nodes.every(function (n) { return ancestor.contains(n); }))) {
+        ancestor = ancestor.parentElement;
+    }
+    if (ancestor) out.push('#' + CSS.escape(ancestor.id) + ' ' + (structural || '*'));
+
+    if (nodes.length === 1) {
+        ['data-testid', 'name', 'aria-label', 'href'].forEach(function (attribute) {
+            var value = nodes[0].getAttribute(attribute);
+            if (value) out.push((tag || '*') + '[' + attribute + '="' + value.replace(/"/g, '\\\\"') + '"]');
+        });
+    }
+    return out.filter(function (selector, index) { return out.indexOf(selector) === index; });
+}
+
+return queries.map(function (query) {
+    var nodes = run(query.by, query.value);
+    var result = {name: query.name, count: nodes.length, ms: measure(query.by, query.value), suggestions: []};
+    candidates(nodes).forEach(function (selector) {
+        try {
+            if (sameNodes(run('css', selector), nodes)) {
+                result.suggestions.push({selector: selector, ms: measure('css', selector)});
+            }
+        } catch (e) {}
+    });
+    result.suggestions.sort(function (a, b) { return a.ms - b.ms; });
+    return result;
+});
+"""
+
+
+def page_locators(page):
+    # Page object'in (By, değer) tuple'ı olan tüm attribute'larını topluyorum
+    locators = {}
+    by_values = {value for name, value in vars(By).items() if not name.startswith("_")}
+    for attribute, value in vars(page).items():
+        if (isinstance(value, tuple) and len(value) == 2 and value[0] in by_values
+                and isinstance(value[1], str)):
+            locators[f"{type(page).__name__}.{attribute}"] = value
+    return locators
+
+
+def analyze_page(driver, page_classes, iterations=DEFAULT_ITERATIONS):
+    queries = []
+    locators = {}
+    for page_class in page_classes:
+        for name, locator in page_locators(page_class(driver)).items():
+            by, value = locator_to_query(locator)
+            queries.append({"name": name, "by": by, "value": value})
+            locators[name] = locator
+    results = driver.execute_script(ANALYZE_SCRIPT, queries, iterations)
+    for result in results:
+        result["locator"] = list(locators[result["name"]])
+    return results
+
+
+def find_violations(results, max_ms=DEFAULT_MAX_MS, max_matches=DEFAULT_MAX_MATCHES, allow_broad=()):
+    violations = []
+    for result in results:
+        short_name = result["name"].split(".", 1)[1]
+        if result["ms"] > max_ms:
+            violations.append(f"{result['name']}: {result['ms']:.2f}ms > {max_ms}ms")
+        if result["count"] > max_matches and short_name not in allow_broad:
+            violations.append(f"{result['name']}: {result['count']} matches > {max_matches}")
+    return violations
+
+
+def print_results(url, results):
+    print(f"\n{url}")
+    print(f"  {'locator':<45} {'matches':>7} {'ms':>8}  suggestion")
+    for result in sorted(results, key=lambda item: item["ms"], reverse=True):
+        suggestion = result["suggestions"][0] if result["suggestions"] else None
+        hint = f"{suggestion['selector']} ({suggestion['ms']:.3f}ms)" if suggestion else "-"
+        print(f"  {result['name']:<45} {result['count']:7d} {result['ms']:8.3f}  {hint}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Page object locator'larının maliyetini ölçer ve alternatif önerir")
+    parser.add_argument("--check", action="store_true", help="Eşik aşılırsa exit code 1 ile bitir")
+    parser.add_argument("--max-ms", type=float, default=DEFAULT_MAX_MS, help="Locator başına en fazla süre (ms)")
+    parser.add_argument("--max-matches", type=int, default=DEFAULT_MAX_MATCHES,
+                        help="Locator başına en fazla eşleşme sayısı")
+    parser.add_argument("--allow-broad", nargs="*", default=["job_position_elements", "job_list_elements",
+                                                             "view_role_buttons"],
+                        help="Çok eşleşmesi beklenen locator'lar (attribute adı)")
+    parser.add_argument("--iterations", type=int, default=DEFAULT_ITERATIONS)
+    parser.add_argument("--report", default="reports/locator_report.json")
+    args = parser.parse_args(argv)
+
+    from tests.base_test import create_driver, resolve_base_url
+
+    driver = create_driver()
+    base_url = resolve_base_url()
+    report = {}
+    violations = []
+    try:
+        for path, page_classes in DEFAULT_TARGETS:
+            url = urljoin(base_url, path)
+            driver.get(url)
+            # Dinamik içerik yüklensin diye DOM'un oturmasını bekliyorum (carousel vb. hiç durmayabilir)
+            try:
+                page_classes[0](driver).wait_for_dom_stable(quiet_ms=500, timeout=15)
+            except Exception as e:
+                print(f"DOM did not settle on {url}, analyzing anyway: {e}")
+            results = analyze_page(driver, page_classes, args.iterations)
+            report[url] = results
+            print_results(url, results)
+            violations.extend(f"{url} {violation}" for violation in
+                              find_violations(results, args.max_ms, args.max_matches, args.allow_broad))
+    finally:
+        driver.quit()
+
+    os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nReport saved: {args.report}")
+
+    if violations:
+        print(f"\n{len(violations)} locator violations:")
+        for violation in violations:
+            print(f"  {violation}")
+        if args.check:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
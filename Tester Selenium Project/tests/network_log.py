@@ -0,0 +1,109 @@
+import json
+import os
+import threading
+import weakref
+
+# get_log("performance") oturumun tüm pencerelerinin olaylarını döndürüp buffer'ı boşaltıyor. Tab modunda
+# (tests/tab_pool.py) aynı oturumu paylaşan her tab'ın log'u burada; okunan olaylar sahiplerine dağıtılıyor.
+_session_logs = {}
+_session_lock = threading.Lock()
+
+
+def network_log_enabled(profile=None):
+    # Performance log'u chromedriver bellekte biriktiriyor; sadece okuyan bir özellik açıksa istiyorum:
+    # engellenen istek özeti (FAST_PROFILE), record modu ya da hata anında HAR (NETWORK_LOG=1)
+    from tests.fixture_server import fixture_mode
+    return (os.environ.get("NETWORK_LOG", "0") == "1" or fixture_mode() == "record"
+            or (profile is not None and profile.enabled))
+
+
+def logging_prefs(profile=None):
+    # Console hataları hata artifact'i için her zaman, network olayları sadece gerekiyorsa
+    prefs = {"browser": "SEVERE"}
+    if network_log_enabled(profile):
+        prefs.update(browser="ALL", performance="ALL")
+    return prefs
+
+
+class NetworkLog:
+    # Chrome performance log'undaki Network.* / Page.* olaylarını biriktiriyorum.
+    # get_log her okumada buffer'ı boşalttığı için log'u okuyan herkes bu sınıfı kullanmalı.
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.events = []
+        with _session_lock:
+            _session_logs.setdefault(driver.session_id, weakref.WeakSet()).add(self)
+
+    def drain(self):
+        with _session_lock:
+            try:
+                entries = self.driver.get_log("performance")
+            except Exception:
+                # performance log açık değilse (goog:loggingPrefs) sessizce boş dönüyorum
+                return []
+
+            messages = []
+            for entry in entries:
+                payload = json.loads(entry["message"])
+                message = payload["message"]
+                if message["method"].startswith(("Network.", "Page.")):
+                    message["timestamp"] = entry["timestamp"]
+                    # Olayın geldiği pencerenin target id'si (performance log tüm pencereleri içeriyor)
+                    message["webview"] = payload.get("webview")
+                    messages.append(message)
+
+            new_events = []
+            for log in list(_session_logs.get(self.driver.session_id, ())):
+                received = [message for message in messages if log._owns(message["webview"])]
+                log.events.extend(received)
+                if log is self:
+                    new_events = received
+            return new_events
+
+    def _owns(self, webview):
+        # Tab driver'ları kendi pencerelerini owned_handles'ta tutuyor (handle "CDwindow-<targetId>");
+        # normal driver'da oturumun tüm olayları bu log'un
+        handles = getattr(self.driver, "owned_handles", None)
+        if handles is None:
+            return True
+        return bool(webview) and any(handle.upper().endswith(webview.upper()) for handle in handles)
+
+    def clear(self):
+        self.drain()
+        self.events = []
+
+    def requests(self):
+        # requestId'ye göre istekleri birleştiriyorum
+        requests = {}
+        for event in self.events:
+            params = event.get("params", {})
+            request_id = params.get("requestId")
+            if request_id is None:
+                continue
+            request = requests.setdefault(request_id, {"request_id": request_id, "webview": event.get("webview")})
+            method = event["method"]
+            if method == "Network.requestWillBeSent":
+                request["url"] = params["request"]["url"]
+                request["method"] = params["request"]["method"]
+                request["type"] = params.get("type")
+                request["started"] = params.get("timestamp")
+                request["wall_time"] = params.get("wallTime")
+            elif method == "Network.responseReceived":
+                response = params["response"]
+                request["url"] = response.get("url", request.get("url"))
+                request["status"] = response.get("status")
+                request["mime_type"] = response.get("mimeType")
+                request["headers"] = response.get("headers", {})
+                request["type"] = params.get("type", request.get("type"))
+            elif method == "Network.loadingFinished":
+                request["encoded_size"] = params.get("encodedDataLength")
+                request["finished"] = params.get("timestamp")
+            elif method == "Network.loadingFailed":
+                request["failed"] = params.get("errorText")
+                request["blocked_reason"] = params.get("blockedReason")
+                request["finished"] = params.get("timestamp")
+        return requests
+
+    def blocked_requests(self):
+        return [request for request in self.requests().values() if request.get("blocked_reason")]
@@ -0,0 +1,382 @@
+import argparse
+import json
+import multiprocessing
+import os
+import queue
+import shutil
+import sys
+import threading
+import time
+import unittest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from tests.browser_metrics import MemorySampler
+from tests.performance_budget import RUN_ID, format_breach
+from tests.scheduler import DurationHistory, group_units, order_longest_first
+
+DEFAULT_WORKERS = int(os.environ.get("TEST_WORKERS", "2"))
+
+
+def collect_test_ids(module_names):
+    # Test metotlarını tek tek id olarak topluyorum (ör. tests.tests.TestInsiderWebsite.test_homepage_is_opened)
+    loader = unittest.TestLoader()
+    test_ids = []
+    for module_name in module_names:
+        test_ids.extend(_flatten(loader.loadTestsFromName(module_name)))
+    return test_ids
+
+
+def _flatten(suite):
+    for test in _iter_tests(suite):
+        yield test.id()
+
+
+def _iter_tests(suite):
+    for item in suite:
+        if isinstance(item, unittest.TestSuite):
+            yield from _iter_tests(item)
+        else:
+            yield item
+
+
+class _RecordingResult(unittest.TestResult):
+    # Birimdeki her testin süresini, screenshot'larını ve bütçe aşımlarını test id'sine göre kaydediyorum
+
+    def __init__(self):
+        super().__init__()
+        self.durations = {}
+        self.screenshots = {}
+        self.budget_breaches = {}
+        self._started = {}
+
+    def startTest(self, test):
+        super().startTest(test)
+        self._started[test.id()] = time.perf_counter()
+
+    def stopTest(self, test):
+        super().stopTest(test)
+        self.durations[test.id()] = time.perf_counter() - self._started.pop(test.id(), time.perf_counter())
+        self.screenshots[test.id()] = getattr(test, "screenshots", [])
+        self.budget_breaches[test.id()] = getattr(test, "performance_breaches", [])
+
+    def outcome(self, test_id):
+        # Testin kendi hataları (subTest'ler dahil); setUpClass gibi sınıf seviyesindeki hatalar birimdeki her teste yazılıyor
+        def belongs(test):
+            if not isinstance(test, unittest.TestCase):
+                return True
+            return getattr(test, "test_case", test).id() == test_id
+
+        errors = [message for test, message in self.errors if belongs(test)]
+        failures = [message for test, message in self.failures if belongs(test)]
+        if errors:
+            status = "error"
+        elif failures:
+            status = "fail"
+        elif any(belongs(test) for test, _ in self.skipped):
+            status = "skip"
+        else:
+            status = "pass"
+        return status, errors + failures
+
+
+def _bind_to_tab(suite, driver):
+    # Tab modunda BaseTest testlerini o thread'in tab'ına bağlı alt sınıfla yeniden oluşturuyorum
+    # Aynı sınıfın testleri tek alt sınıfı paylaşmalı, yoksa unittest setUpClass'ı her test için yeniden çalıştırıyor
+    tests = []
+    bound_classes = {}
+    for test in _iter_tests(suite):
+        test_class = type(test)
+        if hasattr(test_class, "bound_to"):
+            key = (test_class, id(driver))
+            if key not in bound_classes:
+                bound_classes[key] = test_class.bound_to(driver)
+            test = bound_classes[key](test._testMethodName)
+        tests.append(test)
+    return unittest.TestSuite(tests)
+
+
+def _run_unit(unit, worker_id, driver=None):
+    # Birimin testleri (keep_together sınıfında tüm sınıf) tek suite'te koşuyor, setUpClass bir kez çalışıyor
+    suite = unittest.TestLoader().loadTestsFromNames(unit)
+    if driver is not None:
+        suite = _bind_to_tab(suite, driver)
+    result = _RecordingResult()
+    suite.run(result)
+
+    results = []
+    for test_id in unit:
+        status, messages = result.outcome(test_id)
+        results.append({
+            "id": test_id,
+            "status": status,
+            "worker": worker_id,
+            "duration": round(result.durations.get(test_id, 0.0), 3),
+            "messages": messages,
+            "screenshots": result.screenshots.get(test_id, []),
+            "budget_breaches": result.budget_breaches.get(test_id, []),
+        })
+    return results
+
+
+def _worker(worker_id, task_queue, result_queue, screenshot_root):
+    # Her worker kendi klasörüne screenshot yazıyor ki isimler çakışmasın
+    os.environ["SCREENSHOT_DIR"] = os.path.join(screenshot_root, f"worker-{worker_id}")
+
+    from tests.base_test import BaseTest, create_driver
+    from tests.driver_manager import DriverManager
+
+    # Worker'ın Chrome oturumunu bir kez açıp testlerinde kullanıyorum; N testte bir ya da
+    # bellek/gecikme eşiği aşılınca DriverManager oturumu yeniliyor
+    manager = DriverManager.from_env(create_driver)
+    try:
+        BaseTest.shared_driver = manager.driver
+    except Exception as e:
+        print(f"[worker-{worker_id}] Error initializing pooled Chrome driver: {e}")
+
+    try:
+        while True:
+            unit = task_queue.get()
+            if unit is None:
+                break
+            results = _run_unit(unit, worker_id)
+            if BaseTest.shared_driver is not None:
+                try:
+                    # Birim keep_together sınıfında birden fazla test içerebiliyor; recycle sayacı test sayıyor
+                    results[-1]["driver_recycle"] = manager.after_test(len(results))
+                    BaseTest.shared_driver = manager.driver
+                except Exception as e:
+                    # Yeni oturum açılamadıysa sonraki testler kendi driver'ını açmayı deniyor
+                    print(f"[worker-{worker_id}] Error recycling Chrome driver: {e}")
+                    BaseTest.shared_driver = None
+            for result in results:
+                result_queue.put(result)
+    finally:
+        manager.quit()
+        # Arka planda yazılan hata artifact'leri bitmeden process'i kapatmıyorum
+        from tests.artifacts import get_artifact_pipeline
+        get_artifact_pipeline().close()
+
+
+def _merge_screenshots(results, screenshot_root):
+    # Worker klasörlerindeki test artifact klasörlerini (screenshot, DOM, console, HAR) tek klasörde topluyorum
+    for result in results:
+        merged = []
+        for path in result["screenshots"]:
+            artifact_dir = os.path.dirname(path)
+            target_dir = os.path.join(screenshot_root, os.path.basename(artifact_dir))
+            if os.path.isdir(artifact_dir) and os.path.abspath(artifact_dir) != os.path.abspath(target_dir):
+                if os.path.exists(target_dir):
+                    shutil.rmtree(target_dir)
+                shutil.move(artifact_dir, target_dir)
+            target = os.path.join(target_dir, os.path.basename(path))
+            if os.path.exists(target):
+                merged.append(target)
+        result["screenshots"] = merged
+
+    for entry in os.listdir(screenshot_root):
+        worker_dir = os.path.join(screenshot_root, entry)
+        if entry.startswith("worker-") and os.path.isdir(worker_dir) and not os.listdir(worker_dir):
+            os.rmdir(worker_dir)
+
+
+def run_parallel(test_ids, workers=DEFAULT_WORKERS, screenshot_root="screenshots"):
+    os.makedirs(screenshot_root, exist_ok=True)
+    workers = max(1, min(workers, len(test_ids)))
+
+    # Worker'ların hız ölçümleri aynı run id ile yazılsın
+    os.environ["PERF_RUN_ID"] = RUN_ID
+
+    # Windows'ta da aynı davranması için spawn kullanıyorum
+    context = multiprocessing.get_context("spawn")
+    task_queue = context.Queue()
+    result_queue = context.Queue()
+
+    # keep_together sınıfları kuyrukta tek görev (tests/scheduler.py)
+    units = group_units(test_ids)
+    workers = min(workers, len(units))
+    for unit in units:
+        task_queue.put(unit)
+    for _ in range(workers):
+        task_queue.put(None)
+
+    sampler = MemorySampler().start()
+    started = time.perf_counter()
+    processes = [
+        context.Process(target=_worker, args=(worker_id, task_queue, result_queue, screenshot_root))
+        for worker_id in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    results = {}
+    while len(results) < len(test_ids):
+        if not any(process.is_alive() for process in processes) and result_queue.empty():
+            break
+        try:
+            result = result_queue.get(timeout=1)
+        except Exception:
+            continue
+        results[result["id"]] = result
+        print(f"[worker-{result['worker']}] {result['id']} ... {result['status']} ({result['duration']}s)")
+
+    for process in processes:
+        process.join()
+
+    wall_time = time.perf_counter() - started
+    return _build_report(test_ids, results, screenshot_root, "process", workers, wall_time, sampler.stop())
+
+
+def run_tabs(test_ids, tabs=DEFAULT_WORKERS, screenshot_root="screenshots"):
+    # Tek Chrome, birden fazla tab: her thread kendi tab'ında test koşuyor (process-per-worker'a göre daha az bellek)
+    os.makedirs(screenshot_root, exist_ok=True)
+    tabs = max(1, min(tabs, len(test_ids)))
+    os.environ["SCREENSHOT_DIR"] = screenshot_root
+
+    from tests.artifacts import get_artifact_pipeline
+    from tests.base_test import create_driver
+    from tests.tab_pool import TabPool
+
+    sampler = MemorySampler().start()
+    started = time.perf_counter()
+    task_queue = queue.Queue()
+    units = group_units(test_ids)
+    tabs = min(tabs, len(units))
+    for unit in units:
+        task_queue.put(unit)
+    results = {}
+
+    driver = create_driver()
+    pool = TabPool(driver)
+    try:
+        tab_drivers = [pool.open_tab() for _ in range(tabs)]
+
+        def run_tab(tab_id, tab):
+            while True:
+                try:
+                    unit = task_queue.get_nowait()
+                except queue.Empty:
+                    return
+                unit_results = _run_unit(unit, f"tab-{tab_id}", driver=tab)
+                pool.reset(tab)
+                for result in unit_results:
+                    results[result["id"]] = result
+                    print(f"[tab-{tab_id}] {result['id']} ... {result['status']} ({result['duration']}s)")
+
+        threads = [threading.Thread(target=run_tab, args=(tab_id, tab), name=f"tab-{tab_id}")
+                   for tab_id, tab in enumerate(tab_drivers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        print(f"Tab switches: {pool.switches} (isolated contexts: {pool.isolated})")
+    finally:
+        pool.close()
+        driver.quit()
+        get_artifact_pipeline().close()
+
+    wall_time = time.perf_counter() - started
+    return _build_report(test_ids, results, screenshot_root, "tabs", tabs, wall_time, sampler.stop())
+
+
+def _build_report(test_ids, results, screenshot_root, mode, workers, wall_time, memory):
+    # Worker çökerse sonucu gelmeyen testleri hata olarak işaretliyorum
+    ordered = []
+    for test_id in test_ids:
+        ordered.append(results.get(test_id) or {
+            "id": test_id,
+            "status": "error",
+            "worker": None,
+            "duration": 0.0,
+            "messages": ["Worker exited before reporting a result"],
+            "screenshots": [],
+        })
+
+    _merge_screenshots(ordered, screenshot_root)
+
+    return {
+        "mode": mode,
+        "workers": workers,
+        "wall_time": round(wall_time, 3),
+        # Aynı yük için process ve tab modunu karşılaştırabilmek için throughput ve tepe bellek
+        "throughput_per_min": round(len(ordered) / wall_time * 60, 2) if wall_time else 0.0,
+        "memory": memory,
+        "driver_recycles": [dict(result["driver_recycle"], worker=result["worker"], after=result["id"])
+                            for result in ordered if result.get("driver_recycle")],
+        "summary": {status: sum(1 for r in ordered if r["status"] == status)
+                    for status in ("pass", "fail", "error", "skip")},
+        # Hız bütçesi aşımları fonksiyonel sonuçlardan ayrı
+        "budget_breaches": [dict(breach, test=r["id"]) for r in ordered for breach in r.get("budget_breaches", [])],
+        "results": ordered,
+    }
+
+
+def print_report(report):
+    for result in report["results"]:
+        for message in result["messages"]:
+            print("=" * 70)
+            print(f"{result['status'].upper()}: {result['id']}")
+            print("-" * 70)
+            print(message)
+    if report["budget_breaches"]:
+        print("=" * 70)
+        print(f"PERFORMANCE BUDGET: {len(report['budget_breaches'])} breaches")
+        print("-" * 70)
+        for breach in report["budget_breaches"]:
+            print(f"{breach['test']}: {format_breach(breach)}")
+    print("-" * 70)
+    print(f"Ran {len(report['results'])} tests in {report['wall_time']}s with {report['workers']} "
+          f"{'tabs' if report['mode'] == 'tabs' else 'workers'} ({report['throughput_per_min']} tests/min)")
+    if report["driver_recycles"]:
+        print(f"Chrome sessions recycled: {len(report['driver_recycles'])}")
+    memory = report["memory"]
+    if memory["peak_rss_mb"] is not None:
+        print(f"Peak memory: RSS {memory['peak_rss_mb']} MB, PSS {memory['peak_pss_mb']} MB")
+    summary = report["summary"]
+    if summary["fail"] or summary["error"]:
+        print(f"FAILED (failures={summary['fail']}, errors={summary['error']})")
+    else:
+        print("OK")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Testleri birden fazla Chrome worker'ına dağıtarak çalıştırır")
+    parser.add_argument("modules", nargs="*", default=["tests.tests"],
+                        help="Test modülleri veya test id'leri (varsayılan: tests.tests)")
+    parser.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS,
+                        help="Worker process sayısı (varsayılan: TEST_WORKERS veya 2)")
+    parser.add_argument("--tabs", type=int,
+                        help="Process yerine tek Chrome'da bu kadar tab ile çalıştır (bellek tasarrufu)")
+    parser.add_argument("--fail-on-budget", action="store_true",
+                        help="Hız bütçesi aşımında da exit code 1 ile bitir")
+    parser.add_argument("--report", default="reports/parallel_report.json",
+                        help="Birleştirilmiş JSON raporun yolu")
+    parser.add_argument("--screenshots", default="screenshots",
+                        help="Screenshot'ların toplanacağı klasör")
+    args = parser.parse_args(argv)
+
+    # Geçmiş sürelere göre uzun testleri öne alıyorum, koşu sonunda süreleri geçmişe ekliyorum
+    history = DurationHistory()
+    test_ids = order_longest_first(collect_test_ids(args.modules), history)
+    if args.tabs:
+        report = run_tabs(test_ids, args.tabs, args.screenshots)
+    else:
+        report = run_parallel(test_ids, args.workers, args.screenshots)
+    history.record_report(report)
+    history.save()
+
+    os.makedirs(os.path.dirname(args.report) or ".", exist_ok=True)
+    with open(args.report, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    print_report(report)
+    print(f"Report saved: {args.report}")
+    if report["summary"]["fail"] or report["summary"]["error"]:
+        return 1
+    return 1 if args.fail_on_budget and report["budget_breaches"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
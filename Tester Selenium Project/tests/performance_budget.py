@@ -0,0 +1,88 @@
+import csv
+import json
+import os
+import threading
+import time
+
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DEFAULT_BUDGETS = os.environ.get("PERF_BUDGETS", os.path.join(project_root, "performance_budgets.json"))
+DEFAULT_REPORT_DIR = os.environ.get("PERF_REPORT_DIR", os.path.join(project_root, "reports"))
+
+# Aynı koşudaki tüm ölçümler (paralel worker'lar dahil) aynı run id ile yazılıyor
+RUN_ID = os.environ.get("PERF_RUN_ID") or time.strftime("%Y%m%dT%H%M%S")
+
+CSV_FIELDS = ("timestamp", "run_id", "test", "page", "metric", "value", "budget", "breach")
+
+
+class PerformanceBudget:
+    # Sayfa -> {metrik: üst sınır}. "default" tüm sayfalara uygulanıyor, sayfanın kendi değerleri onu eziyor.
+
+    def __init__(self, budgets):
+        self.budgets = budgets
+
+    @classmethod
+    def load(cls, path=DEFAULT_BUDGETS):
+        if not os.path.exists(path):
+            return cls({})
+        with open(path, encoding="utf-8") as f:
+            return cls(json.load(f))
+
+    def limits(self, page):
+        return dict(self.budgets.get("default", {}), **self.budgets.get(page, {}))
+
+    def check(self, page, metrics):
+        breaches = []
+        for metric, limit in self.limits(page).items():
+            value = metrics.get(metric)
+            if value is not None and value > limit:
+                breaches.append({"page": page, "metric": metric, "value": value, "budget": limit})
+        return breaches
+
+
+class PerformanceRecorder:
+    # Her ölçümü JSON lines (satır başına bir ölçüm) ve uzun formatlı CSV'ye ekliyorum; grafik araçlarına direkt giriyor
+
+    def __init__(self, report_dir=DEFAULT_REPORT_DIR, budget=None):
+        self.report_dir = report_dir
+        self.budget = budget or PerformanceBudget.load()
+        self._lock = threading.Lock()
+
+    def record(self, test_id, page, metrics):
+        breaches = self.budget.check(page, metrics)
+        limits = self.budget.limits(page)
+        breached = {breach["metric"] for breach in breaches}
+        timestamp = time.strftime("%Y-%m-%dT%H:%M:%S")
+        entry = {"timestamp": timestamp, "run_id": RUN_ID, "test": test_id, "page": page,
+                 "metrics": metrics, "breaches": breaches}
+
+        with self._lock:
+            os.makedirs(self.report_dir, exist_ok=True)
+            with open(os.path.join(self.report_dir, "performance.jsonl"), "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry) + "\n")
+            csv_path = os.path.join(self.report_dir, "performance.csv")
+            new_file = not os.path.exists(csv_path)
+            with open(csv_path, "a", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                if new_file:
+                    writer.writerow(CSV_FIELDS)
+                for metric, value in metrics.items():
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        writer.writerow((timestamp, RUN_ID, test_id, page, metric, value,
+                                         limits.get(metric, ""), int(metric in breached)))
+        return breaches
+
+
+def format_breach(breach):
+    return f"{breach['page']}.{breach['metric']} = {breach['value']} (budget {breach['budget']})"
+
+
+_recorder = None
+
+
+def get_performance_recorder():
+    # Process başına tek kayıtçı
+    global _recorder
+    if _recorder is None:
+        _recorder = PerformanceRecorder()
+    return _recorder
@@ -0,0 +1,237 @@
+import argparse
+import glob
+import heapq
+import json
+import os
+import shutil
+import statistics
+import sys
+import time
+import unittest
+
+# Add the project root to Python path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+DEFAULT_HISTORY = os.environ.get("TEST_DURATIONS", os.path.join(project_root, "reports", "durations.json"))
+
+# Yeni süre eski ortalamaya bu ağırlıkla katılıyor (tek yavaş koşu planı bozmasın)
+HISTORY_WEIGHT = 0.3
+
+
+class DurationHistory:
+    # Test id -> geçmiş süre (üstel hareketli ortalama) deposu
+
+    def __init__(self, path=DEFAULT_HISTORY):
+        self.path = path
+        self.tests = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                self.tests = json.load(f).get("tests", {})
+
+    def duration(self, test_id):
+        entry = self.tests.get(test_id)
+        return entry["mean"] if entry else None
+
+    def record(self, test_id, duration):
+        entry = self.tests.get(test_id)
+        if entry is None:
+            self.tests[test_id] = {"mean": round(duration, 3), "runs": 1, "last": round(duration, 3)}
+            return
+        entry["mean"] = round(entry["mean"] * (1 - HISTORY_WEIGHT) + duration * HISTORY_WEIGHT, 3)
+        entry["runs"] += 1
+        entry["last"] = round(duration, 3)
+
+    def record_report(self, report):
+        # Sadece geçen testlerin süresini alıyorum; erken düşen testler süreyi olduğundan kısa gösteriyor
+        for result in report["results"]:
+            if result["status"] == "pass":
+                self.record(result["id"], result["duration"])
+
+    def save(self):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"updated": time.strftime("%Y-%m-%dT%H:%M:%S"), "tests": self.tests}, f, indent=2)
+
+
+def _keeps_class_together(test_id):
+    # Sınıfı keep_together = True olan testler (ortak setUpClass state'i) aynı shard'da kalıyor
+    try:
+        test = next(iter(unittest.TestLoader().loadTestsFromName(test_id)))
+    except Exception:
+        return False
+    return bool(getattr(type(test), "keep_together", False))
+
+
+def group_units(test_ids, group_classes=False):
+    # Shard'a / worker kuyruğuna tek parça verilen birimler: tek test ya da birlikte kalması gereken sınıfın tüm testleri
+    units = {}
+    for test_id in test_ids:
+        class_id = test_id.rsplit(".", 1)[0]
+        if group_classes or _keeps_class_together(test_id):
+            units.setdefault(class_id, []).append(test_id)
+        else:
+            units[test_id] = [test_id]
+    return list(units.values())
+
+
+def plan_shards(test_ids, shard_count, history=None, group_classes=False):
+    # Longest-processing-time-first: en uzun birimi en az yüklü shard'a veriyorum.
+    # Hiç geçmiş yoksa sırayla (round-robin) eşit dağıtıyorum.
+    units = group_units(test_ids, group_classes)
+    shard_count = max(1, shard_count)
+    shards = [{"index": index, "tests": [], "estimated": 0.0} for index in range(shard_count)]
+
+    known = [history.duration(test_id) for test_id in test_ids] if history else []
+    known = [duration for duration in known if duration is not None]
+    if not known:
+        for position, unit in enumerate(units):
+            shards[position % shard_count]["tests"].extend(unit)
+        return {"strategy": "even", "shards": shards}
+
+    # Geçmişi olmayan testlere bilinen sürelerin medyanını veriyorum
+    default = statistics.median(known)
+
+    def estimate(unit):
+        return sum(history.duration(test_id) or default for test_id in unit)
+
+    heap = [(0.0, index) for index in range(shard_count)]
+    for unit in sorted(units, key=estimate, reverse=True):
+        load, index = heapq.heappop(heap)
+        shards[index]["tests"].extend(unit)
+        shards[index]["estimated"] = round(load + estimate(unit), 3)
+        heapq.heappush(heap, (load + estimate(unit), index))
+    return {"strategy": "lpt", "shards": shards}
+
+
+def order_longest_first(test_ids, history):
+    # Worker kuyruğunda uzun testler önce alınsın ki sonda tek bir uzun test kalmasın; geçmişi olmayanlar en önde
+    return sorted(test_ids, key=lambda test_id: (history.duration(test_id) is not None,
+                                                 -(history.duration(test_id) or 0)))
+
+
+def merge_reports(paths, artifacts_root="screenshots"):
+    # Shard raporlarını tek raporda birleştirip artifact klasörlerini tek köke taşıyorum
+    reports = []
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            reports.append((path, json.load(f)))
+
+    os.makedirs(artifacts_root, exist_ok=True)
+    results = []
+    for path, report in reports:
+        report_dir = os.path.dirname(os.path.abspath(path))
+        for result in report["results"]:
+            merged = []
+            for screenshot in result.get("screenshots", []):
+                # Başka makineden indirilen artifact'lerde yol rapor klasörüne göreli olabilir
+                source = screenshot if os.path.exists(screenshot) else os.path.join(report_dir, screenshot)
+                artifact_dir = os.path.dirname(source)
+                target_dir = os.path.join(artifacts_root, os.path.basename(artifact_dir))
+                if os.path.isdir(artifact_dir) and os.path.abspath(artifact_dir) != os.path.abspath(target_dir):
+                    shutil.copytree(artifact_dir, target_dir, dirs_exist_ok=True)
+                target = os.path.join(target_dir, os.path.basename(source))
+                if os.path.exists(target):
+                    merged.append(target)
+            results.append(dict(result, screenshots=merged, shard=report.get("shard")))
+
+    wall_times = [report["wall_time"] for _, report in reports]
+    return {
+        "shards": len(reports),
+        # Shard'lar paralel koştuğu için toplam süre en yavaş shard'ın süresi
+        "wall_time": max(wall_times) if wall_times else 0.0,
+        "shard_wall_times": wall_times,
+        "summary": {status: sum(1 for result in results if result["status"] == status)
+                    for status in ("pass", "fail", "error", "skip")},
+        "budget_breaches": [breach for _, report in reports for breach in report.get("budget_breaches", [])],
+        "results": results,
+    }
+
+
+def print_plan(plan):
+    print(f"Strategy: {plan['strategy']}")
+    for shard in plan["shards"]:
+        print(f"  shard {shard['index']}: {len(shard['tests'])} tests, ~{shard['estimated']}s")
+        for test_id in shard["tests"]:
+            print(f"    {test_id}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Test sürelerine göre shard planlar, shard koşar ve sonuçları birleştirir")
+    parser.add_argument("--history", default=DEFAULT_HISTORY, help="Test süre geçmişi dosyası")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    plan_parser = commands.add_parser("plan", help="Testleri K shard'a böl ve planı yazdır")
+    run_parser = commands.add_parser("run", help="Planlanan shard'lardan birini koş")
+    for sub in (plan_parser, run_parser):
+        sub.add_argument("modules", nargs="*", default=["tests.tests"])
+        sub.add_argument("-k", "--shards", type=int, default=int(os.environ.get("TEST_SHARDS", "1")))
+        sub.add_argument("--group-classes", action="store_true",
+                         help="Her test sınıfını bölmeden aynı shard'a koy")
+    plan_parser.add_argument("--out", help="Planın JSON olarak yazılacağı yol")
+    run_parser.add_argument("-i", "--shard", type=int, default=int(os.environ.get("TEST_SHARD", "0")))
+    run_parser.add_argument("-w", "--workers", type=int, default=int(os.environ.get("TEST_WORKERS", "2")))
+    run_parser.add_argument("--report", help="Shard raporu (varsayılan: reports/shard-<i>.json)")
+    run_parser.add_argument("--screenshots", help="Artifact klasörü (varsayılan: screenshots/shard-<i>)")
+
+    merge_parser = commands.add_parser("merge", help="Shard raporlarını birleştir ve süre geçmişini güncelle")
+    merge_parser.add_argument("reports", nargs="*", default=["reports/shard-*.json"])
+    merge_parser.add_argument("--out", default="reports/merged_report.json")
+    merge_parser.add_argument("--screenshots", default="screenshots")
+    args = parser.parse_args(argv)
+    if args.command == "run" and not 0 <= args.shard < args.shards:
+        parser.error(f"--shard must be between 0 and {args.shards - 1} (--shards {args.shards})")
+
+    from tests.parallel_runner import collect_test_ids, print_report, run_parallel
+
+    history = DurationHistory(args.history)
+
+    if args.command == "plan":
+        plan = plan_shards(collect_test_ids(args.modules), args.shards, history, args.group_classes)
+        print_plan(plan)
+        if args.out:
+            os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+            with open(args.out, "w", encoding="utf-8") as f:
+                json.dump(plan, f, indent=2)
+        return 0
+
+    if args.command == "run":
+        # Her CI node aynı geçmişle aynı planı hesaplıyor, sadece kendi shard'ını koşuyor
+        plan = plan_shards(collect_test_ids(args.modules), args.shards, history, args.group_classes)
+        test_ids = order_longest_first(plan["shards"][args.shard]["tests"], history)
+        report_path = args.report or os.path.join("reports", f"shard-{args.shard}.json")
+        screenshots = args.screenshots or os.path.join("screenshots", f"shard-{args.shard}")
+        print(f"Shard {args.shard}/{args.shards} ({plan['strategy']}): {len(test_ids)} tests")
+        if not test_ids:
+            report = {"workers": 0, "wall_time": 0.0, "results": [], "budget_breaches": [],
+                      "summary": {"pass": 0, "fail": 0, "error": 0, "skip": 0}}
+        else:
+            report = run_parallel(test_ids, args.workers, screenshots)
+            print_report(report)
+        report["shard"] = args.shard
+        os.makedirs(os.path.dirname(report_path) or ".", exist_ok=True)
+        with open(report_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Shard report saved: {report_path}")
+        return 0 if not (report["summary"]["fail"] or report["summary"]["error"]) else 1
+
+    paths = sorted(path for pattern in args.reports for path in glob.glob(pattern))
+    if not paths:
+        print("No shard reports found")
+        return 1
+    merged = merge_reports(paths, args.screenshots)
+    history.record_report(merged)
+    history.save()
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(merged, f, indent=2)
+    summary = merged["summary"]
+    print(f"Merged {len(paths)} shard reports: {len(merged['results'])} tests, "
+          f"slowest shard {merged['wall_time']}s, shard times {merged['shard_wall_times']}")
+    print(f"Durations recorded: {history.path}")
+    print(f"Merged report saved: {args.out}")
+    return 0 if not (summary["fail"] or summary["error"]) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+import json
+import uuid
+from urllib.parse import urlparse
+
+# Testler arası temizlikte silinen veri tipleri (Storage.clearDataForOrigin)
+CLEARED_STORAGE_TYPES = "cookies,local_storage,indexeddb,cache_storage,service_workers,websql,file_systems"
+
+# sessionStorage DevTools'tan origin bazında silinemiyor. Her test yeni bir nesil değeriyle kurulan bu script,
+# sessionStorage'daki nesil farklıysa (yani bu testte origin'in ilk dokümanında) sessionStorage'ı siliyor.
+# İşaret sitenin localStorage'ına değil, zaten silinen sessionStorage'a yazılıyor.
+SESSION_RESET_SCRIPT = """
+(function (generation) {
+    try {
+        if (sessionStorage.getItem('__pomGeneration') !== generation) {
+            sessionStorage.clear();
+            sessionStorage.setItem('__pomGeneration', generation);
+        }
+    } catch (e) {}
+})(%s);
+"""
+
+# Test başına localStorage/sessionStorage tohumlama; test boyunca sadece ilk dokümanda yazılıyor
+SEED_STORAGE_SCRIPT = """
+(function (origin, local, session) {
+    try {
+        if (origin && location.origin !== origin) return;
+        if (sessionStorage.getItem('__pomSeeded')) return;
+        Object.keys(local).forEach(function (key) { localStorage.setItem(key, local[key]); });
+        Object.keys(session).forEach(function (key) { sessionStorage.setItem(key, session[key]); });
+        sessionStorage.setItem('__pomSeeded', '1');
+    } catch (e) {}
+})(%s, %s, %s);
+"""
+
+
+def origin_of(url):
+    parts = urlparse(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class StartState:
+    # Testin başlarken ihtiyaç duyduğu tarayıcı durumu: cookie'ler ve storage içeriği.
+    # Sayfa yüklenmeden önce CDP ile kuruluyor, böylece ayrı bir navigasyon gerekmiyor.
+
+    def __init__(self, cookies=None, local_storage=None, session_storage=None):
+        # cookies: {"ad": "değer"} ya da Network.setCookies formatında dict listesi
+        if isinstance(cookies, dict):
+            cookies = [{"name": name, "value": value} for name, value in cookies.items()]
+        self.cookies = cookies or []
+        self.local_storage = local_storage or {}
+        self.session_storage = session_storage or {}
+
+    def merged(self, other):
+        # Sınıf seviyesindeki durumun üzerine test seviyesindekini ekliyorum
+        if other is None:
+            return self
+        return StartState(self.cookies + other.cookies,
+                          dict(self.local_storage, **other.local_storage),
+                          dict(self.session_storage, **other.session_storage))
+
+    def apply(self, driver, base_url):
+        # Cookie'ler tek çağrıda; storage için yeni dokümanlarda çalışacak bir script. Dönüş değeri script id'si.
+        if self.cookies:
+            cookies = [dict({"url": base_url}, **cookie) if "domain" not in cookie else cookie
+                       for cookie in self.cookies]
+            driver.execute_cdp_cmd("Network.setCookies", {"cookies": cookies})
+        if self.local_storage or self.session_storage:
+            source = SEED_STORAGE_SCRIPT % (json.dumps(origin_of(base_url)), json.dumps(self.local_storage),
+                                            json.dumps(self.session_storage))
+            return driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})["identifier"]
+        return None
+
+
+def install_session_reset(driver):
+    # Test başına; önceki testin script'ini yeni nesil değeriyle değiştiriyorum
+    previous = getattr(driver, "_session_reset_script", None)
+    if previous is not None:
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": previous})
+    source = SESSION_RESET_SCRIPT % json.dumps(uuid.uuid4().hex)
+    driver._session_reset_script = driver.execute_cdp_cmd(
+        "Page.addScriptToEvaluateOnNewDocument", {"source": source})["identifier"]
+
+
+def close_extra_windows(driver, keep_handle):
+    # Testin açtığı pencereleri (ör. View Role'ün açtığı Lever tab'ı) kapatıp testin penceresine dönüyorum.
+    # Tab modunda sadece bu tab'ın pencereleri (owned_handles) kapatılıyor, diğer tab'lara dokunulmuyor.
+    handles = getattr(driver, "owned_handles", None)
+    handles = set(handles) if handles is not None else set(driver.window_handles)
+    for handle in handles - {keep_handle}:
+        try:
+            driver.switch_to.window(handle)
+            driver.close()
+        except Exception as e:
+            print(f"Error closing window {handle}: {e}")
+    driver.switch_to.window(keep_handle)
+
+
+def visited_origins(network_log, base_url, current_url=None):
+    # Test boyunca doküman yüklenen origin'ler (network log'tan, ekstra round trip olmadan).
+    # Network log kapalıysa en azından base URL ve testin bittiği sayfanın origin'i temizleniyor.
+    origins = {origin_of(base_url)}
+    if current_url and current_url.startswith("http"):
+        origins.add(origin_of(current_url))
+    for request in network_log.requests().values():
+        if request.get("type") == "Document" and request.get("url", "").startswith("http"):
+            origins.add(origin_of(request["url"]))
+    return origins
+
+
+def reset_state(driver, origins, seed_script_id=None):
+    # Origin başına tek DevTools çağrısıyla cookie/localStorage/IndexedDB/cache temizliği
+    if seed_script_id is not None:
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": seed_script_id})
+    for origin in sorted(origins):
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin",
+                               {"origin": origin, "storageTypes": CLEARED_STORAGE_TYPES})
+
+
+def start_url(path):
+    # Testin başlayacağı sayfa (base URL'e göre); None verilirse setUp hiç navigasyon yapmıyor
+    def decorator(test_method):
+        test_method.start_path = path
+        return test_method
+    return decorator
+
+
+def start_state(cookies=None, local_storage=None, session_storage=None):
+    # @start_state(cookies={"cookie_consent": "accepted"}, local_storage={"key": "value"})
+    def decorator(test_method):
+        test_method.start_state = StartState(cookies, local_storage, session_storage)
+        return test_method
+    return decorator
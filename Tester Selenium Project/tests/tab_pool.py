@@ -0,0 +1,143 @@
+import copy
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.switch_to import SwitchTo
+
+# Tab driver kopyalanırken taşınmaması gereken, sürücüye/pencereye özel state (cache, tracer, CDP script'leri)
+_PER_DRIVER_ATTRIBUTES = ("execute", "_element_cache", "_command_tracer", "_session_reset_script",
+                          "_performance_domain_enabled", "_fixture_recorder", "_reload_required")
+
+
+class TabPool:
+    # Tek Chrome oturumunda birden fazla tab açıp her birine ayrı bir driver nesnesi veriyorum.
+    # WebDriver oturumu aynı anda tek pencereye komut gönderebildiği için komutlar kilitle sıraya giriyor
+    # ve her komuttan önce gerekirse o tab'ın penceresine geçiliyor. Beklemeler (polling arası) paralel ilerliyor.
+
+    def __init__(self, driver, isolated=True):
+        self.driver = driver
+        self.isolated = isolated
+        self.lock = threading.RLock()
+        self.home_handle = driver.current_window_handle
+        self.active_handle = self.home_handle
+        self.tabs = []
+        self.contexts = []
+        self.switches = 0
+
+    def _raw_execute(self, command, params=None):
+        # Driver'ın kendi execute'u (cache/tracer sarmalayıcıları dahil)
+        return self.driver.execute(command, params)
+
+    def _create_window(self):
+        # Mümkünse her tab'ı ayrı bir browser context'te (ayrı cookie/storage) açıyorum
+        if self.isolated:
+            try:
+                context_id = self.driver.execute_cdp_cmd(
+                    "Target.createBrowserContext", {"disposeOnDetach": False})["browserContextId"]
+                target_id = self.driver.execute_cdp_cmd(
+                    "Target.createTarget", {"url": "about:blank", "browserContextId": context_id})["targetId"]
+                handle = next((handle for handle in self.driver.window_handles
+                               if handle.upper().endswith(target_id.upper())), None)
+                if handle is not None:
+                    self.contexts.append(context_id)
+                    return handle
+                print("Isolated browser context is not visible to chromedriver, falling back to plain tabs")
+            except Exception as e:
+                print(f"Error creating isolated browser context, falling back to plain tabs: {e}")
+            self.isolated = False
+        return self._raw_execute(Command.NEW_WINDOW, {"type": "tab"})["value"]["handle"]
+
+    def open_tab(self):
+        with self.lock:
+            handle = self._create_window()
+            tab = self._tab_driver(handle)
+            self.tabs.append(tab)
+            return tab
+
+    def _tab_driver(self, handle):
+        # Aynı oturumu (session_id, command_executor) paylaşan ama kendi penceresine bağlı bir driver kopyası
+        tab = copy.copy(self.driver)
+        for attribute in _PER_DRIVER_ATTRIBUTES:
+            tab.__dict__.pop(attribute, None)
+        tab._switch_to = SwitchTo(tab)
+        tab.tab_handle = handle
+        tab.home_handle = handle
+        tab.owned_handles = {handle}
+        raw_execute = type(tab).execute.__get__(tab)
+        pool = self
+
+        def execute(driver_command, params=None):
+            with pool.lock:
+                if driver_command != Command.SWITCH_TO_WINDOW and pool.active_handle != tab.tab_handle:
+                    raw_execute(Command.SWITCH_TO_WINDOW, {"handle": tab.tab_handle})
+                    pool.active_handle = tab.tab_handle
+                    pool.switches += 1
+                response = raw_execute(driver_command, params)
+                # Tab kendi açtığı pencereye geçerse bundan sonraki komutları o pencereye yönlendiriyorum
+                if driver_command == Command.SWITCH_TO_WINDOW:
+                    tab.tab_handle = params["handle"]
+                    tab.owned_handles.add(tab.tab_handle)
+                    pool.active_handle = tab.tab_handle
+                elif driver_command == Command.CLOSE:
+                    tab.owned_handles.discard(tab.tab_handle)
+                    pool.active_handle = None
+                return response
+
+        tab.execute = execute
+        # Havuzdaki tab'ı test kapatmasın; quit sadece tab'ı sıfırlıyor
+        tab.quit = lambda: self.reset(tab)
+        return tab
+
+    def reset(self, tab):
+        # Testin açtığı ek pencereleri kapatıp tab'ı kendi ana penceresine döndürüyorum
+        with self.lock:
+            for handle in list(tab.owned_handles - {tab.home_handle}):
+                try:
+                    self.driver.execute(Command.SWITCH_TO_WINDOW, {"handle": handle})
+                    self.driver.execute(Command.CLOSE)
+                except Exception as e:
+                    print(f"Error closing tab window {handle}: {e}")
+            tab.owned_handles = {tab.home_handle}
+            tab.tab_handle = tab.home_handle
+            self.active_handle = None
+
+    def map(self, function, items):
+        # Bağımsız adımları (ör. farklı filtre kontrolleri) her biri kendi tab'ında olacak şekilde paralel çalıştırıyorum
+        items = list(items)
+        while len(self.tabs) < len(items):
+            self.open_tab()
+        idle = queue.Queue()
+        for tab in self.tabs:
+            idle.put(tab)
+
+        def run(item):
+            tab = idle.get()
+            try:
+                return function(tab, item)
+            finally:
+                self.reset(tab)
+                idle.put(tab)
+
+        with ThreadPoolExecutor(max_workers=len(self.tabs), thread_name_prefix="tab") as executor:
+            return list(executor.map(run, items))
+
+    def close(self):
+        with self.lock:
+            for tab in self.tabs:
+                self.reset(tab)
+                try:
+                    self.driver.execute(Command.SWITCH_TO_WINDOW, {"handle": tab.home_handle})
+                    self.driver.execute(Command.CLOSE)
+                except Exception as e:
+                    print(f"Error closing tab {tab.home_handle}: {e}")
+            for context_id in self.contexts:
+                try:
+                    self.driver.execute_cdp_cmd("Target.disposeBrowserContext", {"browserContextId": context_id})
+                except Exception as e:
+                    print(f"Error disposing browser context: {e}")
+            self.tabs = []
+            self.contexts = []
+            self.driver.switch_to.window(self.home_handle)
+            self.active_handle = self.home_handle
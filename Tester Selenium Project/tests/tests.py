@@ -1,14 +1,28 @@
 import unittest
+import json
 import sys
 import os
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import time
 from pages.home_page import HomePage
 from pages.careers_page import CareersPage
+from tests.artifacts import get_artifact_pipeline
 from tests.base_test import BaseTest
+from tests.fixture_server import FixtureArchive, fixture_mode
+from tests.impact import ImpactRecorder, build_index, parse_diff, select_tests, stale_reason
+from tests.link_checker import VIEW_ROLE_CHECK, LinkChecker, failed_links, print_results
+from tests.start_state import start_url
+from pages.base_page import BasePage, locator_to_query
+from pages.job_table import JobRecord, JobTable
+from pages.timeout_budget import TimeoutBudget, TimeoutBudgetExceeded, activate_budget, deactivate_budget, time_budget
+from selenium.webdriver.common.by import By
 import time
 
 class TestInsiderWebsite(BaseTest):
     
+    @time_budget(20)
     def test_homepage_is_opened(self):
         try:
             # HomePage objesi oluşturuyorum (POM)
@@ -18,6 +32,9 @@ class TestInsiderWebsite(BaseTest):
             self.assertTrue(home_page.is_homepage_loaded(), 
                           "Homepage should be loaded properly")
             
+            # Ana sayfanın hız metriklerini bütçeyle karşılaştırıyorum (aşım testi düşürmüyor)
+            self.record_performance(home_page, "home")
+            
             # Sayfa başlığını doğruluyorum
             title = home_page.get_page_title()
             self.assertIn("Insider", title, 
@@ -25,7 +42,7 @@ class TestInsiderWebsite(BaseTest):
             
             # Doğru URL'de olup olmadığımızı kontrol ediyorum
             current_url = self.driver.current_url
-            self.assertIn("useinsider.com", current_url.lower(), 
+            self.assertIn(self.base_host, current_url.lower(), 
                          "Should be on Insider website")
             
             print("Homepage test completed successfully!")
@@ -35,6 +52,7 @@ class TestInsiderWebsite(BaseTest):
             self.take_screenshot("homepage_test_failure")
             raise e
     
+    @time_budget(30)
     def test_company_menu_navigation_and_careers_blocks(self):
         try:
             # Page object'leri oluşturuyorum (POM)
@@ -46,10 +64,12 @@ class TestInsiderWebsite(BaseTest):
                           "Homepage should be loaded properly")
             
             # Navigation bar'daki "Company" menüsüne tıklıyorum
+            self.mark_step("company menu click")
             self.assertTrue(home_page.click_company_menu(), 
                           "Should be able to click Company menu")
             
             # "Careers" linkine tıklıyorum
+            self.mark_step("careers navigation")
             self.assertTrue(home_page.click_careers_link(), 
                           "Should be able to click Careers link")
             
@@ -58,22 +78,24 @@ class TestInsiderWebsite(BaseTest):
                          "Should be redirected to careers page")
             
             # Careers sayfası bloklarının olup olmadığını kontrol ediyorum
+            self.mark_step("careers blocks check")
             self.assertTrue(careers_page.verify_careers_page_blocks(), 
                           "Careers page blocks should be present")
+            self.record_performance(careers_page, "careers")
             
         except Exception as e:
             # Hata durumunda screenshot alıyorum (gereksinim)
             self.take_screenshot("company_menu_careers_test_failure")
             raise e
     
+    # Ana sayfayı yüklemeden QA careers sayfasından başlıyorum
+    @start_url("careers/quality-assurance/")
+    @time_budget(60)
     def test_qa_jobs_navigation_and_filtering(self):
         try:
             # Page object'leri oluşturuyorum
             careers_page = CareersPage(self.driver)
             
-            # QA careers sayfasına direkt gidiyorum
-            self.driver.get("https://useinsider.com/careers/quality-assurance/")
-            
             # Doğru sayfada olup olmadığımızı kontrol ediyorum
             current_url = self.driver.current_url
             self.assertIn("quality-assurance", current_url.lower(), 
@@ -84,17 +106,21 @@ class TestInsiderWebsite(BaseTest):
                            "Should be able to click See all QA jobs")
             
             # Yeni sayfanın yüklenmesini ve işlerin yüklenmesini bekliyorum
-            time.sleep(3)  # Sayfa navigasyonu için bekliyorum
+            careers_page.wait_for_url_matches("open-positions")  # Sayfa navigasyonu için bekliyorum
             self.assertTrue(careers_page.wait_for_jobs_to_load(), 
                            "Jobs should load successfully on the new page")
+            self.record_performance(careers_page, "qa_jobs")
             
             # İşleri lokasyon ile filtreliyorum: "Istanbul, Turkiye"
+            self.mark_step("filter application")
             try:
                 location_options = careers_page.filter_by_location("Istanbul, Turkiye")
                 if location_options and "Istanbul, Turkiye" in location_options:
                     print("Successfully filtered by Istanbul, Turkiye")
                 else:
                     print("Location filter not available or failed")
+            except TimeoutBudgetExceeded:
+                raise
             except Exception as e:
                 print(f"Location filter not available: {e}")
                 location_options = []
@@ -106,6 +132,8 @@ class TestInsiderWebsite(BaseTest):
                     print("Successfully filtered by Quality Assurance")
                 else:
                     print("Department filter not available or failed")
+            except TimeoutBudgetExceeded:
+                raise
             except Exception as e:
                 print(f"Department filter not available: {e}")
                 department_options = []
@@ -125,15 +153,35 @@ class TestInsiderWebsite(BaseTest):
             
             print("QA jobs navigation and filtering test completed successfully!")
             
-            time.sleep(5) #iş listesinin güncellenmesini bekliyorum
-            self.assertTrue(careers_page.click_view_role_button(), 
-                          "Should be able to click View Role button.")
+            careers_page.wait_for_job_list_update() #iş listesinin güncellenmesini bekliyorum
+            
+            # Replay modunda Lever'a ağ üzerinden gidilemiyor, orada sadece tarayıcı kontrolü yapıyorum
+            check_mode = "browser" if fixture_mode() == "replay" else VIEW_ROLE_CHECK
+            
+            if check_mode in ("http", "both"):
+                # Tüm View Role linklerini tarayıcı açmadan, eşzamanlı olarak çözüyorum
+                self.mark_step("view role links check")
+                links = careers_page.get_view_role_links()
+                self.assertTrue(links, "View Role links should be present")
+                checker = LinkChecker()
+                try:
+                    results = checker.check(links)
+                finally:
+                    checker.close()
+                print_results(results)
+                failed = failed_links(results, "lever")
+                self.assertFalse(failed, f"All View Role links should resolve to lever: {failed}")
+            
+            if check_mode in ("browser", "both"):
+                # İlk butona tıklayıp tarayıcıda yönlendirmeyi kontrol eden smoke test
+                self.mark_step("view role redirect")
+                self.assertTrue(careers_page.click_view_role_button(), 
+                              "Should be able to click View Role button.")
 
 
-            time.sleep(8) #yönlendirme sayfasının yüklenmesini bekliyorum
-            self.assertTrue(careers_page.verify_redirect_to_lever(),
-                            "Should be redirected to lever page.")
-            time.sleep(2)
+                # verify_redirect_to_lever yönlendirme sayfası gelene kadar kendisi bekliyor
+                self.assertTrue(careers_page.verify_redirect_to_lever(),
+                                "Should be redirected to lever page.")
             
 
         except Exception as e:
@@ -141,9 +189,275 @@ class TestInsiderWebsite(BaseTest):
             self.take_screenshot("qa_jobs_filtering_test_failure")
             raise e
 
+
+class RedirectServer:
+    # Testler için yerel yönlendirme sunucusu: /go/<n>/<hedef yol> n kez kendine, sonra hedef yola yönlendiriyor.
+    # /status/<kod> verilen kodla, diğer yollar 200 ile cevap veriyor.
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def _handler(self):
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _respond(self, include_body):
+                parts = self.path.lstrip("/").split("/")
+                if parts[0] == "go" and len(parts) >= 3:
+                    hops = int(parts[1])
+                    target = "/" + "/".join(parts[2:]) if hops <= 1 else f"/go/{hops - 1}/{'/'.join(parts[2:])}"
+                    self._send(302, b"", {"Location": target}, include_body)
+                elif parts[0] == "absolute":
+                    self._send(301, b"", {"Location": "http://" + "/".join(parts[1:])}, include_body)
+                elif parts[0] == "status" and len(parts) > 1:
+                    self._send(int(parts[1]), b"status", {}, include_body)
+                else:
+                    self._send(200, b"ok", {"Content-Type": "text/plain"}, include_body)
+
+            def _send(self, status, body, headers, include_body):
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if include_body:
+                    self.wfile.write(body)
+
+            def do_GET(self):
+                self._respond(True)
+
+            def do_HEAD(self):
+                self._respond(False)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+class TestLinkChecker(unittest.TestCase):
+    # Link kontrolcüsünü yerel yönlendirme sunucusuna karşı deniyorum (tarayıcı gerekmiyor)
+    
+    @classmethod
+    def setUpClass(cls):
+        cls.server = RedirectServer().start()
+        
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+    
+    def test_redirect_chains_resolve_concurrently(self):
+        links = [self.server.url + f"go/{hops}/jobs/{index}" for index in range(20) for hops in (1, 3)]
+        checker = LinkChecker(concurrency=8, per_host=4, timeout=5)
+        try:
+            results = checker.check(links)
+        finally:
+            checker.close()
+        
+        self.assertEqual(len(results), len(links))
+        self.assertEqual(failed_links(results, "127.0.0.1"), [])
+        self.assertTrue(all(result["status"] == 200 for result in results))
+        self.assertEqual(len(results[1]["redirects"]), 3)
+        self.assertTrue(results[1]["final_url"].endswith("/jobs/0"))
+        # Keep-alive bağlantıları tekrar kullanılıyor, istek başına yeni bağlantı açılmıyor
+        self.assertLessEqual(checker.pool.opened, 4)
+    
+    def test_reports_final_host_and_errors(self):
+        port = self.server.httpd.server_address[1]
+        links = [self.server.url + f"absolute/localhost:{port}/jobs",
+                 self.server.url + "status/404",
+                 "http://127.0.0.1:9/unreachable"]
+        checker = LinkChecker(timeout=2)
+        try:
+            moved, missing, unreachable = checker.check(links)
+        finally:
+            checker.close()
+        
+        self.assertEqual(moved["final_host"], "localhost")
+        self.assertEqual(moved["status"], 200)
+        self.assertEqual(missing["status"], 404)
+        self.assertIsNotNone(unreachable["error"])
+        self.assertEqual(failed_links([moved, missing, unreachable], "localhost"), [missing, unreachable])
+
+
+class TestLocatorToQuery(unittest.TestCase):
+    # Toplu sorgular (is_element_present dahil) tüm Selenium By tiplerini kabul etmeli
+    
+    def test_all_locator_types_are_translated(self):
+        self.assertEqual(locator_to_query((By.ID, 'job"list')), ("css", '[id="job\\"list"]'))
+        self.assertEqual(locator_to_query((By.CLASS_NAME, "position")), ("css", '[class~="position"]'))
+        self.assertEqual(locator_to_query((By.LINK_TEXT, " View  Role ")),
+                         ("xpath", "//a[normalize-space(.)='View Role']"))
+        self.assertEqual(locator_to_query((By.PARTIAL_LINK_TEXT, "Insider's")),
+                         ("xpath", """//a[contains(normalize-space(.), "Insider's")]"""))
+        for by in (By.NAME, By.TAG_NAME, By.XPATH, By.CSS_SELECTOR):
+            self.assertIn(locator_to_query((by, "a"))[0], ("css", "xpath"))
+
+
+class TestTimeoutBudget(unittest.TestCase):
+    # Page object'lerin geniş except'leri bütçe aşımını yutmamalı (tarayıcı gerekmiyor)
+    
+    def test_page_methods_propagate_swallowed_overruns(self):
+        class Page(BasePage):
+            def check(self, budget):
+                try:
+                    budget.timeout_for(5, "Page.check")
+                    return True
+                except Exception as e:
+                    print(f"Error checking: {e}")
+                    return False
+        
+        page = object.__new__(Page)
+        budget = TimeoutBudget(60, name="enough")
+        activate_budget(budget)
+        try:
+            self.assertTrue(page.check(budget))
+            exhausted = TimeoutBudget(0, name="exhausted")
+            activate_budget(exhausted)
+            with self.assertRaises(TimeoutBudgetExceeded) as raised:
+                page.check(exhausted)
+            self.assertEqual(raised.exception.label, "Page.check")
+        finally:
+            deactivate_budget()
+
+
+class TestFixtureArchive(unittest.TestCase):
+    # Paralel record'da her worker kendi arşiv nesnesiyle aynı index'e yazıyor
+    
+    def test_concurrent_saves_merge_entries(self):
+        with tempfile.TemporaryDirectory() as path:
+            first, second = FixtureArchive(path), FixtureArchive(path)
+            first.primary_origin = "https://useinsider.com"
+            first.add("GET", "https://useinsider.com/careers/", 200, {}, b"careers")
+            second.add("GET", "https://jobs.lever.co/useinsider/1", 200, {}, b"lever")
+            first.save()
+            second.save()
+            
+            merged = FixtureArchive(path)
+            self.assertEqual(merged.primary_origin, "https://useinsider.com")
+            self.assertEqual(sorted(url for _, url in merged.entries),
+                             ["https://jobs.lever.co/useinsider/1", "https://useinsider.com/careers/"])
+            self.assertEqual(merged.body(merged.lookup("GET", "https://jobs.lever.co/useinsider/1")), b"lever")
+
+
+class TestImpactAnalysis(unittest.TestCase):
+    # Değişiklikten etkilenen test seçimini gerçek page object kaynaklarıyla deniyorum (tarayıcı gerekmiyor)
+    
+    homepage_test = "tests.tests.TestInsiderWebsite.test_homepage_is_opened"
+    company_test = "tests.tests.TestInsiderWebsite.test_company_menu_navigation_and_careers_blocks"
+    qa_test = "tests.tests.TestInsiderWebsite.test_qa_jobs_navigation_and_filtering"
+    
+    @classmethod
+    def setUpClass(cls):
+        # IMPACT_RECORD=1 koşusunda kaydedilecek çağrıların bir kısmı
+        records = {
+            cls.homepage_test: ["pages.home_page.HomePage.__init__", "pages.home_page.HomePage.is_homepage_loaded",
+                                "pages.base_page.BasePage.is_element_present"],
+            cls.company_test: ["pages.home_page.HomePage.__init__", "pages.home_page.HomePage.click_company_menu",
+                               "pages.careers_page.CareersPage.__init__",
+                               "pages.careers_page.CareersPage.verify_careers_page_blocks"],
+            cls.qa_test: ["pages.careers_page.CareersPage.__init__", "pages.careers_page.CareersPage.filter_by_location",
+                          "pages.careers_page.CareersPage._apply_filter", "pages.dropdown.Dropdown.select"],
+        }
+        cls.suite = list(records) + ["tests.tests.TestLinkChecker.test_redirect_chains_resolve_concurrently"]
+        cls.index = build_index(records, cls.suite)
+    
+    def changed(self, symbol):
+        # Sembolün ilk satırını değiştiren diff
+        entry = self.index["symbols"][symbol]
+        return {entry["file"]: {entry["start"]}}
+    
+    def test_locator_change_selects_only_tests_using_it(self):
+        selected, reason = select_tests(self.index, self.suite, self.changed("pages.home_page.HomePageLocators.company_menu"))
+        self.assertIsNone(reason)
+        self.assertEqual(selected, [self.homepage_test, self.company_test])
+        
+        # Locator Dropdown üzerinden kullanılıyor
+        selected, _ = select_tests(self.index, self.suite,
+                                   self.changed("pages.careers_page.CareersPageLocators.location_filter"))
+        self.assertEqual(selected, [self.qa_test])
+        
+        selected, _ = select_tests(self.index, self.suite, symbols=["CareersPage.verify_careers_page_blocks"])
+        self.assertEqual(selected, [self.company_test])
+    
+    def test_unused_and_ignored_changes_select_nothing(self):
+        selected, reason = select_tests(self.index, self.suite, dict(
+            self.changed("pages.careers_page.CareersPageLocators.view_role_buttons"), **{"README.md": None}))
+        self.assertIsNone(reason)
+        self.assertEqual(selected, [])
+    
+    def test_falls_back_to_full_suite(self):
+        selected, reason = select_tests(self.index, self.suite, {"tests/base_test.py": {10}})
+        self.assertEqual(selected, self.suite)
+        self.assertIn("tests/base_test.py", reason)
+        
+        _, reason = select_tests(self.index, self.suite, symbols=["HomePage.no_such_method"])
+        self.assertIn("unknown symbol", reason)
+        
+        self.assertIsNone(stale_reason(self.index))
+        stale = dict(self.index, files=dict(self.index["files"], **{"pages/home_page.py": "0" * 40}))
+        self.assertIn("pages/home_page.py", stale_reason(stale))
+        self.assertIsNotNone(stale_reason(None))
+    
+    def test_new_tests_always_run(self):
+        suite = self.suite + ["tests.tests.TestInsiderWebsite.test_new_flow"]
+        selected, _ = select_tests(self.index, suite, {"README.md": None})
+        self.assertEqual(selected, ["tests.tests.TestInsiderWebsite.test_new_flow"])
+    
+    def test_parse_diff(self):
+        changes = parse_diff("\n".join([
+            "diff --git a/pages/home_page.py b/pages/home_page.py",
+            "--- a/pages/home_page.py",
+            "+++ b/pages/home_page.py",
+            "@@ -11 +11 @@ class HomePage(BasePage):",
+            "@@ -20,0 +21,3 @@",
+            "diff --git a/pages/new_page.py b/pages/new_page.py",
+            "--- /dev/null",
+            "+++ b/pages/new_page.py",
+            "@@ -0,0 +1,5 @@",
+        ]))
+        self.assertEqual(changes, {"pages/home_page.py": {11, 20, 21}, "pages/new_page.py": None})
+    
+    def test_recorder_maps_called_code_to_symbols(self):
+        # Decorator'lı metot, comprehension ve lambda'lar tanımlandıkları sembole düşüyor
+        with tempfile.TemporaryDirectory() as path:
+            recorder = ImpactRecorder(os.path.join(path, "records.jsonl"))
+            recorder.start()
+            try:
+                table = JobTable.from_records([JobRecord("QA Engineer", "Quality Assurance", "Istanbul, Turkiye", None)])
+                table.all_locations_contain("istanbul")
+            finally:
+                symbols = recorder.stop("tests.tests.Example.test_jobs")
+            
+            self.assertEqual(symbols, ["pages.job_table.JobRecord.__init__", "pages.job_table.JobTable.__init__",
+                                       "pages.job_table.JobTable.__len__", "pages.job_table.JobTable.all_locations_contain",
+                                       "pages.job_table.JobTable.all_match", "pages.job_table.JobTable.append",
+                                       "pages.job_table.JobTable.from_records", "pages.job_table.JobTable.mismatches"])
+            with open(os.path.join(path, "records.jsonl"), encoding="utf-8") as f:
+                self.assertEqual(json.loads(f.readline()), {"test": "tests.tests.Example.test_jobs", "symbols": symbols})
+
 if __name__ == "__main__":
     # Screenshots klasörü
     os.makedirs("screenshots", exist_ok=True)
     
-    # Testleri çalıştırıyorum
-    unittest.main(verbosity=3) 
\ No newline at end of file
+    # Testleri çalıştırıyorum; arka planda yazılan hata artifact'leri bitmeden çıkmıyorum
+    try:
+        unittest.main(verbosity=3)
+    finally:
+        get_artifact_pipeline().close() 
\ No newline at end of file
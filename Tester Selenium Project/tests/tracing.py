@@ -0,0 +1,226 @@
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+
+from pages.base_page import BasePage, add_wait_listener, remove_wait_listener
+from pages.timeout_budget import BUDGET_WRAPPER_CODE
+
+# Element id'sinden hangi locator ile bulunduğunu çözebilmek için tuttuğum en fazla kayıt
+MAX_ELEMENT_LOCATORS = 5000
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+def tracing_enabled():
+    # WEBDRIVER_TRACE=1 ile açılıyor
+    return os.environ.get("WEBDRIVER_TRACE", "0") == "1"
+
+
+class CommandTracer:
+    # driver.execute'u sarıp her WebDriver komutunu (find, click, get, execute_script, screenshot)
+    # locator, süre, tekrar sayısı ve çağıran page object metoduyla kaydediyorum
+
+    _instance = None
+
+    def __init__(self):
+        self.records = []
+        self.waits = []
+        self.tests = []
+        # Tab modunda her thread kendi testini koşuyor; aktif test thread başına
+        self._local = threading.local()
+        self._element_locators = {}
+        self._origin = time.perf_counter()
+        self._users = 0
+        self._lock = threading.Lock()
+        # Tab modunda birden fazla thread aynı kayıt listesine yazıyor
+        self._records_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls):
+        # Process başına tek tracer, böylece tüm sınıflar aynı trace dosyasına yazıyor
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def install(self, driver):
+        if getattr(driver, "_command_tracer", None) is self:
+            return
+        original_execute = driver.execute
+
+        def traced_execute(driver_command, params=None):
+            started = time.perf_counter()
+            try:
+                response = original_execute(driver_command, params)
+            except Exception:
+                self._record(driver_command, params, started, None, failed=True)
+                raise
+            self._record(driver_command, params, started, response)
+            return response
+
+        driver.execute = traced_execute
+        driver._command_tracer = self
+
+    def acquire(self):
+        # Beklemeleri ayrı span olarak görmek için BasePage'in bekleme hook'una bağlanıyorum.
+        # Test sınıfı başına acquire/release; son sınıf bitince hook kaldırılıyor (sınıf patch'lenmiyor).
+        with self._lock:
+            self._users += 1
+            if self._users == 1:
+                add_wait_listener(self._on_wait)
+
+    def release(self):
+        with self._lock:
+            self._users = max(0, self._users - 1)
+            if self._users == 0:
+                remove_wait_listener(self._on_wait)
+
+    def _on_wait(self, page, message, started, duration, caller_frame):
+        self.waits.append({
+            "name": message or "wait",
+            "caller": _page_object_caller(caller_frame),
+            "test": self.current_test,
+            "start": started,
+            "duration": duration,
+            "tid": threading.get_ident(),
+        })
+
+    @property
+    def current_test(self):
+        return getattr(self._local, "test", None)
+
+    def start_test(self, name):
+        self._local.test = name
+        self._local.started = time.perf_counter()
+
+    def stop_test(self):
+        if self.current_test is not None:
+            self.tests.append({
+                "name": self.current_test,
+                "start": self._local.started,
+                "duration": time.perf_counter() - self._local.started,
+                "tid": threading.get_ident(),
+            })
+        self._local.test = None
+
+    def _record(self, command, params, started, response, failed=False):
+        duration = time.perf_counter() - started
+        params = params or {}
+        locator = self._locator_for(params)
+        caller = _page_object_caller(sys._getframe(2))
+
+        with self._records_lock:
+            if response and command in ("findElement", "findElements", "findChildElement", "findChildElements"):
+                self._remember_elements(response.get("value"), locator)
+
+            # Aynı yerden aynı komutun art arda tekrarı (WebDriverWait sorgulaması) tek kayıt olarak birleşiyor
+            last = self.records[-1] if self.records else None
+            if (last is not None and last["command"] == command and last["locator"] == locator
+                    and last["caller"] == caller and last["test"] == self.current_test
+                    and last["tid"] == threading.get_ident()):
+                last["retries"] += 1
+                last["duration"] += duration
+                last["end"] = started + duration
+                last["failed"] = failed
+                return
+
+            self.records.append({
+                "command": command,
+                "locator": locator,
+                "caller": caller,
+                "test": self.current_test,
+                "start": started,
+                "end": started + duration,
+                "duration": duration,
+                "retries": 0,
+                "failed": failed,
+                "tid": threading.get_ident(),
+            })
+
+    def _locator_for(self, params):
+        if "using" in params:
+            return f"{params['using']}={params['value']}"
+        if "url" in params:
+            return params["url"]
+        element_id = params.get("id") or params.get("elementId")
+        if element_id:
+            return self._element_locators.get(element_id, "element")
+        return None
+
+    def _remember_elements(self, value, locator):
+        elements = value if isinstance(value, list) else [value]
+        for element in elements:
+            if isinstance(element, dict) and ELEMENT_KEY in element:
+                if len(self._element_locators) >= MAX_ELEMENT_LOCATORS:
+                    self._element_locators.clear()
+                self._element_locators[element[ELEMENT_KEY]] = locator
+
+    def summary(self, test_name, limit=10):
+        # Testin en yavaş page object metotlarını tablo olarak döndürüyorum
+        methods = {}
+        for record in self.records:
+            if record["test"] != test_name:
+                continue
+            stats = methods.setdefault(record["caller"], {"time": 0.0, "commands": 0, "retries": 0})
+            stats["time"] += record["duration"]
+            stats["commands"] += 1 + record["retries"]
+            stats["retries"] += record["retries"]
+        for wait in self.waits:
+            if wait["test"] == test_name:
+                stats = methods.setdefault(wait["caller"], {"time": 0.0, "commands": 0, "retries": 0})
+                stats["wait"] = stats.get("wait", 0.0) + wait["duration"]
+
+        # Bekleme süresi komutları da içerdiği için büyük olanına göre sıralıyorum
+        lines = [f"Slowest page-object methods in {test_name}:",
+                 f"  {'method':<55} {'cmd time':>9} {'wait time':>9} {'cmds':>5} {'retries':>7}"]
+        ranked = sorted(methods.items(), key=lambda item: max(item[1]["time"], item[1].get("wait", 0.0)),
+                        reverse=True)[:limit]
+        for caller, stats in ranked:
+            lines.append(f"  {caller:<55} {stats['time']:8.3f}s {stats.get('wait', 0.0):8.3f}s "
+                         f"{stats['commands']:5d} {stats['retries']:7d}")
+        return "\n".join(lines)
+
+    def write_chrome_trace(self, path):
+        # chrome://tracing veya Perfetto'da açılabilen "Trace Event" formatı
+        pid = os.getpid()
+
+        def us(seconds):
+            return int((seconds - self._origin) * 1_000_000)
+
+        events = []
+        for test in self.tests:
+            events.append({"name": test["name"], "cat": "test", "ph": "X", "pid": pid, "tid": test["tid"],
+                           "ts": us(test["start"]), "dur": int(test["duration"] * 1_000_000)})
+        for wait in self.waits:
+            events.append({"name": wait["name"], "cat": "wait", "ph": "X", "pid": pid, "tid": wait["tid"],
+                           "ts": us(wait["start"]), "dur": int(wait["duration"] * 1_000_000),
+                           "args": {"caller": wait["caller"], "test": wait["test"]}})
+        for record in self.records:
+            events.append({"name": record["command"], "cat": "webdriver", "ph": "X", "pid": pid,
+                           "tid": record["tid"], "ts": us(record["start"]),
+                           "dur": int((record["end"] - record["start"]) * 1_000_000),
+                           "args": {"locator": record["locator"], "caller": record["caller"],
+                                    "test": record["test"], "retries": record["retries"],
+                                    "command_time_ms": round(record["duration"] * 1000, 3),
+                                    "failed": record["failed"]}})
+
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+        return path
+
+
+def _page_object_caller(frame):
+    # Komutu tetikleyen en dıştaki page object metodunu buluyorum (ör. CareersPage.filter_by_location).
+    # Page object yoksa test metodunu döndürüyorum.
+    page_caller = None
+    while frame is not None:
+        owner = frame.f_locals.get("self")
+        if isinstance(owner, BasePage) and frame.f_code is not BUDGET_WRAPPER_CODE:
+            page_caller = f"{type(owner).__name__}.{frame.f_code.co_name}"
+        elif isinstance(owner, unittest.TestCase):
+            return page_caller or f"{type(owner).__name__}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return page_caller or "-"